@@ -0,0 +1,9 @@
+"""
+Jugadores automáticos y herramientas de simulación sobre el motor de core/.
+"""
+
+from .policies import Policy, RandomPolicy, GreedyPolicy, make_policy
+
+__all__ = [
+    "Policy", "RandomPolicy", "GreedyPolicy", "make_policy",
+]
@@ -0,0 +1,276 @@
+"""
+Base de datos de bear-off de un solo lado (one-sided).
+
+Cuando todas las fichas de un color están en su home la partida es una carrera
+cerrada: alcanza con saber, para cada distribución de hasta 15 fichas en los 6
+puntos del home, cuántas tiradas faltan para sacarlas todas jugando lo mejor
+posible. Se guarda:
+- el número esperado de tiradas (float32)
+- la distribución de probabilidad de la cantidad de tiradas (MAX_ROLLS x uint16)
+
+Las posiciones se indexan con el sistema combinatorio (sin tabla de búsqueda):
+la tupla (fichas a distancia 1..6 del borde) se convierte en un índice 0..N-1.
+El archivo se abre con mmap, así que cada consulta es O(1) y no hay que
+construir nada por proceso.
+
+Las reglas de movimiento replican las del motor (core/game.py y core/plays.py),
+incluido el bear-off con dado mayor.
+
+Generar la base (una sola vez):
+    python -m ai.bearoff [--checkers 15] [--out ruta]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.slots import SLOT_BAR
+
+HOME_POINTS = 6
+MAX_CHECKERS = 15
+MAX_ROLLS = 32
+MAGIC = b"BGBO"
+VERSION = 1
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "data", "bearoff15.bin")
+
+_HEADER = struct.Struct("<4sHHI")          # magic, versión, max fichas, posiciones
+_RECORD = struct.Struct(f"<f{MAX_ROLLS}H")  # esperado + distribución
+_SCALE = 65535
+
+# 21 tiradas distintas con su probabilidad (dobles 1/36, resto 2/36)
+_ROLLS = [
+    ((a,) * 4 if a == b else (a, b), (1 if a == b else 2) / 36)
+    for a in range(1, 7) for b in range(a, 7)
+]
+
+Home = Tuple[int, ...]  # fichas a distancia 1..6 del borde
+
+
+# ---------- indexado ----------
+def n_positions(max_checkers: int = MAX_CHECKERS) -> int:
+    """Cantidad de distribuciones de 0..max_checkers fichas en 6 puntos."""
+    return comb(max_checkers + HOME_POINTS, HOME_POINTS)
+
+
+def position_index(home: Sequence[int]) -> int:
+    """Índice combinatorio de una distribución (no depende de max_checkers)."""
+    index, acc = 0, 0
+    for i, n in enumerate(home):
+        acc += n
+        index += comb(acc + i, i + 1)
+    return index
+
+
+def home_of(cells: Sequence[int], color: str) -> Optional[Home]:
+    """
+    Distribución del home de 'color' en una posición plana (core/slots.py), o
+    None si tiene fichas en la barra o fuera del home.
+    """
+    if cells[SLOT_BAR[color]]:
+        return None
+    if color == "blanco":
+        if any(v > 0 for v in cells[:18]):
+            return None
+        return tuple(max(cells[24 - p], 0) for p in range(1, 7))
+    if any(v < 0 for v in cells[6:24]):
+        return None
+    return tuple(max(-cells[p - 1], 0) for p in range(1, 7))
+
+
+# ---------- generación ----------
+def _step(home: Home, die: int) -> List[Home]:
+    """Posiciones alcanzables usando un dado (mismas reglas que el motor)."""
+    out = []
+    nearest = next((p for p in range(1, 7) if home[p - 1]), None)
+    for p in range(1, 7):
+        if not home[p - 1]:
+            continue
+        if die < p:
+            dest = p - die
+        elif die == p or p == nearest:
+            dest = 0  # retirada (con dado mayor sólo la ficha más cercana al borde)
+        else:
+            continue
+        nxt = list(home)
+        nxt[p - 1] -= 1
+        if dest:
+            nxt[dest - 1] += 1
+        out.append(tuple(nxt))
+    return out
+
+
+def _results(home: Home, dice: Tuple[int, ...], memo: Optional[dict] = None) -> set:
+    """
+    Posiciones finales tras jugar toda la tirada (en cualquier orden).
+    memo guarda los pasos de un dado ya calculados (build() reusa uno solo).
+    """
+    memo = {} if memo is None else memo
+    orders = [dice] if dice[0] == dice[-1] else [dice, dice[::-1]]
+    finals = set()
+    for order in orders:
+        layer = {home}
+        for d in order:
+            nxt = set()
+            for h in layer:
+                key = (h, d)
+                if key not in memo:
+                    memo[key] = _step(h, d) if any(h) else [h]
+                nxt.update(memo[key])
+            layer = nxt
+        finals.update(layer)
+    return finals
+
+
+def _all_homes(max_checkers: int) -> List[Home]:
+    homes: List[Home] = []
+
+    def rec(prefix: List[int], left: int) -> None:
+        if len(prefix) == HOME_POINTS:
+            homes.append(tuple(prefix))
+            return
+        for n in range(left + 1):
+            rec(prefix + [n], left - n)
+
+    rec([], max_checkers)
+    return homes
+
+
+def build(max_checkers: int = MAX_CHECKERS) -> Tuple[List[float], List[List[float]]]:
+    """
+    Calcula (esperado, distribución) para todas las posiciones con hasta
+    max_checkers fichas, ordenadas por índice. La jugada elegida en cada tirada
+    es la que minimiza las tiradas esperadas.
+    """
+    total = n_positions(max_checkers)
+    expected: List[float] = [0.0] * total
+    dist: List[List[float]] = [[0.0] * MAX_ROLLS for _ in range(total)]
+    dist[0][0] = 1.0  # sin fichas: ya terminó
+
+    pips = lambda h: sum((p + 1) * n for p, n in enumerate(h))
+    homes = sorted(_all_homes(max_checkers), key=pips)
+    index = {h: position_index(h) for h in homes}
+    memo: dict = {}
+    for home in homes:
+        idx = index[home]
+        if idx == 0:
+            continue
+        e, d = 1.0, [0.0] * MAX_ROLLS
+        for dice, w in _ROLLS:
+            best = min((index[h] for h in _results(home, dice, memo)), key=expected.__getitem__)
+            e += w * expected[best]
+            src = dist[best]
+            for k in range(MAX_ROLLS - 1):
+                d[k + 1] += w * src[k]
+            d[-1] += w * src[-1]
+        expected[idx] = e
+        dist[idx] = d
+    return expected, dist
+
+
+def write(path: str, max_checkers: int = MAX_CHECKERS) -> None:
+    """Genera la base y la escribe en 'path' (header + un registro por posición)."""
+    expected, dist = build(max_checkers)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, max_checkers, len(expected)))
+        for e, d in zip(expected, dist):
+            f.write(_RECORD.pack(e, *(round(p * _SCALE) for p in d)))
+
+
+# ---------- consulta ----------
+class BearoffDB:
+    """Base abierta con mmap; las consultas leen el registro directo del archivo."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"Archivo de bear-off inválido: {path}")
+        magic, version, max_checkers, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Archivo de bear-off inválido: {path}")
+        if len(self._mm) != _HEADER.size + count * _RECORD.size:
+            self._mm.close()
+            raise ValueError(f"Archivo de bear-off truncado: {path}")
+        self.path = path
+        self.max_checkers = max_checkers
+        self._count = count
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def covers(self, home: Optional[Sequence[int]]) -> bool:
+        """¿La distribución está en la base?"""
+        return home is not None and sum(home) <= self.max_checkers
+
+    def _record(self, home: Sequence[int]) -> tuple:
+        if not self.covers(home):
+            raise ValueError("Posición fuera de la base de bear-off.")
+        return _RECORD.unpack_from(self._mm, _HEADER.size + position_index(home) * _RECORD.size)
+
+    def expected_rolls(self, home: Sequence[int]) -> float:
+        """Tiradas esperadas para sacar todas las fichas."""
+        return self._record(home)[0]
+
+    def distribution(self, home: Sequence[int]) -> List[float]:
+        """P(terminar en exactamente k tiradas) para k = 0..MAX_ROLLS-1."""
+        return [n / _SCALE for n in self._record(home)[1:]]
+
+    def win_probability(self, on_roll: Sequence[int], other: Sequence[int]) -> float:
+        """Probabilidad de que gane el que está al turno (carrera pura, sin contacto)."""
+        mine, theirs = self.distribution(on_roll), self.distribution(other)
+        p, tail = 0.0, 1.0  # tail = P(el rival necesita >= k tiradas)
+        for k in range(MAX_ROLLS):
+            p += mine[k] * tail
+            tail -= theirs[k]
+        return min(max(p, 0.0), 1.0)
+
+    def race_win_probability(self, cells: Sequence[int], to_move: str) -> Optional[float]:
+        """
+        P(gana 'to_move') si ambos colores están en fase de bear-off cubierta por
+        la base; None si la posición no es de bear-off.
+        """
+        other = "negro" if to_move == "blanco" else "blanco"
+        mine, theirs = home_of(cells, to_move), home_of(cells, other)
+        if not (self.covers(mine) and self.covers(theirs)):
+            return None
+        return self.win_probability(mine, theirs)
+
+
+_default: Dict[str, Optional[BearoffDB]] = {}
+
+
+def get_default() -> Optional[BearoffDB]:
+    """Base por defecto (DEFAULT_PATH) abierta una sola vez; None si no se generó."""
+    if "db" not in _default:
+        _default["db"] = BearoffDB(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else None
+    return _default["db"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Genera la base de bear-off de un solo lado.")
+    ap.add_argument("--checkers", type=int, default=MAX_CHECKERS)
+    ap.add_argument("--out", default=DEFAULT_PATH)
+    args = ap.parse_args(argv)
+    if not 1 <= args.checkers <= MAX_CHECKERS:
+        ap.error(f"--checkers debe estar entre 1 y {MAX_CHECKERS}")
+
+    t0 = time.perf_counter()
+    write(args.out, args.checkers)
+    print(f"posiciones={n_positions(args.checkers)} archivo={args.out} "
+          f"bytes={os.path.getsize(args.out)} segundos={time.perf_counter() - t0:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Evaluación vectorizada (NumPy) de muchas posiciones a la vez.
+
+Codificación: matriz (N, 26) int8 con los 24 puntos con signo (+blanco / -negro)
+y la barra de blanco y de negro (mismo orden que core/slots.py). También se
+aceptan (N, 28): las dos columnas extra (retiradas) sólo las usa evaluate_batch().
+Todas las features por color vienen como (N, 2) con columnas [blanco, negro].
+"""
+
+from typing import Dict, Iterable, Sequence
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.slots import N_SLOTS
+
+N_ENC = 26
+
+FEATURES = ("pips", "blots", "made", "prime", "back", "outside", "bar", "contact", "race")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy no está instalado. pip install numpy")
+
+
+def encode_boards(boards: Iterable[Board]) -> "np.ndarray":
+    """
+    Apila tableros en una matriz (N, 26) int8.
+    CompactBoard se copia directo desde su buffer; el resto pasa por to_array().
+    """
+    _require_numpy()
+    raw = b"".join(
+        b.get_cells().tobytes() if isinstance(b, CompactBoard) else b.to_array().tobytes()
+        for b in boards
+    )
+    return np.frombuffer(raw, dtype=np.int8).reshape(-1, N_SLOTS)[:, :N_ENC]
+
+
+def encode_cells(positions: Sequence[Sequence[int]]) -> "np.ndarray":
+    """Apila posiciones planas (listas/arrays de 26 o 28 enteros) en (N, 26|28) int8."""
+    _require_numpy()
+    enc = np.asarray(positions, dtype=np.int8)
+    return enc.reshape(-1, enc.shape[-1])
+
+
+def batch_features(enc: "np.ndarray") -> Dict[str, "np.ndarray"]:
+    """
+    Calcula en una sola pasada:
+    - pips    (N, 2): pips para terminar (barra = 25)
+    - blots   (N, 2): puntos con una sola ficha
+    - made    (N, 2): puntos hechos (2+ fichas)
+    - prime   (N, 2): mayor cantidad de puntos hechos consecutivos
+    - back    (N, 2): fichas en el home rival o en la barra
+    - outside (N, 2): fichas fuera del home propio (sin contar barra)
+    - bar     (N, 2): fichas en la barra
+    - contact (N,)  : todavía se pueden cruzar/comer fichas
+    - race    (N,)  : carrera pura (not contact)
+    """
+    _require_numpy()
+    enc = np.asarray(enc, dtype=np.int8)[:, :N_ENC]
+    pts = enc[:, :24].astype(np.int16)
+    bar = enc[:, 24:26].astype(np.int16)
+    white = np.maximum(pts, 0)
+    black = np.maximum(-pts, 0)
+
+    idx = np.arange(24, dtype=np.int16)
+    pips = np.stack([
+        white @ (24 - idx) + 25 * bar[:, 0],
+        black @ (idx + 1) + 25 * bar[:, 1],
+    ], axis=1)
+
+    blots = np.stack([(pts == 1).sum(axis=1), (pts == -1).sum(axis=1)], axis=1)
+    made_w, made_b = pts >= 2, pts <= -2
+    made = np.stack([made_w.sum(axis=1), made_b.sum(axis=1)], axis=1)
+
+    n = enc.shape[0]
+    run = np.zeros((n, 2), dtype=np.int16)
+    prime = np.zeros((n, 2), dtype=np.int16)
+    made_both = np.stack([made_w, made_b], axis=2)
+    for i in range(24):
+        run = (run + 1) * made_both[:, i, :]
+        np.maximum(prime, run, out=prime)
+
+    back = np.stack([
+        white[:, 0:6].sum(axis=1) + bar[:, 0],
+        black[:, 18:24].sum(axis=1) + bar[:, 1],
+    ], axis=1)
+
+    outside = np.stack([white[:, :18].sum(axis=1), black[:, 6:].sum(axis=1)], axis=1)
+
+    has_w, has_b = white > 0, black > 0
+    w_back = np.where(has_w.any(axis=1), has_w.argmax(axis=1), 24)
+    b_back = np.where(has_b.any(axis=1), 23 - has_b[:, ::-1].argmax(axis=1), -1)
+    contact = (bar.sum(axis=1) > 0) | (w_back < b_back)
+
+    return {
+        "pips": pips, "blots": blots, "made": made, "prime": prime,
+        "back": back, "outside": outside, "bar": bar,
+        "contact": contact, "race": ~contact,
+    }
+
+
+def evaluate_batch(enc: "np.ndarray", color: str) -> "np.ndarray":
+    """
+    Puntaje heurístico (N,) desde el punto de vista de 'color', más alto = mejor.
+    Es la misma fórmula que ai.policies.evaluate(), para todo el lote de una vez;
+    las retiradas sólo cuentan si enc trae las 28 columnas.
+    """
+    enc = np.asarray(enc, dtype=np.int8)
+    f = batch_features(enc)
+    me, opp = (0, 1) if color == "blanco" else (1, 0)
+    score = (f["pips"][:, opp] - f["pips"][:, me]).astype(np.float64)
+    if enc.shape[1] >= N_SLOTS:
+        off = enc[:, N_ENC:N_SLOTS].astype(np.int16)
+        score += 3.0 * (off[:, me] - off[:, opp])
+    score += 4.0 * (f["bar"][:, opp] - f["bar"][:, me])
+    score += 2.0 * (f["outside"][:, opp] - f["outside"][:, me])
+    score -= 2.0 * (f["blots"][:, me] - f["blots"][:, opp])
+    score += 1.5 * (f["made"][:, me] - f["made"][:, opp])
+    return score
@@ -0,0 +1,94 @@
+"""
+Políticas de juego: dado un BackgammonGame con dados tirados, eligen una jugada
+completa de legal_plays(). Son el punto de extensión del simulador.
+"""
+
+import random
+from typing import Protocol, Optional
+from core.board import Board
+from core.game import BackgammonGame
+from core.plays import Play
+
+
+class Policy(Protocol):
+    def choose(self, game: BackgammonGame) -> Play: ...
+
+
+def evaluate(board: Board, color: str) -> float:
+    """
+    Heurística simple desde el punto de vista de 'color' (más alto = mejor):
+    carrera de pips, fichas retiradas, fichas fuera del home, puntos hechos,
+    blots y fichas en la barra.
+    """
+    opp = "negro" if color == "blanco" else "blanco"
+    score = float(board.pip_count(opp) - board.pip_count(color))
+    score += 3.0 * (board.get_off(color) - board.get_off(opp))
+    score += 4.0 * (board.count_on_bar(opp) - board.count_on_bar(color))
+    score += 2.0 * (board.count_outside_home(opp) - board.count_outside_home(color))
+    for i in range(24):
+        n = board.count_at(i)
+        if not n:
+            continue
+        sign = 1.0 if board.owner_at(i) == color else -1.0
+        if n == 1:
+            score -= 2.0 * sign
+        else:
+            score += 1.5 * sign
+    return score
+
+
+class RandomPolicy:
+    """Elige una jugada legal al azar."""
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng or random.Random()
+
+    def choose(self, game: BackgammonGame) -> Play:
+        plays = game.legal_plays()
+        return self._rng.choice(plays) if plays else ()
+
+
+class GreedyPolicy:
+    """Elige la jugada que deja la mejor posición según evaluate() (a 0-ply, con apply/undo)."""
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng or random.Random()
+
+    def choose(self, game: BackgammonGame) -> Play:
+        plays = game.legal_plays()
+        if not plays:
+            return ()
+        color = game.get_current_player().get_color()
+        board = game.get_board()
+        best, best_score = [], float("-inf")
+        for play in plays:
+            tokens = game.apply_play(play)
+            score = evaluate(board, color)
+            game.undo_play(tokens)
+            if score > best_score:
+                best, best_score = [play], score
+            elif score == best_score:
+                best.append(play)
+        return self._rng.choice(best)
+
+
+def _expectimax(depth: int):
+    def factory(rng: Optional[random.Random] = None) -> Policy:
+        from ai.search import ExpectimaxBot  # import diferido: search usa evaluate()
+        return ExpectimaxBot(depth)
+    return factory
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "expectimax1": _expectimax(1),
+    "expectimax2": _expectimax(2),
+}
+
+
+def make_policy(name: str, rng: Optional[random.Random] = None) -> Policy:
+    """Construye una política registrada por nombre ('random', 'greedy', ...)."""
+    if name not in POLICIES:
+        raise ValueError(f"Política desconocida: {name}. Opciones: {', '.join(POLICIES)}")
+    return POLICIES[name](rng)
@@ -0,0 +1,211 @@
+"""
+Rollouts Monte Carlo: juega una posición hasta el final muchas veces con una
+política y estima equity y porcentajes de victoria/gammon/backgammon.
+
+Reducción de varianza:
+- Primera tirada estratificada: las pruebas recorren las 36 tiradas ordenadas
+  por igual (la prueba t usa la tirada t % 36), así la suerte del primer turno
+  no mete ruido. La cantidad de pruebas se redondea a múltiplos de 36 y los
+  intervalos usan el estimador estratificado (varianza dentro de cada tirada).
+- Corte temprano: con target_ci se para apenas la mitad del intervalo de la
+  equity queda por debajo del objetivo (se revisa al completar cada vuelta).
+- Truncado: cuando las dos partes entran en la base de bear-off se usa la
+  probabilidad exacta de ganar en vez de seguir jugando (sin gammons).
+
+Uso:
+  python -m ai.rollout --trials 1296 --policy greedy --seed 1
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.game import BackgammonGame
+from core.player import Player
+from ai.bearoff import BearoffDB, get_default
+from ai.policies import Policy, make_policy
+from ai.simulate import MAX_PLIES, _game_dice, _score
+
+# las 36 primeras tiradas posibles, cada una es un estrato
+FIRST_ROLLS = [(a, b) for a in range(1, 7) for b in range(1, 7)]
+STRATA = len(FIRST_ROLLS)
+
+
+class RolloutResult(NamedTuple):
+    trials: int
+    equity: float           # puntos por partida para el color al turno (+1/+2/+3 ganando)
+    equity_ci: float        # mitad del intervalo de confianza
+    win: float
+    win_ci: float
+    gammon: float           # victorias con gammon o backgammon
+    gammon_ci: float
+    backgammon: float
+    backgammon_ci: float
+    truncated: int          # pruebas resueltas con la base de bear-off
+    stopped_early: bool
+
+
+class _Stratified:
+    """Media y varianza de una métrica con asignación pareja entre los 36 estratos."""
+
+    def __init__(self):
+        self._n = [0] * STRATA
+        self._sum = [0.0] * STRATA
+        self._sq = [0.0] * STRATA
+
+    def add(self, stratum: int, value: float) -> None:
+        self._n[stratum] += 1
+        self._sum[stratum] += value
+        self._sq[stratum] += value * value
+
+    def mean(self) -> float:
+        used = [h for h in range(STRATA) if self._n[h]]
+        return sum(self._sum[h] / self._n[h] for h in used) / len(used) if used else 0.0
+
+    def halfwidth(self, z: float) -> float:
+        """z * error estándar; infinito hasta tener 2 pruebas por estrato."""
+        var = 0.0
+        for h in range(STRATA):
+            n = self._n[h]
+            if n < 2:
+                return math.inf
+            m = self._sum[h] / n
+            s2 = max(self._sq[h] - n * m * m, 0.0) / (n - 1)
+            var += s2 / n
+        return z * math.sqrt(var) / STRATA
+
+
+class _FirstRollDice:
+    """Devuelve una tirada fija la primera vez y después usa los dados 'rest'."""
+
+    def __init__(self, first: tuple, rest):
+        self._first: Optional[tuple] = first
+        self._rest = rest
+
+    def roll(self) -> List[int]:
+        if self._first is None:
+            return self._rest.roll()
+        d1, d2 = self._first
+        self._first = None
+        return [d1] * 4 if d1 == d2 else [d1, d2]
+
+
+def play_out(cells: Sequence[int], to_move: str, policy: Policy, dice,
+             bearoff: Optional[BearoffDB] = None, max_plies: int = MAX_PLIES) -> tuple:
+    """
+    Juega una prueba desde la posición plana 'cells' con 'to_move' al turno.
+    Devuelve (equity, win, gammon, backgammon, truncada) desde el punto de
+    vista de to_move; con la base de bear-off la victoria puede ser fraccionaria.
+    """
+    board = CompactBoard.from_array(cells)
+    game = BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"), dice)
+    if to_move == "negro":
+        game.end_turn()
+
+    for _ in range(max_plies):
+        winner = game.get_winner()
+        if winner:
+            break
+        if bearoff is not None:
+            color = game.get_current_player().get_color()
+            p = bearoff.race_win_probability(board.get_cells(), color)
+            if p is not None:
+                p = p if color == to_move else 1.0 - p
+                return 2.0 * p - 1.0, p, 0.0, 0.0, True
+        game.roll_dice()
+        game.apply_play(policy.choose(game))
+    else:
+        winner = game.get_winner()
+
+    if winner is None:  # corte de seguridad: cuenta como empate
+        return 0.0, 0.5, 0.0, 0.0, False
+    gammon, backgammon = _score(game, winner)
+    points = 1 + gammon + backgammon
+    if winner == to_move:
+        return float(points), 1.0, float(gammon), float(backgammon), False
+    return -float(points), 0.0, 0.0, 0.0, False
+
+
+def rollout(board: Board, to_move: str, policy: Union[str, Policy] = "greedy",
+            trials: int = 1296, seed: int = 0, target_ci: Optional[float] = None,
+            z: float = 1.96, truncate: bool = True,
+            bearoff: Optional[BearoffDB] = None,
+            max_plies: int = MAX_PLIES) -> RolloutResult:
+    """
+    Hace rollout de (board, to_move) con 'policy' para los dos colores.
+    trials se redondea hacia arriba a un múltiplo de 36. Con truncate=True y
+    sin base explícita se usa la base de bear-off por defecto (si existe).
+    """
+    if to_move not in ("blanco", "negro"):
+        raise ValueError("to_move debe ser 'blanco' o 'negro'.")
+    if trials < 1:
+        raise ValueError("trials debe ser positivo.")
+    if truncate and bearoff is None:
+        bearoff = get_default()
+    if not truncate:
+        bearoff = None
+
+    cells = board.to_array()
+    rng = random.Random(seed)
+    if isinstance(policy, str):
+        policy = make_policy(policy, random.Random(rng.getrandbits(64)))
+
+    rounds = -(-trials // STRATA)
+    metrics = [_Stratified() for _ in range(4)]  # equity, win, gammon, backgammon
+    done = truncated = 0
+    stopped = False
+    for r in range(rounds):
+        for h, first in enumerate(FIRST_ROLLS):
+            rest = _game_dice(seed, done, random.Random(f"{seed}:{done}"))
+            dice = _FirstRollDice(first, rest)
+            *values, cut = play_out(cells, to_move, policy, dice, bearoff, max_plies)
+            for m, v in zip(metrics, values):
+                m.add(h, v)
+            truncated += cut
+            done += 1
+        if target_ci is not None and r + 1 < rounds and metrics[0].halfwidth(z) <= target_ci:
+            stopped = True
+            break
+
+    equity, win, gammon, backgammon = metrics
+    return RolloutResult(
+        done,
+        equity.mean(), equity.halfwidth(z),
+        win.mean(), win.halfwidth(z),
+        gammon.mean(), gammon.halfwidth(z),
+        backgammon.mean(), backgammon.halfwidth(z),
+        truncated, stopped,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Rollout de la posición inicial")
+    parser.add_argument("--trials", type=int, default=1296)
+    parser.add_argument("--policy", default="greedy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target-ci", type=float, default=None)
+    parser.add_argument("--no-truncate", action="store_true")
+    args = parser.parse_args(argv)
+
+    board = Board()
+    board.setup_standard()
+    t0 = time.perf_counter()
+    r = rollout(board, "blanco", args.policy, args.trials, args.seed,
+                args.target_ci, truncate=not args.no_truncate)
+    print(
+        f"pruebas={r.trials} equity={r.equity:+.3f}±{r.equity_ci:.3f} "
+        f"win={r.win:.3f}±{r.win_ci:.3f} gammon={r.gammon:.3f}±{r.gammon_ci:.3f} "
+        f"backgammon={r.backgammon:.3f}±{r.backgammon_ci:.3f} "
+        f"truncadas={r.truncated} corte_temprano={r.stopped_early} "
+        f"segundos={time.perf_counter() - t0:.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
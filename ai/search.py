@@ -0,0 +1,176 @@
+"""
+Bot de búsqueda expectimax a 1 y 2 plies sobre BackgammonGame.
+
+- 1-ply: se evalúan todas las jugadas legales y se elige la mejor.
+- 2-ply: para las mejores candidatas (ordenadas por su puntaje a 1-ply) se
+  promedia sobre las 21 tiradas distintas del rival (1/36 los dobles, 2/36 el
+  resto), suponiendo que el rival elige su mejor respuesta.
+- Poda: a 2-ply sólo entran las candidatas cerca de la mejor a 1-ply.
+- Anytime: con time_budget, al vencer el plazo se devuelve la mejor jugada
+  completamente evaluada hasta ese momento (como mínimo, la mejor a 1-ply).
+- Bear-off: si hay base de bear-off (ai/bearoff.py), las posiciones de carrera
+  se puntúan con la probabilidad exacta de ganar y no se buscan a 2-ply.
+
+La búsqueda trabaja sobre la posición plana (core/plays.py), sin tocar el juego.
+"""
+
+import time
+from typing import List, NamedTuple, Optional, Sequence
+
+from core.compact_board import CompactBoard
+from core.game import BackgammonGame
+from core.plays import Play, apply_step, legal_plays
+from core.slots import SLOT_BAR, SLOT_OFF
+from ai import features
+from ai.bearoff import BearoffDB, get_default
+from ai.policies import evaluate
+
+WIN_SCORE = 1000.0
+
+# 21 tiradas distintas con su probabilidad
+ROLLS: List[tuple[List[int], float]] = [
+    ([a] * 4 if a == b else [a, b], (1 if a == b else 2) / 36)
+    for a in range(1, 7) for b in range(a, 7)
+]
+
+
+class SearchResult(NamedTuple):
+    play: Play
+    score: float
+    depth: int          # profundidad alcanzada por la jugada elegida
+    candidates: int     # jugadas legales
+    searched: int       # candidatas evaluadas a la profundidad pedida
+    timed_out: bool
+
+
+def _opponent(color: str) -> str:
+    return "negro" if color == "blanco" else "blanco"
+
+
+def _finished(pos: Sequence[int], color: str) -> bool:
+    """¿'color' ya no tiene fichas en el tablero ni en la barra?"""
+    if pos[SLOT_BAR[color]]:
+        return False
+    if color == "blanco":
+        return not any(v > 0 for v in pos[:24])
+    return not any(v < 0 for v in pos[:24])
+
+
+def score_positions(positions: List[Sequence[int]], color: str,
+                    to_move: Optional[str] = None,
+                    bearoff: Optional[BearoffDB] = None) -> List[float]:
+    """
+    Puntaje de cada posición plana desde el punto de vista de 'color'.
+    to_move es quien tira a continuación (por defecto el rival de 'color'); sólo
+    importa para las posiciones de carrera que se resuelven con 'bearoff', que
+    valen WIN_SCORE * (2 * P(ganar) - 1).
+    """
+    if not positions:
+        return []
+    if features.np is not None:
+        scores = features.evaluate_batch(features.encode_cells(positions), color).tolist()
+    else:
+        scores = [evaluate(CompactBoard.from_array(p), color) for p in positions]
+    opp = _opponent(color)
+    to_move = to_move or opp
+    for i, pos in enumerate(positions):
+        if _finished(pos, color):
+            scores[i] = WIN_SCORE
+        elif _finished(pos, opp):
+            scores[i] = -WIN_SCORE
+        elif bearoff is not None:
+            p = bearoff.race_win_probability(pos, to_move)
+            if p is not None:
+                p = p if to_move == color else 1.0 - p
+                scores[i] = WIN_SCORE * (2.0 * p - 1.0)
+    return scores
+
+
+def _play_out(pos: Sequence[int], color: str, play: Play) -> List[int]:
+    for step in play:
+        pos = apply_step(pos, color, step)
+    return list(pos)
+
+
+class _Timeout(Exception):
+    pass
+
+
+class ExpectimaxBot:
+    """Política con búsqueda (cumple el protocolo ai.policies.Policy)."""
+
+    def __init__(self, depth: int = 2, time_budget: Optional[float] = None,
+                 max_candidates: int = 8, prune_margin: float = 12.0,
+                 bearoff: Optional[BearoffDB] = None, use_bearoff: bool = True):
+        if depth not in (1, 2):
+            raise ValueError("La profundidad debe ser 1 o 2.")
+        self.depth = depth
+        self.time_budget = time_budget
+        self.max_candidates = max_candidates
+        self.prune_margin = prune_margin
+        # sin base explícita se usa la generada por defecto (si existe)
+        if not use_bearoff:
+            bearoff = None
+        elif bearoff is None:
+            bearoff = get_default()
+        self.bearoff = bearoff
+
+    def choose(self, game: BackgammonGame) -> Play:
+        return self.analyze(game).play
+
+    def analyze(self, game: BackgammonGame) -> SearchResult:
+        """Busca la mejor jugada para el jugador al turno con los dados activos."""
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        color = game.get_current_player().get_color()
+        root = list(game.get_board().to_array())
+        plays = legal_plays(root, color, game.get_rolled_values())
+        if not plays:
+            return SearchResult((), 0.0, 0, 0, 0, False)
+
+        # 1-ply + ordenamiento
+        after = [_play_out(root, color, p) for p in plays]
+        first = score_positions(after, color, bearoff=self.bearoff)
+        order = sorted(range(len(plays)), key=lambda i: first[i], reverse=True)
+        best_i = order[0]
+        if self.depth == 1 or len(plays) == 1 or self._is_race(after[best_i]):
+            return SearchResult(plays[best_i], first[best_i], 1, len(plays), len(plays), False)
+
+        # poda de candidatas claramente peores
+        top = first[best_i]
+        cands = [i for i in order[: self.max_candidates] if top - first[i] <= self.prune_margin]
+
+        best_score, best_play, searched, timed_out = None, plays[best_i], 0, False
+        for i in cands:
+            try:
+                value = self._expect(after[i], color, deadline)
+            except _Timeout:
+                timed_out = True
+                break
+            searched += 1
+            if best_score is None or value > best_score:
+                best_score, best_play = value, plays[i]
+        if best_score is None:
+            return SearchResult(plays[best_i], first[best_i], 1, len(plays), 0, timed_out)
+        return SearchResult(best_play, best_score, 2, len(plays), searched, timed_out)
+
+    def _is_race(self, pos: Sequence[int]) -> bool:
+        """¿La posición ya la resuelve la base de bear-off?"""
+        return self.bearoff is not None and self.bearoff.race_win_probability(pos, "blanco") is not None
+
+    def _expect(self, pos: List[int], color: str, deadline: Optional[float]) -> float:
+        """Valor esperado (para 'color') sobre las 21 tiradas del rival, que responde lo mejor posible."""
+        opp = _opponent(color)
+        if _finished(pos, color):
+            return WIN_SCORE
+        total = 0.0
+        for dice, weight in ROLLS:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise _Timeout()
+            replies = legal_plays(pos, opp, dice)
+            if replies:
+                value = min(score_positions([_play_out(pos, opp, r) for r in replies], color,
+                                            to_move=color, bearoff=self.bearoff))
+            else:
+                value = score_positions([pos], color, to_move=color, bearoff=self.bearoff)[0]
+            total += weight * value
+        return total
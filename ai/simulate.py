@@ -0,0 +1,200 @@
+"""
+Simulador headless de partidas completas entre políticas (sin CLI ni Pygame).
+
+Uso:
+  python -m ai.simulate --games 1000 --white greedy --black random --workers 4 --seed 1
+
+Cada partida usa su propia semilla derivada de (seed, game_id), así que el
+resultado de una partida no depende de en qué proceso se jugó.
+
+Con --record DIR cada bloque de partidas se graba en DIR/games-<primer id>.bgr
+(formato de core/record.py).
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, NamedTuple, Optional
+
+from core.compact_board import CompactBoard
+from core.dice import BufferedDice, np
+from core.record import GameWriter
+from core.game import BackgammonGame
+from core.player import Player
+from ai.policies import Policy, make_policy
+
+MAX_PLIES = 2000  # corte de seguridad: ninguna partida real llega a esto
+
+
+class GameResult(NamedTuple):
+    game_id: int
+    winner: Optional[str]   # None si se cortó por MAX_PLIES
+    plies: int              # turnos jugados (uno por jugador en cada vuelta)
+    gammon: bool
+    backgammon: bool
+    seconds: float
+
+
+class _RngDice:
+    """Dados que tiran de un random.Random propio (respaldo si no hay NumPy)."""
+
+    def __init__(self, rng: random.Random):
+        self._rng = rng
+
+    def roll(self) -> List[int]:
+        d1, d2 = self._rng.randint(1, 6), self._rng.randint(1, 6)
+        return [d1] * 4 if d1 == d2 else [d1, d2]
+
+
+def _score(game: BackgammonGame, winner: str) -> tuple[bool, bool]:
+    """(gammon, backgammon) para el perdedor de la partida."""
+    board = game.get_board()
+    loser = "negro" if winner == "blanco" else "blanco"
+    if board.get_off(loser) > 0:
+        return False, False
+    winner_home = range(18, 24) if winner == "blanco" else range(0, 6)
+    atrasadas = board.count_on_bar(loser) > 0 or any(
+        board.owner_at(i) == loser for i in winner_home
+    )
+    return True, atrasadas
+
+
+def play_game(white: Policy, black: Policy, dice, game_id: int = 0,
+              max_plies: int = MAX_PLIES,
+              recorder: Optional[GameWriter] = None) -> GameResult:
+    """
+    Juega una partida completa desde la posición inicial y devuelve el resultado.
+    Con recorder se graban tiradas, movimientos, pases de turno y el final.
+    """
+    t0 = time.perf_counter()
+    board = CompactBoard()
+    board.setup_standard()
+    game = BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"), dice)
+    policies = {"blanco": white, "negro": black}
+    if recorder is not None:
+        recorder.attach(game)
+
+    plies = 0
+    winner = None
+    while plies < max_plies:
+        winner = game.get_winner()
+        if winner:
+            break
+        game.roll_dice()
+        color = game.get_current_player().get_color()
+        tokens = game.apply_play(policies[color].choose(game))
+        if recorder is not None:
+            for t in tokens:
+                if t.start is not None:
+                    recorder.on_move(color, t.start, t.end, t.die, t.hit)
+            recorder.on_end_turn(color)
+        plies += 1
+    else:
+        winner = game.get_winner()
+
+    gammon, backgammon = _score(game, winner) if winner else (False, False)
+    if recorder is not None:
+        game.set_recorder(None)
+        if winner:
+            recorder.end_game(winner, 1 + gammon + backgammon)
+    return GameResult(game_id, winner, plies, gammon, backgammon, time.perf_counter() - t0)
+
+
+def _game_rng(seed: int, game_id: int) -> random.Random:
+    return random.Random(f"{seed}:{game_id}")
+
+
+def _game_dice(seed: int, game_id: int, rng: random.Random):
+    """Dados propios de la partida: flujo de BufferedDice o, sin NumPy, el rng de la partida."""
+    if np is not None:
+        return BufferedDice.for_game(seed, game_id)
+    return _RngDice(rng)
+
+
+def _run_chunk(white: str, black: str, seed: int, game_ids: range,
+               record_dir: Optional[str] = None) -> List[GameResult]:
+    """Trabajo de un proceso: juega un bloque de partidas con semillas por partida."""
+    results = []
+    recorder = None
+    if record_dir is not None:
+        recorder = GameWriter(os.path.join(record_dir, f"games-{game_ids.start:08d}.bgr"))
+    try:
+        for gid in game_ids:
+            rng = _game_rng(seed, gid)
+            w = make_policy(white, random.Random(rng.getrandbits(64)))
+            b = make_policy(black, random.Random(rng.getrandbits(64)))
+            results.append(play_game(w, b, _game_dice(seed, gid, rng), gid, recorder=recorder))
+    finally:
+        if recorder is not None:
+            recorder.close()
+    return results
+
+
+def simulate(n_games: int, white: str = "random", black: str = "random",
+             workers: Optional[int] = None, seed: int = 0,
+             chunk_size: int = 64, record_dir: Optional[str] = None) -> Iterator[GameResult]:
+    """
+    Juega n_games partidas y va devolviendo los resultados a medida que terminan.
+    workers=1 corre en este proceso; None usa un proceso por núcleo.
+    El orden de llegada puede variar, pero cada game_id siempre da el mismo resultado.
+    Con record_dir cada bloque graba sus partidas en un archivo propio.
+    """
+    make_policy(white)
+    make_policy(black)  # valida nombres antes de lanzar procesos
+    chunks = [range(i, min(i + chunk_size, n_games)) for i in range(0, n_games, chunk_size)]
+    if record_dir is not None:
+        os.makedirs(record_dir, exist_ok=True)
+
+    if workers == 1:
+        for ids in chunks:
+            yield from _run_chunk(white, black, seed, ids, record_dir)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, white, black, seed, ids, record_dir) for ids in chunks]
+        for fut in as_completed(futures):
+            yield from fut.result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulador headless de Backgammon")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--white", default="random")
+    parser.add_argument("--black", default="random")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=64)
+    parser.add_argument("--jsonl", action="store_true", help="imprime un JSON por partida")
+    parser.add_argument("--record", metavar="DIR", default=None, help="graba las partidas en DIR")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    wins = {"blanco": 0, "negro": 0}
+    gammons = backgammons = plies = n = 0
+    for r in simulate(args.games, args.white, args.black, args.workers, args.seed, args.chunk,
+                      args.record):
+        n += 1
+        plies += r.plies
+        if r.winner:
+            wins[r.winner] += 1
+        gammons += r.gammon
+        backgammons += r.backgammon
+        if args.jsonl:
+            print(json.dumps(r._asdict()))
+    elapsed = time.perf_counter() - t0
+
+    print(
+        f"partidas={n} blanco={wins['blanco']} negro={wins['negro']} "
+        f"gammons={gammons} backgammons={backgammons} "
+        f"plies_prom={plies / max(n, 1):.1f} partidas/s={n / elapsed:.1f}",
+        file=sys.stderr if args.jsonl else sys.stdout,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
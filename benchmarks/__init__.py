@@ -0,0 +1,10 @@
+"""
+Benchmarks de los caminos calientes del motor, la CLI y el renderer.
+
+  python -m benchmarks.run                       # corre todo y muestra la tabla
+  python -m benchmarks.run --out r.json          # guarda resultados en JSON
+  python -m benchmarks.run --save-baseline       # fija benchmarks/baseline.json
+  python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.15
+
+El corpus de posiciones está en benchmarks/corpus.txt (estados positionID:matchID).
+"""
@@ -0,0 +1,120 @@
+"""
+Benchmark de memoria con tracemalloc: bytes por partida viva y por posición
+guardada, creando 'count' instancias que quedan vivas a la vez.
+
+Uso:
+  python -m benchmarks.memory [game position compact_position] [--count 1000000] [--out JSON]
+
+- game: Board estándar + dos Player + BackgammonGame (lo que guarda una sesión)
+- position: Board.copy() de las posiciones del corpus (lo que guarda un caché)
+- compact_position: lo mismo con CompactBoard
+
+El número es memoria asignada por Python (tracemalloc), sin la lista que las
+contiene; no incluye lo compartido entre instancias (fichas, tablas Zobrist).
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+
+from .run import _corpus_games, load_corpus
+
+DEFAULT_COUNT = 1_000_000
+
+
+# ---------- fábricas ----------
+# Cada una prepara lo compartido (fuera de la medición) y devuelve una función
+# i -> instancia nueva.
+
+def mem_game(corpus) -> Callable[[int], object]:
+    dice = ScriptedDice([])
+
+    def make(i):
+        board = Board()
+        board.setup_standard()
+        return BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"), dice)
+    return make
+
+
+def mem_position(corpus) -> Callable[[int], object]:
+    boards = [g.get_board() for g in _corpus_games(corpus)]
+    return lambda i: boards[i % len(boards)].copy()
+
+
+def mem_compact_position(corpus) -> Callable[[int], object]:
+    cells = [g.get_board().to_array() for g in _corpus_games(corpus)]
+    return lambda i: CompactBoard.from_array(cells[i % len(cells)])
+
+
+MEMORY_BENCHMARKS: Dict[str, Callable] = {
+    "game": mem_game,
+    "position": mem_position,
+    "compact_position": mem_compact_position,
+}
+
+
+# ---------- medición ----------
+def measure_memory(make: Callable[[int], object], count: int) -> Dict[str, float]:
+    """Crea 'count' instancias vivas a la vez y mide bytes por instancia con tracemalloc."""
+    if count < 1:
+        raise ValueError("count tiene que ser al menos 1.")
+    make(0)                      # calienta cachés perezosos antes de medir
+    items: List[object] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        items[i] = make(i)
+    current, peak = tracemalloc.get_traced_memory()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.stop()
+    del items
+    return {
+        "count": count,
+        "bytes": current - base,
+        "bytes_per_instance": (current - base) / count,
+        "peak_bytes": peak - base,
+        "seconds": elapsed,
+    }
+
+
+def run_memory(names: Optional[List[str]] = None, count: int = DEFAULT_COUNT) -> Dict:
+    corpus = load_corpus()
+    results = {}
+    for name in names or list(MEMORY_BENCHMARKS):
+        if name not in MEMORY_BENCHMARKS:
+            raise ValueError(f"Benchmark desconocido: {name}. Opciones: {', '.join(MEMORY_BENCHMARKS)}")
+        results[name] = measure_memory(MEMORY_BENCHMARKS[name](corpus), count)
+    return {"meta": {"python": sys.version.split()[0], "count": count}, "results": results}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bytes por partida / posición (tracemalloc)")
+    parser.add_argument("names", nargs="*", help=f"subconjunto de: {', '.join(MEMORY_BENCHMARKS)}")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="instancias vivas a la vez")
+    parser.add_argument("--out", help="guarda los resultados en este JSON")
+    args = parser.parse_args(argv)
+
+    data = run_memory(args.names or None, args.count)
+    for name, r in data["results"].items():
+        print(f"{name:<18} {r['bytes_per_instance']:>10.1f} bytes/instancia  "
+              f"total={r['bytes'] / 2**20:>9.1f} MiB  ({r['count']} en {r['seconds']:.1f} s)")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
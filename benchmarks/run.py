@@ -0,0 +1,278 @@
+"""
+Runner de benchmarks: warmup, repeticiones, estadísticas, JSON y comparación
+contra un baseline con umbral de regresión (código de salida 1 si hay regresión).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from core.board import Board
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+from core.position_id import game_from_state_id
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(HERE, "corpus.txt")
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+
+
+def load_corpus(path: str = CORPUS_PATH) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _corpus_games(corpus: List[str]) -> List[BackgammonGame]:
+    return [game_from_state_id(sid, dice=ScriptedDice([])) for sid in corpus]
+
+
+# ---------- benchmarks ----------
+# Cada fábrica prepara los datos (fuera del tiempo medido) y devuelve
+# (función a medir, operaciones por llamada).
+
+def bench_legal_moves(corpus):
+    games = _corpus_games(corpus)
+
+    def run():
+        for g in games:
+            g.legal_moves()
+    return run, len(games)
+
+
+def bench_can_play(corpus):
+    games = _corpus_games(corpus)
+
+    def run():
+        for g in games:
+            g.can_play()
+    return run, len(games)
+
+
+def bench_to_ascii(corpus):
+    boards = [g.get_board() for g in _corpus_games(corpus)]
+
+    def run():
+        for b in boards:
+            b.to_ascii()
+    return run, len(boards)
+
+
+def _scripted_game(seed: int = 7):
+    """Partida fija jugada con move(): tiradas y (origen, destino) de cada paso."""
+    rng = random.Random(seed)
+    rolls, moves = [], []
+    board = Board()
+    board.setup_standard()
+    game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), ScriptedDice([]))
+    while not game.get_winner():
+        d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+        rolls.append((d1, d2))
+        game.restore_turn(game.get_current_player().get_color(), [d1] * 4 if d1 == d2 else [d1, d2])
+        while game.get_rolled_values() and game.can_play():
+            start, end, _ = rng.choice(game.legal_moves())
+            moves.append((start, end, game.get_current_player().get_color()))
+            game.move(start, end, game.get_current_player().get_color())
+        moves.append(None)  # fin de turno
+        if game.get_rolled_values():
+            game.end_turn()
+    return rolls, moves
+
+
+def bench_move(corpus):
+    rolls, moves = _scripted_game()
+    n_moves = sum(m is not None for m in moves)
+
+    def run():
+        board = Board()
+        board.setup_standard()
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), ScriptedDice(rolls))
+        game.roll_dice()
+        for m in moves:
+            if m is None:
+                if game.get_rolled_values():
+                    game.end_turn()
+                if not game.get_winner():
+                    game.roll_dice()
+            else:
+                game.move(*m)
+    return run, n_moves
+
+
+def bench_new_game(corpus, games: int = 1000):
+    """Armar una partida: tablero estándar, dos jugadores y BackgammonGame."""
+    dice = ScriptedDice([])
+
+    def run():
+        for _ in range(games):
+            board = Board()
+            board.setup_standard()
+            BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), dice)
+    return run, games
+
+
+def bench_copy(corpus):
+    boards = [g.get_board() for g in _corpus_games(corpus)]
+
+    def run():
+        for b in boards:
+            b.copy()
+    return run, len(boards)
+
+
+def bench_random_games(corpus, games: int = 20):
+    from ai.simulate import simulate
+
+    def run():
+        for _ in simulate(games, "random", "random", workers=1, seed=1, chunk_size=games):
+            pass
+    return run, games
+
+
+def _renderer():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from pygame_ui.constants import WIDTH, HEIGHT, FONT_SIZE
+    from pygame_ui.renderer import BoardRenderer
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    return BoardRenderer(screen, pygame.font.SysFont(None, FONT_SIZE))
+
+
+def bench_render(corpus):
+    renderer = _renderer()
+    games = _corpus_games(corpus)[:20]
+
+    def run():
+        for g in games:
+            renderer.render(g, None, None, False, [])
+    return run, len(games)
+
+
+def bench_render_idle(corpus, frames: int = 100):
+    """Frames sin cambios: sólo cuesta detectar que no hay regiones sucias."""
+    renderer = _renderer()
+    game = _corpus_games(corpus)[0]
+    renderer.render(game)
+
+    def run():
+        for _ in range(frames):
+            renderer.render(game)
+    return run, frames
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "legal_moves": bench_legal_moves,
+    "move": bench_move,
+    "to_ascii": bench_to_ascii,
+    "can_play": bench_can_play,
+    "new_game": bench_new_game,
+    "copy": bench_copy,
+    "random_games": bench_random_games,
+    "render": bench_render,
+    "render_idle": bench_render_idle,
+}
+
+
+# ---------- medición ----------
+def measure(fn: Callable[[], None], ops: int, warmup: int = 2, repeat: int = 7) -> Dict[str, float]:
+    """Corre fn 'warmup' veces sin medir y 'repeat' veces midiendo; estadísticas en segundos."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    median = statistics.median(times)
+    return {
+        "ops": ops,
+        "repeat": repeat,
+        "min": min(times),
+        "median": median,
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "us_per_op": median / ops * 1e6,
+        "ops_per_s": ops / median if median else float("inf"),
+    }
+
+
+def run_all(names: Optional[List[str]] = None, warmup: int = 2, repeat: int = 7) -> Dict:
+    corpus = load_corpus()
+    results = {}
+    for name in names or list(BENCHMARKS):
+        if name not in BENCHMARKS:
+            raise ValueError(f"Benchmark desconocido: {name}. Opciones: {', '.join(BENCHMARKS)}")
+        fn, ops = BENCHMARKS[name](corpus)
+        results[name] = measure(fn, ops, warmup, repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "corpus": len(corpus),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.15) -> List[Dict]:
+    """
+    Compara us_per_op de cada benchmark presente en ambos.
+    Es regresión si current > baseline * (1 + threshold).
+    """
+    rows = []
+    for name, base in baseline.get("results", {}).items():
+        cur = current.get("results", {}).get(name)
+        if cur is None:
+            continue
+        ratio = cur["us_per_op"] / base["us_per_op"] if base["us_per_op"] else float("inf")
+        rows.append({"name": name, "baseline": base["us_per_op"], "current": cur["us_per_op"],
+                     "ratio": ratio, "regression": ratio > 1 + threshold})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks del motor, CLI y renderer")
+    parser.add_argument("names", nargs="*", help=f"subconjunto de: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--out", help="guarda los resultados en este JSON")
+    parser.add_argument("--baseline", help="JSON contra el cual comparar")
+    parser.add_argument("--threshold", type=float, default=0.15, help="regresión tolerada (0.15 = 15%%)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"escribe {BASELINE_PATH}")
+    args = parser.parse_args(argv)
+
+    data = run_all(args.names or None, args.warmup, args.repeat)
+    for name, r in data["results"].items():
+        print(f"{name:<14} {r['us_per_op']:>12.2f} us/op  {r['ops_per_s']:>12.1f} ops/s  "
+              f"(±{r['stdev'] / r['median'] * 100 if r['median'] else 0:.1f}%)")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            rows = compare(data, json.load(f), args.threshold)
+        failed = False
+        for row in rows:
+            mark = "REGRESIÓN" if row["regression"] else "ok"
+            print(f"{row['name']:<14} x{row['ratio']:.2f} vs baseline  {mark}")
+            failed |= row["regression"]
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
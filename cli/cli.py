@@ -18,36 +18,57 @@ Comandos dentro de la partida:
   mover     -> <origen> <destino> -> mueve una ficha (ej.: mover 0 5)
   volver    -> regresa al menú principal
   jugadas   -> lista movimientos legales con los dados actuales
+  bot       -> la computadora juega el turno actual (tira si hace falta)
+  stats     -> activa/muestra contadores del motor (stats on|off|reset)
 
+Modo guion (sin menú, un comando por línea, '-' = stdin):
+  python -m cli.cli --script partida.txt --tiradas "31 66 5-2" [--tablero] [--parar]
+El código de salida es 0 si todos los comandos anduvieron y 1 si alguno falló.
 """
 
+import sys
+
 from core.board import Board
 from core.player import Player
-from core.dice import Dice
+from core.dice import Dice, ScriptedDice
 from core.game import BackgammonGame
+from core.instrument import GameStats, instrument, uninstrument
+
+# Segundos que el bot puede pensar por turno (búsqueda anytime)
+BOT_TIME_BUDGET = 1.0
 
 
 class CLI:
-    def __init__(self):
+    def __init__(self, out=None):
         # El juego se crea cuando el usuario elige "Empezar juego" en el menú
         self.board: Board | None = None
         self.blanco: Player | None = None
         self.negro: Player | None = None
         self.dice: Dice | None = None
         self.game: BackgammonGame | None = None
+        self.bot = None  # ExpectimaxBot, se crea con el primer comando "bot"
+        self.stats: GameStats | None = None   # contadores del motor (comando 'stats')
+        self.out = out                  # stream de salida (None = sys.stdout)
+        self.mostrar_tablero = True     # tablero ASCII después de cada comando
+        self.terminada = False          # ya hay ganador en la partida actual
+
+    def _print(self, *args) -> None:
+        print(*args, file=self.out if self.out is not None else sys.stdout)
 
     # ================== Ayuda / Visualización ==================
     def _imprimir_ayuda(self) -> None:
-        print("Comandos disponibles:")
-        print("  ayuda     -> muestra esta ayuda")
-        print("  salir     -> termina la aplicación")
-        print("  tablero   -> muestra cantidad de fichas por punto (0..23)")
-        print("  turno     -> muestra de quién es el turno")
-        print("  tirar     -> tira los dados y muestra el resultado")
-        print("  reiniciar -> vuelve a la posición inicial estándar")
-        print("  mover     -> <origen> <destino> -> mueve una ficha (ej.: mover 0 5)")
-        print("  volver    -> regresa al menú principal")
-        print("  jugadas   -> lista movimientos legales con los dados actuales")
+        self._print("Comandos disponibles:")
+        self._print("  ayuda     -> muestra esta ayuda")
+        self._print("  salir     -> termina la aplicación")
+        self._print("  tablero   -> muestra cantidad de fichas por punto (0..23)")
+        self._print("  turno     -> muestra de quién es el turno")
+        self._print("  tirar     -> tira los dados y muestra el resultado")
+        self._print("  reiniciar -> vuelve a la posición inicial estándar")
+        self._print("  mover     -> <origen> <destino> -> mueve una ficha (ej.: mover 0 5)")
+        self._print("  volver    -> regresa al menú principal")
+        self._print("  jugadas   -> lista movimientos legales con los dados actuales")
+        self._print("  bot       -> la computadora juega el turno actual (tira si hace falta)")
+        self._print("  stats     -> activa/muestra contadores del motor (stats on|off|reset)")
 
     def _mostrar_reglas(self) -> None:
         reglas = """
@@ -94,21 +115,23 @@ sólo si no hay fichas más lejos que la que querés sacar.
 8) Final del juego
 - Gana quien primero se queda sin fichas en el tablero y en la barra.
 """
-        print(reglas)
+        self._print(reglas)
 
-    def _mostrar_estado(self) -> None:
+    def _mostrar_estado(self, forzar: bool = False) -> None:
         turno = self.game.get_current_player().get_color()
         dados = self.game.get_rolled_values()
-        print(f"\nTurno: {turno}")
-        print("Dados disponibles:", dados if dados else "(sin tirar)")
-        print(self.board.to_ascii())
+        self._print(f"\nTurno: {turno}")
+        self._print("Dados disponibles:", dados if dados else "(sin tirar)")
+        self._print(f"Pips: blanco={self.board.pip_count('blanco')} | negro={self.board.pip_count('negro')}")
+        if forzar or self.mostrar_tablero:
+            self._print(self.board.to_ascii())
 
     def _menu_principal(self) -> str:
-        print("\n====== Menú principal ======")
-        print("1) Empezar juego")
-        print("2) Reglas")
-        print("3) Ayuda")
-        print("4) Salir")
+        self._print("\n====== Menú principal ======")
+        self._print("1) Empezar juego")
+        self._print("2) Reglas")
+        self._print("3) Ayuda")
+        self._print("4) Salir")
         op = input("Elegí una opción [1-4]: ").strip().lower()
         return "4" if op == "salir" else op
 
@@ -125,14 +148,14 @@ sólo si no hay fichas más lejos que la que querés sacar.
     def _chequear_ganador(self) -> bool:
         ganador = self.game.get_winner()
         if ganador:
-            print(f"\n¡{ganador.capitalize()} ganó la partida! 🎉")
+            self._print(f"\n¡{ganador.capitalize()} ganó la partida! 🎉")
             return True
         return False
 
     def _imprimir_jugadas(self) -> None:
         moves = self.game.legal_moves()
         if not moves:
-            print("No hay movimientos legales con los dados actuales.")
+            self._print("No hay movimientos legales con los dados actuales.")
             return
 
         def _pt(x: int) -> str:
@@ -142,31 +165,208 @@ sólo si no hay fichas más lejos que la que querés sacar.
                 return "salida(24)"
             return str(x)
 
-        print("Movimientos legales:")
+        self._print("Movimientos legales:")
         for i, (s, e, d) in enumerate(moves, 1):
-            print(f"  {i:>2}) {_pt(s)} -> {_pt(e)}  usando dado {d}")
+            self._print(f"  {i:>2}) {_pt(s)} -> {_pt(e)}  usando dado {d}")
+
+    def _jugar_bot(self) -> None:
+        """El bot juega el turno completo del jugador actual."""
+        color = self.game.get_current_player().get_color()
+        if not self.game.get_rolled_values():
+            self._print("Dados tirados:", self.game.roll_dice())
+        if self.bot is None:
+            from ai.search import ExpectimaxBot
+            self.bot = ExpectimaxBot(depth=2, time_budget=BOT_TIME_BUDGET)
+        jugada = self.bot.choose(self.game)
+        if not jugada:
+            self._print("El bot no tiene movimientos legales; pasa el turno.")
+            self.game.end_turn()
+            return
+        self.game.apply_play(jugada)
+        pasos = ", ".join(f"{s} -> {e}" for s, e, _ in jugada)
+        self._print(f"Bot ({color}) jugó: {pasos}")
+
+    def _stats(self, arg: str) -> None:
+        """Comando 'stats': sin argumento activa la medición o muestra los contadores."""
+        if arg == "off":
+            if self.stats is not None:
+                uninstrument(self.game)
+                self.stats = None
+            self._print("Instrumentación desactivada.")
+            return
+        if self.stats is None:
+            self.stats = instrument(self.game)
+            self._print("Instrumentación activada. Usá 'stats' de nuevo para ver los contadores.")
+            return
+        if arg == "reset":
+            self.stats.reset()
+            self._print("Contadores en cero.")
+            return
+        self._print(self.stats.format())
 
     # ================== Flujo ==================
-    def _nuevo_juego(self) -> None:
+    def _nuevo_juego(self, dice=None) -> None:
         self.board = Board()
         self.board.setup_standard()
         self.blanco = Player("Blanco", "blanco")
         self.negro = Player("Negro", "negro")
-        self.dice = Dice()
+        self.dice = dice if dice is not None else Dice()
+        self.terminada = False
         self.game = BackgammonGame(self.board, self.blanco, self.negro, self.dice)
+        if self.stats is not None:
+            instrument(self.game, self.stats)
+
+    def nueva_partida(self, dice=None) -> None:
+        """
+        Empieza una partida nueva sin pasar por el menú, con 'dice' (o dados al
+        azar). 'reiniciar' conserva esos mismos dados.
+        """
+        self._nuevo_juego(dice)
 
     def _reiniciar(self) -> None:
-        self._nuevo_juego()
-        print("Partida reiniciada: tablero, turno y dados en estado inicial.")
+        # mismos dados: en modo guion las tiradas siguen el guion después de reiniciar
+        self._nuevo_juego(self.dice)
+        self._print("Partida reiniciada: tablero, turno y dados en estado inicial.")
         self._mostrar_estado()
 
+    # ================== comandos de partida ==================
+    def ejecutar(self, linea: str) -> bool:
+        """
+        Ejecuta un comando de partida ('tirar', 'mover 0 5', 'jugadas', ...).
+        Devuelve False si falló (uso incorrecto, movimiento inválido, comando
+        desconocido). 'salir' y 'volver' los maneja quien llama.
+        """
+        partes = linea.strip().split()
+        if not partes:
+            return True
+        try:
+            return self._comando(partes[0].lower(), partes)
+        except Exception as e:
+            self._print("Error:", e)
+            return False
+
+    def _comando(self, cmd: str, partes: list[str]) -> bool:
+        if cmd == "ayuda":
+            self._imprimir_ayuda()
+            return True
+
+        if cmd == "tablero":
+            self._mostrar_estado(forzar=True)
+            return True
+
+        if cmd == "turno":
+            self._print("Turno de:", self.game.get_current_player().get_color())
+            return True
+
+        if cmd == "tirar":
+            if len(partes) == 3:
+                # 'tirar 3 1': sólo con dados guionados (modo guion)
+                if not hasattr(self.dice, "force"):
+                    self._print("Sólo se puede elegir la tirada en modo guion.")
+                    return False
+                self.dice.force((int(partes[1]), int(partes[2])))
+            elif len(partes) != 1:
+                self._print("Uso: tirar  (o 'tirar <d1> <d2>' en modo guion)")
+                return False
+            valores = self.game.roll_dice()
+            self._print("Dados tirados:", valores)
+            if not self.game.can_play():
+                self._print("No hay movimientos legales; pasás el turno.")
+                self.game.end_turn()
+            self._mostrar_estado()
+            return True
+
+        if cmd in {"jugadas", "legales"}:
+            self._imprimir_jugadas()
+            return True
+
+        if cmd in {"mover", "move"}:
+            if len(partes) != 3:
+                self._print("Uso: mover <origen:int> <destino:int>")
+                return False
+            try:
+                origen = int(partes[1])
+                destino = int(partes[2])
+            except ValueError:
+                self._print("Origen/Destino deben ser enteros.")
+                return False
+
+            color = self.game.get_current_player().get_color()
+
+            if not self._valid_point(origen) or not self._valid_point(destino):
+                self._print("Punto inválido: debe ser 0..23 (o -1/24 solo barra/bear-off).")
+                return False
+
+            try:
+                self.game.move(origen, destino, color)
+            except ValueError as e:
+                self._print("Error:", e)
+                return False
+
+            self._print(f"Movida {color}: {origen} -> {destino}")
+            self._mostrar_estado()
+            self.terminada = self._chequear_ganador()
+            return True
+
+        if cmd == "bot":
+            self._jugar_bot()
+            self._mostrar_estado()
+            self.terminada = self._chequear_ganador()
+            return True
+
+        if cmd == "stats":
+            self._stats(partes[1].lower() if len(partes) > 1 else "")
+            return True
+
+        if cmd == "reiniciar":
+            self._reiniciar()
+            return True
+
+        # sugerencias si ingresan sólo números
+        if cmd.isdigit() and len(partes) == 2 and partes[1].isdigit():
+            self._print(f"Parece un movimiento. Usá: mover {partes[0]} {partes[1]}")
+            return False
+
+        self._print("Comando no reconocido. Escribí 'ayuda' para ver opciones.")
+        return False
+
+    # ================== modo guion (sin menú) ==================
+    def run_script(self, lineas, tiradas=(), mostrar_tablero=False, parar_en_error=False) -> int:
+        """
+        Ejecuta comandos de partida de 'lineas' (archivo, stdin o lista) en una
+        partida nueva con dados guionados, sin menú ni input().
+        'tiradas' son los pares de dados en orden; 'tirar d1 d2' fuerza una tirada.
+        Con mostrar_tablero=False no se imprime el tablero después de cada comando
+        (el comando 'tablero' lo sigue mostrando).
+        Devuelve 0 si todos los comandos anduvieron, 1 si alguno falló.
+        """
+        self.mostrar_tablero = mostrar_tablero
+        self._nuevo_juego(ScriptedDice(tiradas))
+        errores = 0
+        for n, linea in enumerate(lineas, 1):
+            linea = linea.split("#", 1)[0].strip()
+            if not linea:
+                continue
+            if linea.split()[0].lower() in {"salir", "volver", "menu"}:
+                break
+            self._print(f"> {linea}")
+            if not self.ejecutar(linea):
+                errores += 1
+                self._print(f"[línea {n}] falló: {linea}")
+                if parar_en_error:
+                    break
+            if self.terminada:
+                break
+        self._print(f"comandos con error: {errores}")
+        return 0 if errores == 0 else 1
+
     # ================== programa principal ==================
     def cmdloop(self) -> None:
         while True:
             opcion = self._menu_principal()
 
             if opcion == "4":
-                print("¡Hasta luego!")
+                self._print("¡Hasta luego!")
                 return
 
             if opcion == "3":
@@ -178,101 +378,68 @@ sólo si no hay fichas más lejos que la que querés sacar.
                 continue
 
             if opcion != "1":
-                print("Opción inválida. Probá 1..4.")
+                self._print("Opción inválida. Probá 1..4.")
                 continue
 
             # === 1) Empezar juego ===
             self._nuevo_juego()
-            print("\nComienza el juego. Escribí 'ayuda' para ver comandos.")
-            print("Usá 'volver' para regresar al menú, o 'salir' para cerrar la aplicación.")
+            self._print("\nComienza el juego. Escribí 'ayuda' para ver comandos.")
+            self._print("Usá 'volver' para regresar al menú, o 'salir' para cerrar la aplicación.")
             self._mostrar_estado()
             if self._chequear_ganador():
                 break
 
             while True:
-                try:
-                    partes = input(self._prompt_turno()).strip().split()
-                    if not partes:
-                        continue
-                    cmd = partes[0].lower()
-
-                    if cmd == "salir":
-                        print("¡Hasta luego!")
-                        return
-
-                    if cmd in {"volver", "menu"}:
-                        print("Volviendo al menú principal…")
-                        break
-
-                    if cmd == "ayuda":
-                        self._imprimir_ayuda()
-                        continue
-
-                    if cmd == "tablero":
-                        self._mostrar_estado()
-                        continue
-
-                    if cmd == "turno":
-                        print("Turno de:", self.game.get_current_player().get_color())
-                        continue
-
-                    if cmd == "tirar":
-                        valores = self.game.roll_dice()
-                        print("Dados tirados:", valores)
-                        if not self.game.can_play():
-                            print("No hay movimientos legales; pasás el turno.")
-                            self.game.end_turn()
-                            self._mostrar_estado()
-                            continue
-                        self._mostrar_estado()
-                        continue
-
-                    if cmd in {"jugadas", "legales"}:
-                        self._imprimir_jugadas()
-                        continue
-
-                    if cmd in {"mover", "move"}:
-                        if len(partes) != 3:
-                            print("Uso: mover <origen:int> <destino:int>")
-                            continue
-                        try:
-                            origen = int(partes[1])
-                            destino = int(partes[2])
-                        except ValueError:
-                            print("Origen/Destino deben ser enteros.")
-                            continue
-
-                        color = self.game.get_current_player().get_color()
-
-                        if not self._valid_point(origen) or not self._valid_point(destino):
-                            print("Punto inválido: debe ser 0..23 (o -1/24 solo barra/bear-off).")
-                            continue
-
-                        try:
-                            self.game.move(origen, destino, color)
-                        except ValueError as e:
-                            print("Error:", e)
-                            continue
-
-                        print(f"Movida {color}: {origen} -> {destino}")
-                        self._mostrar_estado()
-
-                        if self._chequear_ganador():
-                            break
-                        continue
-
-                    if cmd == "reiniciar":
-                        self._reiniciar()
-                        continue
-
-                    # sugerencias si ingresan sólo números
-                    if cmd.isdigit():
-                        if len(partes) == 2 and partes[0].isdigit() and partes[1].isdigit():
-                            print(f"Parece un movimiento. Usá: mover {partes[0]} {partes[1]}")
-                            continue
-                        print("Comando no reconocido. Escribí 'ayuda' para ver opciones.")
-                        continue
-
-                    print("Comando no reconocido. Escribí 'ayuda' para ver opciones.")
-                except Exception as e:
-                    print("Error:", e)  
+                linea = input(self._prompt_turno()).strip()
+                cmd = linea.split()[0].lower() if linea else ""
+
+                if cmd == "salir":
+                    self._print("¡Hasta luego!")
+                    return
+
+                if cmd in {"volver", "menu"}:
+                    self._print("Volviendo al menú principal…")
+                    break
+
+                self.ejecutar(linea)
+                if self.terminada:
+                    break
+
+
+def _parse_tiradas(texto: str) -> list[tuple[int, int]]:
+    """'31 66 5-2 4,1' -> [(3, 1), (6, 6), (5, 2), (4, 1)]"""
+    tiradas = []
+    for tok in texto.split():
+        digitos = tok.replace("-", "").replace(",", "")
+        if len(digitos) != 2 or not digitos.isdigit():
+            raise ValueError(f"Tirada inválida: {tok!r} (ej.: 31 o 3-1)")
+        tiradas.append((int(digitos[0]), int(digitos[1])))
+    return tiradas
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Backgammon en modo texto")
+    parser.add_argument("--script", metavar="ARCHIVO",
+                        help="ejecuta los comandos del archivo ('-' = stdin) sin menú")
+    parser.add_argument("--tiradas", default="", help="tiradas del guion en orden, ej.: '31 66 52'")
+    parser.add_argument("--tablero", action="store_true", help="imprime el tablero después de cada comando")
+    parser.add_argument("--parar", action="store_true", help="corta en el primer comando que falle")
+    args = parser.parse_args(argv)
+
+    if args.script is None:
+        CLI().cmdloop()
+        return 0
+
+    tiradas = _parse_tiradas(args.tiradas)
+    # salida con buffer grande: se escribe en bloques, no línea por línea
+    with open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=1 << 16, closefd=False) as out:
+        cli = CLI(out=out)
+        if args.script == "-":
+            return cli.run_script(sys.stdin, tiradas, args.tablero, args.parar)
+        with open(args.script, encoding="utf-8") as f:
+            return cli.run_script(f, tiradas, args.tablero, args.parar)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,24 @@
+from array import array
 from typing import List, Dict
 from core.checker import Checker
+from core.slots import SLOT_BAR, SLOT_OFF, N_SLOTS
+from core import zobrist
+
+_HOME = {"blanco": range(18, 24), "negro": range(0, 6)}
+_CI = {"blanco": 0, "negro": 1}   # índice del color en los agregados [blanco, negro]
+
+# Posición inicial estándar: (punto, color, cantidad)
+STANDARD_SETUP = (
+    (0,  "blanco", 2),
+    (11, "blanco", 5),
+    (16, "blanco", 3),
+    (18, "blanco", 5),
+    (23, "negro", 2),
+    (12, "negro", 5),
+    (7,  "negro", 3),
+    (5,  "negro", 5),
+)
+
 
 class Board:
   
@@ -8,16 +27,21 @@ class Board:
     Índices 0..23 recorren el tablero de un extremo a otro (orientación a definir).
     """
 
+    __slots__ = ("_points", "_bar", "_off", "_side", "_zhash", "_pips", "_on_board", "_outside", "_back")
+
     def __init__(self):
         """Crea la estructura de puntos y barra, y deja el tablero vacío."""
-        self.__points__: List[List[Checker]] = [[] for _ in range(24)]
-        self.__bar__: Dict[str, List[Checker]] = {"blanco": [], "negro": []}
+        self._points: List[List[Checker]] = [[] for _ in range(24)]
+        self._bar: Dict[str, List[Checker]] = {"blanco": [], "negro": []}
+        self._off: Dict[str, int] = {"blanco": 0, "negro": 0}
         self.setup_board()
 
     def setup_board(self):
      """Inicializa el tablero. Por ahora lo deja vacío, pero está preparado para cargar después la posición inicial estándar."""
-     self.__points__ = [[] for _ in range(24)]
-     self.__bar__ = {"blanco": [], "negro": []}
+     self._points = [[] for _ in range(24)]
+     self._bar = {"blanco": [], "negro": []}
+     self._off = {"blanco": 0, "negro": 0}
+     self._reset_caches()
 
     # ---------- helpers básicos ----------
     def _check_index(self, idx: int) -> None:
@@ -25,28 +49,150 @@ class Board:
         if not (0 <= idx < 24):
             raise IndexError("Índice de punto inválido (debe estar entre 0 y 23).")
 
+    def _signed(self, idx: int) -> int:
+        """Conteo con signo del punto (+blanco / -negro), sin validar índice."""
+        stack = self._points[idx]
+        if not stack:
+            return 0
+        return len(stack) if stack[-1].get_color() == "blanco" else -len(stack)
+
+    def _color_count(self, color: str, idx: int) -> int:
+        """Fichas de 'color' en el punto idx."""
+        return sum(1 for ch in self._points[idx] if ch.get_color() == color)
+
+    # ---------- estado derivado (hash + agregados por color) ----------
+    def _reset_caches(self) -> None:
+        """Deja hash y agregados como para un tablero vacío con blanco al turno."""
+        self._side: str = "blanco"
+        self._zhash: int = 0
+        # agregados como listas [blanco, negro]: más chicas que un dict por tablero
+        self._pips: List[int] = [0, 0]
+        self._on_board: List[int] = [0, 0]
+        self._outside: List[int] = [0, 0]
+        self._back: List[int | None] = [None, None]
+
+    def _copy_caches(self, other: "Board") -> None:
+        other._side = self._side
+        other._zhash = self._zhash
+        other._pips = self._pips[:]
+        other._on_board = self._on_board[:]
+        other._outside = self._outside[:]
+        other._back = self._back[:]
+
+    def _resync(self) -> None:
+        """Recalcula hash y agregados desde cero (sólo al cargar posiciones completas)."""
+        side = self._side
+        self._reset_caches()
+        self._side = side
+        cells = self.to_array()
+        self._zhash = zobrist.hash_cells(cells, side)
+        for idx in range(24):
+            n = cells[idx]
+            color = "blanco" if n > 0 else "negro"
+            for _ in range(abs(n)):
+                self._agg_point(color, idx, 1)
+        for color in ("blanco", "negro"):
+            self._pips[_CI[color]] += 25 * cells[SLOT_BAR[color]]
+
+    def _agg_point(self, color: str, idx: int, delta: int) -> None:
+        """Actualiza pips/conteos/ficha más atrasada tras sumar 'delta' fichas en idx."""
+        white = color == "blanco"
+        c = 0 if white else 1
+        self._pips[c] += delta * (24 - idx if white else idx + 1)
+        self._on_board[c] += delta
+        if idx not in _HOME[color]:
+            self._outside[c] += delta
+        back = self._back[c]
+        if delta > 0:
+            if back is None or (idx < back if white else idx > back):
+                self._back[c] = idx
+        elif idx == back and self._color_count(color, idx) == 0:
+            scan = range(idx + 1, 24) if white else range(idx - 1, -1, -1)
+            self._back[c] = next((j for j in scan if self._color_count(color, j)), None)
+
+    def _agg_bar(self, color: str, delta: int) -> None:
+        self._pips[_CI[color]] += 25 * delta
+
+    # ---------- hash Zobrist incremental ----------
+    def _touch_point(self, idx: int, before: int, after: int) -> None:
+        self._zhash ^= zobrist.point_key(idx, before) ^ zobrist.point_key(idx, after)
+
+    def _touch_bar(self, color: str, before: int, after: int) -> None:
+        keys = zobrist.BAR_KEYS[color]
+        self._zhash ^= keys[before] ^ keys[after]
+
+    def _touch_off(self, color: str, before: int, after: int) -> None:
+        keys = zobrist.OFF_KEYS[color]
+        self._zhash ^= keys[before] ^ keys[after]
+
+    def get_hash(self) -> int:
+        """Hash Zobrist de 64 bits (puntos, barra, retiradas y color al turno)."""
+        return self._zhash
+
+    def get_side_to_move(self) -> str:
+        """Color al turno que se incluye en el hash."""
+        return self._side
+
+    def set_side_to_move(self, color: str) -> None:
+        """Fija el color al turno y actualiza el hash en O(1)."""
+        if color not in ("blanco", "negro"):
+            raise ValueError("Color inválido.")
+        if color != self._side:
+            self._side = color
+            self._zhash ^= zobrist.SIDE_KEY
+
+    # ---------- agregados por color (O(1)) ----------
+    def _check_color(self, color: str) -> None:
+        if color not in ("blanco", "negro"):
+            raise ValueError("Color inválido.")
+
+    def pip_count(self, color: str) -> int:
+        """Pips que le faltan a 'color' para sacar todas sus fichas (barra = 25)."""
+        self._check_color(color)
+        return self._pips[_CI[color]]
+
+    def count_on_board(self, color: str) -> int:
+        """Fichas de 'color' en los puntos 0..23."""
+        self._check_color(color)
+        return self._on_board[_CI[color]]
+
+    def count_outside_home(self, color: str) -> int:
+        """Fichas de 'color' en puntos fuera de su cuadrante final (sin contar barra)."""
+        self._check_color(color)
+        return self._outside[_CI[color]]
+
+    def count_on_bar(self, color: str) -> int:
+        """Fichas de 'color' en la barra."""
+        self._check_color(color)
+        return len(self._bar[color])
+
+    def furthest_back(self, color: str) -> int | None:
+        """Punto de la ficha más atrasada de 'color' en el tablero (None si no tiene)."""
+        self._check_color(color)
+        return self._back[_CI[color]]
+
     def get_points(self) -> List[List[Checker]]:
         """Devuelve la lista de puntos (referencia)."""
-        return self.__points__
+        return self._points
 
     def get_bar(self) -> Dict[str, List[Checker]]:
         """Devuelve la barra por color (referencia)."""
-        return self.__bar__
+        return self._bar
 
     def get_point(self, idx: int) -> List[Checker]:
         """Devuelve la pila de fichas en el punto indicado."""
         self._check_index(idx)
-        return self.__points__[idx]
+        return self._points[idx]
 
     def count_at(self, idx: int) -> int:
         """Devuelve cuántas fichas hay en el punto indicado."""
         self._check_index(idx)
-        return len(self.__points__[idx])
+        return len(self._points[idx])
 
     def owner_at(self, idx: int) -> str | None:
         """Devuelve el color del punto o None si está vacío."""
         self._check_index(idx)
-        stack = self.__points__[idx]
+        stack = self._points[idx]
         if not stack:
             return None
         return stack[-1].get_color()
@@ -54,30 +200,68 @@ class Board:
     def add_checker(self, idx: int, checker: Checker) -> None:
         """Agrega una ficha al punto indicado."""
         self._check_index(idx)
-        self.__points__[idx].append(checker)
+        before = self._signed(idx)
+        self._points[idx].append(checker)
+        self._touch_point(idx, before, self._signed(idx))
+        self._agg_point(checker.get_color(), idx, 1)
 
     def remove_checker(self, idx: int) -> Checker:
         """Quita y devuelve la ficha del tope en el punto indicado."""
         self._check_index(idx)
-        if not self.__points__[idx]:
+        if not self._points[idx]:
             raise ValueError("No hay fichas para retirar en ese punto.")
-        return self.__points__[idx].pop()
+        before = self._signed(idx)
+        checker = self._points[idx].pop()
+        self._touch_point(idx, before, self._signed(idx))
+        self._agg_point(checker.get_color(), idx, -1)
+        return checker
 
     # ---------- barra del tablero: fichas capturadas pendientes ----------
     def send_to_bar(self, checker: Checker) -> None:
         """Envía una ficha a la barra según su color."""
         color = checker.get_color()
-        if color not in self.__bar__:
+        if color not in self._bar:
             raise ValueError("Color inválido para la barra.")
-        self.__bar__[color].append(checker)
+        stack = self._bar[color]
+        stack.append(checker)
+        self._touch_bar(color, len(stack) - 1, len(stack))
+        self._agg_bar(color, 1)
 
     def pop_from_bar(self, color: str) -> Checker:
         """Saca y devuelve una ficha de la barra del color indicado."""
-        if color not in self.__bar__:
+        if color not in self._bar:
             raise ValueError("Color inválido para la barra.")
-        if not self.__bar__[color]:
+        if not self._bar[color]:
             raise ValueError("No hay fichas en la barra de ese color.")
-        return self.__bar__[color].pop()
+        stack = self._bar[color]
+        checker = stack.pop()
+        self._touch_bar(color, len(stack) + 1, len(stack))
+        self._agg_bar(color, -1)
+        return checker
+
+    # ---------- bear-off: fichas que salieron del tablero ----------
+    def bear_off(self, idx: int) -> Checker:
+        """Saca del tablero la ficha del tope del punto y la cuenta como retirada."""
+        checker = self.remove_checker(idx)
+        color = checker.get_color()
+        self._off[color] += 1
+        self._touch_off(color, self._off[color] - 1, self._off[color])
+        return checker
+
+    def restore_off(self, idx: int, checker: Checker) -> None:
+        """Deshace un bear_off: descuenta la retirada y vuelve a poner la ficha en idx."""
+        color = checker.get_color()
+        if not self._off.get(color):
+            raise ValueError("No hay fichas retiradas de ese color.")
+        self.add_checker(idx, checker)
+        self._off[color] -= 1
+        self._touch_off(color, self._off[color] + 1, self._off[color])
+
+    def get_off(self, color: str) -> int:
+        """Devuelve cuántas fichas del color ya salieron del tablero (bear-off)."""
+        if color not in self._off:
+            raise ValueError("Color inválido.")
+        return self._off[color]
 
     # ---------- movimientos simples (sin validar reglas) ----------
     def move_checker(self, start: int, end: int, checker: Checker) -> None:
@@ -87,28 +271,66 @@ class Board:
         """
         self._check_index(start)
         self._check_index(end)
-        if checker not in self.__points__[start]:
+        if checker not in self._points[start]:
             raise ValueError("La ficha no está en el punto de origen.")
-        self.__points__[start].remove(checker)
-        self.__points__[end].append(checker)
+        before_s, before_e = self._signed(start), self._signed(end)
+        self._points[start].remove(checker)
+        self._points[end].append(checker)
+        self._touch_point(start, before_s, self._signed(start))
+        self._touch_point(end, before_e, self._signed(end))
+        color = checker.get_color()
+        self._agg_point(color, start, -1)
+        self._agg_point(color, end, 1)
 
     # ----------  Posición inicial de fichas  ----------
     def setup_standard(self) -> None:
         """Carga una posición inicial típica (ajustar según tu convención de índices).""" 
         self.setup_board()
-        def drop(idx: int, color: str, n: int):
-            for _ in range(n):
-                self.__points__[idx].append(Checker(color))
-
-        drop(0,  "blanco", 2)
-        drop(11, "blanco", 5)
-        drop(16, "blanco", 3)
-        drop(18, "blanco", 5)
-
-        drop(23, "negro", 2)
-        drop(12, "negro", 5)
-        drop(7,  "negro", 3)
-        drop(5,  "negro", 5)
+        for idx, color, n in STANDARD_SETUP:
+            self._points[idx] = [Checker.of(color)] * n
+        self._resync()
+
+    # ---------- copia / representación plana ----------
+    def copy(self) -> "Board":
+        """Devuelve un tablero independiente con la misma posición (comparte las fichas)."""
+        other = type(self).__new__(type(self))
+        other._points = [list(stack) for stack in self._points]
+        other._bar = {c: list(stack) for c, stack in self._bar.items()}
+        other._off = dict(self._off)
+        self._copy_caches(other)
+        return other
+
+    def to_array(self) -> array:
+        """
+        Devuelve la posición como array('b') de N_SLOTS:
+        puntos con signo (+blanco / -negro), barra y fichas retiradas por color.
+        """
+        cells = array("b", bytes(N_SLOTS))
+        for i in range(24):
+            n = self.count_at(i)
+            if n:
+                cells[i] = n if self.owner_at(i) == "blanco" else -n
+        for color in ("blanco", "negro"):
+            cells[SLOT_BAR[color]] = len(self._bar[color])
+            cells[SLOT_OFF[color]] = self._off[color]
+        return cells
+
+    @classmethod
+    def from_array(cls, cells) -> "Board":
+        """Crea un tablero a partir de N_SLOTS valores (inversa de to_array())."""
+        if len(cells) != N_SLOTS:
+            raise ValueError(f"Se esperaban {N_SLOTS} slots.")
+        board = cls()
+        for i in range(24):
+            v = cells[i]
+            if v:
+                color = "blanco" if v > 0 else "negro"
+                board._points[i] = [Checker.of(color)] * abs(v)
+        for color in ("blanco", "negro"):
+            board._bar[color] = [Checker.of(color)] * cells[SLOT_BAR[color]]
+            board._off[color] = cells[SLOT_OFF[color]]
+        board._resync()
+        return board
 
     def get_quadrant(self, idx: int) -> int:
         """Devuelve el número de cuadrante (1..4) del punto idx."""
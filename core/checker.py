@@ -1,13 +1,38 @@
+COLORS = ("blanco", "negro")
+CHECKERS_PER_PLAYER = 15
+
+
 class Checker:
+    """
+    Ficha de Backgammon. Su único estado es el color, así que el tablero y los
+    jugadores usan las dos fichas compartidas de Checker.of(color) (inmutables)
+    en vez de crear un objeto por ficha.
+    """
+
+    __slots__ = ("__color",)
+
     def __init__(self, color: str):
-        if color not in ("blanco", "negro"):
+        if color not in COLORS:
             raise ValueError("El color debe ser 'blanco' o 'negro'")
         self.__color  = color
 
+    @classmethod
+    def of(cls, color: str) -> "Checker":
+        """Ficha compartida (inmutable) de 'color'; siempre es el mismo objeto."""
+        try:
+            return _SHARED[color]
+        except KeyError:
+            raise ValueError("El color debe ser 'blanco' o 'negro'") from None
+
     def get_color(self) -> str:
         return self.__color
 
     def set_color(self, color: str):
-        if color not in ("blanco", "negro"):
+        if color not in COLORS:
             raise ValueError("El color debe ser 'blanco' o 'negro'")
-        self.__color = color 
+        if _SHARED.get(self.__color) is self:
+            raise ValueError("Las fichas compartidas no cambian de color; usá Checker.of(color).")
+        self.__color = color
+
+
+_SHARED = {color: Checker(color) for color in COLORS}
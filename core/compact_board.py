@@ -0,0 +1,221 @@
+from array import array
+from typing import List, Dict
+from core.board import Board, STANDARD_SETUP
+from core.slots import SLOT_BAR, SLOT_OFF, N_SLOTS
+from core.checker import Checker
+
+
+class CompactBoard(Board):
+    """
+    Tablero con la misma API que Board pero guardado en un array('b') plano.
+
+    Layout (N_SLOTS = 28):
+    - 0..23: conteo con signo por punto (+n blanco / -n negro / 0 vacío)
+    - 24/25: fichas en la barra (blanco / negro)
+    - 26/27: fichas retiradas por bear-off (blanco / negro)
+
+    No guarda un objeto por ficha: como la ficha sólo tiene color, se usa una
+    ficha representante por color (la última que entró al tablero).
+    get_points(), get_point() y get_bar() devuelven vistas armadas al vuelo
+    (copias), no referencias al estado interno.
+    """
+
+    __slots__ = ("_cells", "_proto")
+
+    def __init__(self):
+        """Crea el buffer de slots y deja el tablero vacío."""
+        self._cells: array = array("b", bytes(N_SLOTS))
+        self._proto: Dict[str, Checker] = {"blanco": Checker.of("blanco"), "negro": Checker.of("negro")}
+        self.setup_board()
+
+    def setup_board(self):
+        """Deja todos los slots en cero (tablero vacío, barra vacía, sin retiradas)."""
+        self._cells = array("b", bytes(N_SLOTS))
+        self._reset_caches()
+
+    # ---------- helpers internos ----------
+    def _color_of(self, checker: Checker) -> str:
+        color = checker.get_color()
+        if color not in SLOT_BAR:
+            raise ValueError("Color inválido para el tablero.")
+        self._proto[color] = checker
+        return color
+
+    def _signed(self, idx: int) -> int:
+        return self._cells[idx]
+
+    def _color_count(self, color: str, idx: int) -> int:
+        n = self._cells[idx]
+        return max(n, 0) if color == "blanco" else max(-n, 0)
+
+    # ---------- vistas compatibles con Board ----------
+    def get_points(self) -> List[List[Checker]]:
+        """Devuelve una vista (copia) de los 24 puntos como listas de fichas."""
+        return [self.get_point(i) for i in range(24)]
+
+    def get_bar(self) -> Dict[str, List[Checker]]:
+        """Devuelve una vista (copia) de la barra por color."""
+        cells = self._cells
+        return {
+            c: [self._proto[c]] * cells[SLOT_BAR[c]]
+            for c in ("blanco", "negro")
+        }
+
+    def get_point(self, idx: int) -> List[Checker]:
+        """Devuelve una vista (copia) de la pila del punto indicado."""
+        self._check_index(idx)
+        n = self._cells[idx]
+        if n > 0:
+            return [self._proto["blanco"]] * n
+        return [self._proto["negro"]] * -n
+
+    def get_cells(self) -> array:
+        """Devuelve el buffer de slots (referencia)."""
+        return self._cells
+
+    def count_at(self, idx: int) -> int:
+        """Devuelve cuántas fichas hay en el punto indicado."""
+        self._check_index(idx)
+        return abs(self._cells[idx])
+
+    def owner_at(self, idx: int) -> str | None:
+        """Devuelve el color del punto o None si está vacío."""
+        self._check_index(idx)
+        n = self._cells[idx]
+        if n > 0:
+            return "blanco"
+        if n < 0:
+            return "negro"
+        return None
+
+    # ---------- mutaciones ----------
+    def add_checker(self, idx: int, checker: Checker) -> None:
+        """Agrega una ficha al punto indicado (no admite mezclar colores en un punto)."""
+        self._check_index(idx)
+        color = self._color_of(checker)
+        n = self._cells[idx]
+        if color == "blanco":
+            if n < 0:
+                raise ValueError("El punto está ocupado por fichas negras.")
+            self._cells[idx] = n + 1
+            self._touch_point(idx, n, n + 1)
+            self._agg_point(color, idx, 1)
+        else:
+            if n > 0:
+                raise ValueError("El punto está ocupado por fichas blancas.")
+            self._cells[idx] = n - 1
+            self._touch_point(idx, n, n - 1)
+            self._agg_point(color, idx, 1)
+
+    def remove_checker(self, idx: int) -> Checker:
+        """Quita y devuelve la ficha del tope en el punto indicado."""
+        self._check_index(idx)
+        n = self._cells[idx]
+        if n > 0:
+            self._cells[idx] = n - 1
+            self._touch_point(idx, n, n - 1)
+            self._agg_point("blanco", idx, -1)
+            return self._proto["blanco"]
+        if n < 0:
+            self._cells[idx] = n + 1
+            self._touch_point(idx, n, n + 1)
+            self._agg_point("negro", idx, -1)
+            return self._proto["negro"]
+        raise ValueError("No hay fichas para retirar en ese punto.")
+
+    def send_to_bar(self, checker: Checker) -> None:
+        """Envía una ficha a la barra según su color."""
+        color = checker.get_color()
+        if color not in SLOT_BAR:
+            raise ValueError("Color inválido para la barra.")
+        self._proto[color] = checker
+        slot = SLOT_BAR[color]
+        self._cells[slot] += 1
+        self._touch_bar(color, self._cells[slot] - 1, self._cells[slot])
+        self._agg_bar(color, 1)
+
+    def pop_from_bar(self, color: str) -> Checker:
+        """Saca y devuelve una ficha de la barra del color indicado."""
+        if color not in SLOT_BAR:
+            raise ValueError("Color inválido para la barra.")
+        slot = SLOT_BAR[color]
+        if not self._cells[slot]:
+            raise ValueError("No hay fichas en la barra de ese color.")
+        self._cells[slot] -= 1
+        self._touch_bar(color, self._cells[slot] + 1, self._cells[slot])
+        self._agg_bar(color, -1)
+        return self._proto[color]
+
+    def move_checker(self, start: int, end: int, checker: Checker) -> None:
+        """
+        Mueve una ficha de start a end (sin validar reglas).
+        Valida índices y que haya una ficha de ese color en el origen.
+        """
+        self._check_index(start)
+        self._check_index(end)
+        if self.owner_at(start) != checker.get_color():
+            raise ValueError("La ficha no está en el punto de origen.")
+        self.remove_checker(start)
+        self.add_checker(end, checker)
+
+    def bear_off(self, idx: int) -> Checker:
+        """Saca del tablero la ficha del tope del punto y la cuenta como retirada."""
+        checker = self.remove_checker(idx)
+        color = checker.get_color()
+        slot = SLOT_OFF[color]
+        self._cells[slot] += 1
+        self._touch_off(color, self._cells[slot] - 1, self._cells[slot])
+        return checker
+
+    def restore_off(self, idx: int, checker: Checker) -> None:
+        """Deshace un bear_off: descuenta la retirada y vuelve a poner la ficha en idx."""
+        color = checker.get_color()
+        slot = SLOT_OFF.get(color)
+        if slot is None or not self._cells[slot]:
+            raise ValueError("No hay fichas retiradas de ese color.")
+        self.add_checker(idx, checker)
+        self._cells[slot] -= 1
+        self._touch_off(color, self._cells[slot] + 1, self._cells[slot])
+
+    def count_on_bar(self, color: str) -> int:
+        """Fichas de 'color' en la barra."""
+        self._check_color(color)
+        return self._cells[SLOT_BAR[color]]
+
+    def get_off(self, color: str) -> int:
+        """Devuelve cuántas fichas del color ya salieron del tablero (bear-off)."""
+        if color not in SLOT_OFF:
+            raise ValueError("Color inválido.")
+        return self._cells[SLOT_OFF[color]]
+
+    # ---------- posición inicial / copia ----------
+    def setup_standard(self) -> None:
+        """Carga la posición inicial estándar directamente en los slots."""
+        self.setup_board()
+        for idx, color, n in STANDARD_SETUP:
+            self._cells[idx] = n if color == "blanco" else -n
+        self._resync()
+
+    def copy(self) -> "CompactBoard":
+        """Devuelve un tablero independiente con la misma posición (copia del buffer)."""
+        other = CompactBoard.__new__(CompactBoard)
+        other._cells = array("b", self._cells)
+        other._proto = dict(self._proto)
+        self._copy_caches(other)
+        return other
+
+    def to_array(self) -> array:
+        """Devuelve una copia del buffer de slots."""
+        return array("b", self._cells)
+
+    @classmethod
+    def from_array(cls, cells) -> "CompactBoard":
+        """Crea un tablero a partir de N_SLOTS valores (array, bytes o lista de enteros)."""
+        if len(cells) != N_SLOTS:
+            raise ValueError(f"Se esperaban {N_SLOTS} slots.")
+        board = cls()
+        if isinstance(cells, bytearray):
+            cells = bytes(cells)
+        board._cells = array("b", cells)
+        board._resync()
+        return board
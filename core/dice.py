@@ -1,4 +1,11 @@
 import random
+from typing import Iterable, List, Sequence
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
 
 class Dice:
  
@@ -23,6 +30,102 @@ class Dice:
         if all(1 <= v <= 6 for v in values):
             self.__values = values
         else:
-            raise ValueError("Los valores deben estar entre 1 y 6") 
-        
-        
\ No newline at end of file
+            raise ValueError("Los valores deben estar entre 1 y 6")
+
+
+def _expand(d1: int, d2: int) -> List[int]:
+    return [d1] * 4 if d1 == d2 else [d1, d2]
+
+
+def _check_roll(r: Sequence[int]) -> None:
+    """Una tirada es un par (d1, d2) o un doble ya expandido (cuatro valores iguales)."""
+    if (len(r) not in (2, 4) or not all(1 <= v <= 6 for v in r)
+            or len(r) == 4 and len(set(r)) != 1):
+        raise ValueError(f"Tirada inválida en el guion: {list(r)}")
+
+
+class BufferedDice:
+    """
+    Dados con semilla que generan las tiradas en bloques de NumPy.
+    Cumple DiceLike (core/game.py). Cada instancia tiene su propio generador
+    (PCG64 sobre un SeedSequence), así que no comparte estado con el módulo
+    random ni con otros procesos. La secuencia depende sólo de la semilla, no
+    del tamaño del bloque.
+    - BufferedDice.for_game(seed, game_id): flujo propio de una partida,
+      igual sin importar en qué proceso se juegue.
+    - spawn(n): n flujos hijos estadísticamente independientes (uno por worker).
+    """
+
+    def __init__(self, seed=None, block: int = 1024, seed_seq=None):
+        if np is None:
+            raise ImportError("NumPy no está instalado. pip install numpy")
+        if block < 1:
+            raise ValueError("El bloque debe tener al menos una tirada.")
+        self._seq = seed_seq if seed_seq is not None else np.random.SeedSequence(seed)
+        self._gen = np.random.Generator(np.random.PCG64(self._seq))
+        self._block = block
+        self._buf: List[Sequence[int]] = []
+        self._pos = 0
+        self.__values: List[int] = []
+
+    @classmethod
+    def for_game(cls, seed: int, game_id: int, block: int = 128) -> "BufferedDice":
+        """Flujo independiente para la partida game_id de la semilla seed."""
+        if np is None:
+            raise ImportError("NumPy no está instalado. pip install numpy")
+        return cls(block=block, seed_seq=np.random.SeedSequence(seed, spawn_key=(game_id,)))
+
+    def spawn(self, n: int) -> List["BufferedDice"]:
+        """n dados hijos con flujos independientes entre sí y del padre."""
+        return [BufferedDice(block=self._block, seed_seq=s) for s in self._seq.spawn(n)]
+
+    def _refill(self) -> None:
+        self._buf = self._gen.integers(1, 7, size=(self._block, 2)).tolist()
+        self._pos = 0
+
+    def roll(self) -> List[int]:
+        if self._pos == len(self._buf):
+            self._refill()
+        d1, d2 = self._buf[self._pos]
+        self._pos += 1
+        self.__values = _expand(d1, d2)
+        return self.__values
+
+    def get_values(self) -> List[int]:
+        return self.__values
+
+
+class ScriptedDice:
+    """
+    Dados que repiten una secuencia fija de tiradas (replays, bugs reproducibles).
+    Cada tirada es un par (d1, d2); los dobles se expanden a cuatro valores.
+    Cuando se acaba el guion, roll() levanta ValueError.
+    """
+
+    def __init__(self, rolls: Iterable[Sequence[int]]):
+        self._rolls: List[tuple] = []
+        for r in rolls:
+            _check_roll(r)
+            self._rolls.append((r[0], r[1]))
+        self._pos = 0
+        self.__values: List[int] = []
+
+    def roll(self) -> List[int]:
+        if self._pos >= len(self._rolls):
+            raise ValueError("Se terminaron las tiradas del guion.")
+        d1, d2 = self._rolls[self._pos]
+        self._pos += 1
+        self.__values = _expand(d1, d2)
+        return self.__values
+
+    def force(self, roll: Sequence[int]) -> None:
+        """Intercala 'roll' como la próxima tirada (el resto del guion sigue igual)."""
+        _check_roll(roll)
+        self._rolls.insert(self._pos, (roll[0], roll[1]))
+
+    def remaining(self) -> int:
+        """Tiradas que quedan por usar."""
+        return len(self._rolls) - self._pos
+
+    def get_values(self) -> List[int]:
+        return self.__values
@@ -1,7 +1,9 @@
-from typing import Protocol, List, Optional
+from typing import NamedTuple, Protocol, List, Optional, Tuple
 from core.board import Board
+from core.checker import Checker
 from core.player import Player
 from core.dice import Dice  
+from core.plays import Play, Step, legal_plays
 
 
 # --- DIP: contrato mínimo para cualquier “dado” compatible con el juego ---
@@ -9,12 +11,31 @@ class DiceLike(Protocol):
     def roll(self) -> List[int]: ...
 
 
+class UndoToken(NamedTuple):
+    """
+    Lo necesario para deshacer un apply(): el paso, quién movió, si comió,
+    la posición del dado consumido, la ficha movida (se reusa al deshacer) y,
+    si el turno cambió, los dados que quedaban en ese momento.
+    Un pase de turno se registra con start/end/die en None.
+    """
+    start: Optional[int]
+    end: Optional[int]
+    die: Optional[int]
+    color: str
+    hit: bool
+    die_index: int
+    checker: Optional[Checker]
+    prev_rolled: Optional[Tuple[int, ...]]
+
+
 class BackgammonGame:
     """
     Coordina el flujo general del juego.
     Mantiene tablero, jugadores, dados y turno.
     """
 
+    __slots__ = ("_board", "_white", "_black", "_dice", "_current", "_rolled", "_recorder", "_version")
+
     def __init__(self, board: Board, white: Player, black: Player, dice: DiceLike):
         """Inicializa la partida sin aplicar reglas todavía."""
         self._board: Board = board
@@ -23,6 +44,9 @@ class BackgammonGame:
         self._dice: DiceLike = dice
         self._current: Player = white   # por ahora empieza blanco
         self._rolled: List[int] = []    # último resultado de dados
+        self._recorder = None           # ver set_recorder() / core/record.py
+        self._version: int = 0          # sube con cada cambio de estado (get_version)
+        self._board.set_side_to_move(self._current.get_color())
 
     # -------- getters públicos  --------
 
@@ -38,24 +62,61 @@ class BackgammonGame:
         """Devuelve el oponente al jugador de turno."""
         return self._black if self._current == self._white else self._white
 
+    def get_version(self) -> int:
+        """
+        Contador que cambia con cada tirada, movimiento, pase de turno, apply/undo
+        o restore_turn. Sirve para saber si hay que redibujar sin comparar tableros.
+        Los cambios hechos directo sobre el Board no lo mueven.
+        """
+        return self._version
+
     # ------------------ flujo de turnos / dados ------------------
 
+    def set_recorder(self, recorder) -> None:
+        """
+        Engancha un grabador (core.record.GameWriter) que recibe las tiradas,
+        movimientos y pases de turno hechos con roll_dice(), move() y end_turn().
+        None lo desengancha. apply()/undo() no se graban (son para búsqueda).
+        """
+        self._recorder = recorder
+
     def end_turn(self) -> None:
         """Pasa el turno al otro jugador y limpia los dados."""
+        if self._recorder is not None:
+            self._recorder.on_end_turn(self._current.get_color())
+        self._switch_turn()
+
+    def _switch_turn(self) -> None:
+        self._version += 1
         self._current = self.get_opponent()
         self._rolled = []
+        self._board.set_side_to_move(self._current.get_color())
 
     def roll_dice(self) -> List[int]:
         """Tira los dados y guarda los valores del turno."""
         if self._rolled:
             raise ValueError("Ya hay una tirada activa; usá esos dados o pasá el turno.")
         self._rolled = list(self._dice.roll())
+        self._version += 1
+        if self._recorder is not None:
+            self._recorder.on_roll(self._current.get_color(), self._rolled)
         return self._rolled
 
     def get_rolled_values(self) -> List[int]:
         """Devuelve los valores de la tirada actual (si existen)."""
         return list(self._rolled)
 
+    def restore_turn(self, color: str, dice: List[int]) -> None:
+        """Fija el jugador al turno y los dados que le quedan (estados guardados, replays)."""
+        if color not in ("blanco", "negro"):
+            raise ValueError("Color inválido.")
+        if not all(1 <= d <= 6 for d in dice) or len(dice) > 4:
+            raise ValueError("Dados inválidos.")
+        self._current = self._player_of(color)
+        self._rolled = list(dice)
+        self._board.set_side_to_move(color)
+        self._version += 1
+
     # ----------------- validaciones auxiliares -----------------
 
     def _require_turn_color(self, color: str) -> None:
@@ -112,7 +173,8 @@ class BackgammonGame:
             dest_owner = self._board.owner_at(end)
             if dest_owner == opponent and dest_count >= 2:
                 raise ValueError(f"Punto bloqueado por {opponent}: {end} tiene {dest_count} fichas.")
-            if dest_owner == opponent and dest_count == 1:
+            comio = dest_owner == opponent and dest_count == 1
+            if comio:
                 capt = self._board.remove_checker(end)
                 self._board.send_to_bar(capt)
 
@@ -122,6 +184,9 @@ class BackgammonGame:
 
             # consumir dado y chequear fin de turno
             self._rolled.remove(dado_usado)
+            self._version += 1
+            if self._recorder is not None:
+                self._recorder.on_move(checker_color, start, end, dado_usado, comio)
             if not self._rolled:
                 self.end_turn()
             return
@@ -161,10 +226,13 @@ class BackgammonGame:
             target = next((ch for ch in stack if ch.get_color() == checker_color), None)
             if target is None:
                 raise ValueError("No hay ficha del color indicado en el punto de origen.")
-            self._board.remove_checker(start)
+            self._board.bear_off(start)
 
             # consumir dado y chequear fin de turno
             self._rolled.remove(dado_usado)
+            self._version += 1
+            if self._recorder is not None:
+                self._recorder.on_move(checker_color, start, end, dado_usado, False)
             if not self._rolled:
                 self.end_turn()
             return
@@ -185,7 +253,8 @@ class BackgammonGame:
         dest_owner = self._board.owner_at(end)
         if dest_owner == opponent and dest_count >= 2:
             raise ValueError(f"Punto bloqueado por {opponent}: {end} tiene {dest_count} fichas.")
-        if dest_owner == opponent and dest_count == 1:
+        comio = dest_owner == opponent and dest_count == 1
+        if comio:
             capturada = self._board.remove_checker(end)
             self._board.send_to_bar(capturada)
 
@@ -194,6 +263,9 @@ class BackgammonGame:
 
         # consumir dado y, si no quedan, pasar turno
         self._rolled.remove(dist)
+        self._version += 1
+        if self._recorder is not None:
+            self._recorder.on_move(checker_color, start, end, dist, comio)
         if not self._rolled:
             self.end_turn()
 
@@ -203,13 +275,9 @@ class BackgammonGame:
         return range(18, 24) if color == "blanco" else range(0, 6)
 
     def _all_in_home(self, color: str) -> bool:
-        rang = self._home_range(color)
-        for i in range(24):
-            owner = self._board.owner_at(i)
-            if owner == color and i not in rang:
-                return False
-        # además no debe haber fichas de ese color en la barra
-        return len(self._board.get_bar()[color]) == 0
+        # ninguna fuera del cuadrante final y ninguna en la barra (agregados O(1) del tablero)
+        board = self._board
+        return board.count_outside_home(color) == 0 and board.count_on_bar(color) == 0
 
     def _entry_point(self, color: str, die: int) -> int:
         if color == "blanco":
@@ -217,7 +285,7 @@ class BackgammonGame:
         return die - 1       # negro: 1->0 ... 6->5
 
     def _has_on_bar(self, color: str) -> bool:
-        return len(self._board.get_bar()[color]) > 0
+        return self._board.count_on_bar(color) > 0
 
     # ----------------- estado de finalización -----------------
 
@@ -227,18 +295,14 @@ class BackgammonGame:
 
     def _any_on_board(self, color: str) -> bool:
         """¿Queda al menos una ficha de 'color' en algún punto 0..23?"""
-        for i in range(24):
-            if self._board.owner_at(i) == color:
-                return True
-        return False
+        return self._board.count_on_board(color) > 0
 
     def has_won(self, color: str) -> bool:
         """
         Un color gana cuando no quedan fichas suyas en el tablero ni en la barra.
         (Las que se fueron por borne-off ya no están en el tablero.)
         """
-        bar = self._board.get_bar()
-        return not self._any_on_board(color) and len(bar[color]) == 0
+        return not self._any_on_board(color) and self._board.count_on_bar(color) == 0
 
     def get_winner(self) -> Optional[str]:
         """Devuelve 'blanco' o 'negro' si ya ganó; si no hay ganador, None."""
@@ -320,3 +384,97 @@ class BackgammonGame:
     def can_play(self) -> bool:
         """Indica si el jugador al turno tiene al menos un movimiento legal con los dados activos."""
         return len(self.legal_moves()) > 0
+
+    def legal_plays(self) -> list[Play]:
+        """
+        Jugadas completas del turno con los dados activos (tuplas de (start, end, die)).
+        Aplica la regla de usar la mayor cantidad de dados (o el mayor si sólo entra uno)
+        y devuelve una sola jugada por posición final distinta.
+        """
+        color = self._current.get_color()
+        return legal_plays(self._board.to_array(), color, self._rolled)
+
+    # ----------------- make / unmake (búsqueda sin copias) -----------------
+
+    def _player_of(self, color: str) -> Player:
+        return self._white if color == "blanco" else self._black
+
+    def apply(self, move: Step) -> UndoToken:
+        """
+        Aplica un paso (start, end, die) del jugador al turno y devuelve el token para undo().
+        No valida reglas: usar con pasos salidos de legal_moves()/legal_plays().
+        Consume exactamente 'die' y, si no quedan dados, pasa el turno.
+        """
+        start, end, die = move
+        color = self._current.get_color()
+        board = self._board
+        hit = False
+        if start == -1:
+            checker = board.pop_from_bar(color)
+        elif end == (24 if color == "blanco" else -1):
+            checker = board.bear_off(start)
+        else:
+            checker = board.remove_checker(start)
+        if end not in (-1, 24):
+            if board.owner_at(end) not in (None, color):
+                board.send_to_bar(board.remove_checker(end))
+                hit = True
+            board.add_checker(end, checker)
+
+        die_index = self._rolled.index(die)
+        del self._rolled[die_index]
+        self._version += 1
+        prev_rolled = None
+        if not self._rolled:
+            self._switch_turn()
+            prev_rolled = ()
+        return UndoToken(start, end, die, color, hit, die_index, checker, prev_rolled)
+
+    def apply_end_turn(self) -> UndoToken:
+        """Pasa el turno (aunque queden dados) y devuelve el token para undo()."""
+        color = self._current.get_color()
+        prev = tuple(self._rolled)
+        self._switch_turn()
+        return UndoToken(None, None, None, color, False, -1, None, prev)
+
+    def undo(self, token: UndoToken) -> None:
+        """Deshace un apply()/apply_end_turn(). Los tokens se deshacen en orden inverso (LIFO)."""
+        color = token.color
+        self._version += 1
+        if token.prev_rolled is not None:
+            self._current = self._player_of(color)
+            self._rolled = list(token.prev_rolled)
+            self._board.set_side_to_move(color)
+        if token.start is None:
+            return
+
+        board = self._board
+        start, end = token.start, token.end
+        if end in (-1, 24) and start != -1:
+            board.restore_off(start, token.checker)
+        else:
+            checker = board.remove_checker(end)
+            if token.hit:
+                rival = "negro" if color == "blanco" else "blanco"
+                board.add_checker(end, board.pop_from_bar(rival))
+            if start == -1:
+                board.send_to_bar(checker)
+            else:
+                board.add_checker(start, checker)
+        self._rolled.insert(token.die_index, token.die)
+
+    def apply_play(self, play: Play) -> List[UndoToken]:
+        """
+        Aplica una jugada completa (de legal_plays()) y, si sobran dados que no se
+        pueden usar, pasa el turno. Devuelve los tokens para undo_play().
+        """
+        color = self._current.get_color()
+        tokens = [self.apply(step) for step in play]
+        if self._current.get_color() == color:
+            tokens.append(self.apply_end_turn())
+        return tokens
+
+    def undo_play(self, tokens: List[UndoToken]) -> None:
+        """Deshace una jugada aplicada con apply_play()."""
+        for token in reversed(tokens):
+            self.undo(token)
@@ -0,0 +1,131 @@
+"""
+Instrumentación opcional de BackgammonGame: cantidad de llamadas y tiempo
+acumulado de move, legal_moves, can_play, get_winner y roll_dice, más los
+movimientos rechazados agrupados por motivo (mensaje del ValueError).
+
+No envuelve nada en el camino caliente: instrument(game) le cambia la clase
+a la partida por una subclase que mide, y uninstrument(game) se la devuelve.
+Una partida sin instrumentar es una BackgammonGame común (costo cero).
+
+    stats = GameStats()
+    instrument(game, stats)
+    ...
+    stats.snapshot()   # {"ops": {...}, "rejected": {...}}
+
+Las llamadas anidadas se cuentan las dos veces: can_play() llama a
+legal_moves(), así que su tiempo incluye el de legal_moves.
+"""
+
+import re
+import time
+from typing import Dict, Optional, Type
+
+from core.game import BackgammonGame
+
+OPS = ("move", "legal_moves", "can_play", "get_winner", "roll_dice")
+
+_NUMBERS = re.compile(r"-?\d+")
+_LISTS = re.compile(r"\[[^\]]*\]")
+
+
+def rejection_reason(message: str) -> str:
+    """Motivo genérico de un ValueError: saca los números y las tiradas del mensaje."""
+    return _NUMBERS.sub("N", _LISTS.sub("[...]", message))
+
+
+class GameStats:
+    """Contadores compartidos por todas las partidas instrumentadas con él."""
+
+    def __init__(self):
+        self._classes: Dict[type, type] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls: Dict[str, int] = dict.fromkeys(OPS, 0)
+        self.seconds: Dict[str, float] = dict.fromkeys(OPS, 0.0)
+        self.rejected: Dict[str, int] = {}
+
+    def snapshot(self) -> dict:
+        """Copia de los contadores: por operación llamadas, segundos y microsegundos promedio."""
+        ops = {}
+        for op in OPS:
+            calls, secs = self.calls[op], self.seconds[op]
+            ops[op] = {"calls": calls, "seconds": secs,
+                       "mean_us": secs / calls * 1e6 if calls else 0.0}
+        return {"ops": ops, "rejected": dict(self.rejected)}
+
+    def format(self) -> str:
+        """Tabla de texto del snapshot (la usa el comando 'stats' de la CLI)."""
+        snap = self.snapshot()
+        lines = [f"{'operación':<12} {'llamadas':>9} {'total ms':>10} {'us/llamada':>11}"]
+        for op, row in snap["ops"].items():
+            lines.append(f"{op:<12} {row['calls']:>9} {row['seconds'] * 1e3:>10.2f} {row['mean_us']:>11.1f}")
+        if snap["rejected"]:
+            lines.append("Movimientos rechazados:")
+            for reason, n in sorted(snap["rejected"].items(), key=lambda kv: -kv[1]):
+                lines.append(f"  {n:>5}  {reason}")
+        return "\n".join(lines)
+
+    def _instrumented(self, base: Type[BackgammonGame]) -> type:
+        cls = self._classes.get(base)
+        if cls is None:
+            cls = _make_class(base, self)
+            self._classes[base] = cls
+        return cls
+
+
+def _make_class(base: Type[BackgammonGame], stats: GameStats) -> type:
+    clock = time.perf_counter
+
+    def timed(op: str):
+        original = getattr(base, op)
+
+        def wrapper(self, *args, **kwargs):
+            t0 = clock()
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                stats.calls[op] += 1
+                stats.seconds[op] += clock() - t0
+        wrapper.__name__ = op
+        wrapper.__doc__ = original.__doc__
+        return wrapper
+
+    def move(self, start, end, checker_color):
+        t0 = clock()
+        try:
+            return base.move(self, start, end, checker_color)
+        except ValueError as e:
+            reason = rejection_reason(str(e))
+            stats.rejected[reason] = stats.rejected.get(reason, 0) + 1
+            raise
+        finally:
+            stats.calls["move"] += 1
+            stats.seconds["move"] += clock() - t0
+    move.__doc__ = base.move.__doc__
+
+    namespace = {op: timed(op) for op in OPS if op != "move"}
+    namespace["move"] = move
+    namespace["_instrument_base"] = base
+    namespace["__slots__"] = ()
+    return type(f"Instrumented{base.__name__}", (base,), namespace)
+
+
+def instrument(game: BackgammonGame, stats: Optional[GameStats] = None) -> GameStats:
+    """Empieza a medir 'game' (con 'stats' o unos contadores nuevos) y devuelve los contadores."""
+    if is_instrumented(game):
+        uninstrument(game)
+    stats = stats if stats is not None else GameStats()
+    game.__class__ = stats._instrumented(type(game))
+    return stats
+
+
+def uninstrument(game: BackgammonGame) -> None:
+    """Deja de medir 'game' (vuelve a su clase original)."""
+    base = getattr(type(game), "_instrument_base", None)
+    if base is not None:
+        game.__class__ = base
+
+
+def is_instrumented(game: BackgammonGame) -> bool:
+    return hasattr(type(game), "_instrument_base")
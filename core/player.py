@@ -1,18 +1,21 @@
-from core.checker import Checker
+from core.checker import Checker, CHECKERS_PER_PLAYER
 
 class Player:
     """
     Representa un jugador de Backgammon.
-    Cada jugador tiene un nombre, un color y 15 fichas.
+    Cada jugador tiene un nombre, un color y 15 fichas (referencias a la
+    ficha compartida de su color, la misma que usa el tablero).
     """
 
+    __slots__ = ("__name", "__color", "__checkers")
+
     def __init__(self, name: str, color: str):
         if color not in ("blanco", "negro"):
             raise ValueError("El color debe ser 'blanco' o 'negro'")
         
         self.__name = name
         self.__color = color
-        self.__checkers = [Checker(color) for _ in range(15)]
+        self.__checkers = [Checker.of(color)] * CHECKERS_PER_PLAYER
 
     def get_name(self) -> str:
         return self.__name
@@ -30,9 +33,8 @@ class Player:
         if color not in ("blanco", "negro"):
             raise ValueError("El color debe ser 'blanco' o 'negro'")
         self.__color = color
-        # Actualizar color de las fichas si ya existen
-        for checker in self.__checkers:
-            checker.set_color(color)
+        # las fichas son compartidas e inmutables: se cambian por las del color nuevo
+        self.__checkers = [Checker.of(color)] * len(self.__checkers)
 
     def set_checkers(self, checkers: list):
         self.__checkers = checkers
@@ -0,0 +1,136 @@
+"""
+Generador de jugadas completas de un turno.
+
+Trabaja sobre la representación plana del tablero (ver Board.to_array):
+24 puntos con signo (+blanco / -negro), barra y retiradas por color.
+Las reglas de cada paso son las mismas que BackgammonGame.legal_moves();
+acá además se encadenan los pasos para usar la tirada completa y se aplican
+las reglas de obligatoriedad de dados (máximo de dados / dado mayor).
+"""
+
+from typing import List, Sequence, Tuple
+from core.board import SLOT_BAR, SLOT_OFF
+
+Step = Tuple[int, int, int]          # (start, end, die) como en legal_moves()
+Play = Tuple[Step, ...]              # jugada completa del turno
+
+_HOME = {"blanco": range(18, 24), "negro": range(0, 6)}
+_SIGN = {"blanco": 1, "negro": -1}
+_OPP = {"blanco": "negro", "negro": "blanco"}
+
+
+def _all_in_home(cells: Sequence[int], color: str) -> bool:
+    if cells[SLOT_BAR[color]]:
+        return False
+    if color == "blanco":
+        return not any(cells[i] > 0 for i in range(18))
+    return not any(cells[i] < 0 for i in range(6, 24))
+
+
+def step_moves(cells: Sequence[int], color: str, dice: Sequence[int]) -> List[Step]:
+    """Pasos legales (start, end, die) para 'color' con los dados dados."""
+    if not dice:
+        return []
+    sign = _SIGN[color]
+    values = sorted(set(dice))
+    moves: List[Step] = []
+
+    # --- 1) con fichas en la barra sólo se puede entrar ---
+    if cells[SLOT_BAR[color]]:
+        for d in values:
+            end = 24 - d if color == "blanco" else d - 1
+            if cells[end] * sign > -2:
+                moves.append((-1, end, d))
+        return moves
+
+    # --- 2) movimientos normales y bear-off ---
+    all_home = _all_in_home(cells, color)
+    pts = range(24) if color == "blanco" else range(23, -1, -1)
+    off = 24 if color == "blanco" else -1
+
+    for i in pts:
+        if cells[i] * sign <= 0:
+            continue
+        for d in values:
+            end = i + d * sign
+            if 0 <= end <= 23:
+                if cells[end] * sign > -2:
+                    moves.append((i, end, d))
+            elif all_home and end == off:
+                moves.append((i, off, d))
+            elif all_home:
+                # mismo criterio de "más lejos" que BackgammonGame.legal_moves()
+                hay_mas_lejos = any(
+                    cells[j] * sign > 0 and (j - i) * sign > 0
+                    for j in _HOME[color]
+                )
+                if not hay_mas_lejos:
+                    moves.append((i, off, d))
+    return moves
+
+
+def apply_step(cells: Sequence[int], color: str, step: Step) -> List[int]:
+    """Devuelve una posición nueva con el paso aplicado (no valida reglas)."""
+    start, end, _ = step
+    sign = _SIGN[color]
+    pos = list(cells)
+    if start == -1:
+        pos[SLOT_BAR[color]] -= 1
+    else:
+        pos[start] -= sign
+    if end == (24 if color == "blanco" else -1):
+        pos[SLOT_OFF[color]] += 1
+        return pos
+    if pos[end] * sign == -1:  # blot rival: va a la barra
+        pos[end] = 0
+        pos[SLOT_BAR[_OPP[color]]] += 1
+    pos[end] += sign
+    return pos
+
+
+def legal_plays(cells: Sequence[int], color: str, dice: Sequence[int]) -> List[Play]:
+    """
+    Enumera las jugadas completas del turno para 'color' con 'dice'.
+
+    - Usa la mayor cantidad de dados posible.
+    - Si sólo se puede usar un dado (tirada no doble), se exige el mayor cuando es jugable.
+    - Deduplica por posición final: cada resultado distinto aparece una sola vez.
+    Devuelve [] si no hay ningún paso legal.
+    """
+    finals: dict = {}
+    seen: set = set()
+
+    def rec(pos: List[int], remaining: List[int], play: Play) -> None:
+        key = (tuple(pos), tuple(sorted(remaining)))
+        if key in seen:
+            return
+        seen.add(key)
+        steps = step_moves(pos, color, remaining)
+        if not steps:
+            if play:
+                # por posición final se queda la jugada más larga (y, con un solo
+                # dado, la del dado mayor) para que los filtros de abajo no la pierdan
+                fin = tuple(pos)
+                prev = finals.get(fin)
+                if (prev is None or len(play) > len(prev)
+                        or len(play) == len(prev) == 1 and play[0][2] > prev[0][2]):
+                    finals[fin] = play
+            return
+        for step in steps:
+            rest = list(remaining)
+            rest.remove(step[2])
+            rec(apply_step(pos, color, step), rest, play + (step,))
+
+    rec(list(cells), list(dice), ())
+    if not finals:
+        return []
+
+    plays = list(finals.values())
+    most = max(len(p) for p in plays)
+    plays = [p for p in plays if len(p) == most]
+    if most == 1 and len(set(dice)) > 1:
+        high = max(dice)
+        with_high = [p for p in plays if p[0][2] == high]
+        if with_high:
+            plays = with_high
+    return plays
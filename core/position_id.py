@@ -0,0 +1,184 @@
+"""
+Position ID y match ID compactos (al estilo de GNU Backgammon).
+
+Position key (10 bytes / 80 bits): para cada color, sus 24 puntos contados
+desde su propio punto 1 (el más cercano a la salida) y después la barra; cada
+punto se escribe como n bits en 1 seguidos de un 0. Primero blanco, después
+negro. Con 15 fichas por color entra justo en 80 bits. Las retiradas no se
+guardan: son 15 menos las que quedan en el tablero y la barra.
+El texto es el base64 de la clave sin relleno (14 caracteres); la posición
+inicial es "4HPwATDgc/ABMA", igual que en gnubg.
+
+Match key (2 bytes): color al turno y dados que le quedan. Junto con la
+position key forma la clave del estado completo (12 bytes) y el texto
+"positionID:matchID".
+"""
+
+import base64
+from typing import List, Sequence, Tuple, Type
+
+from core.board import Board
+from core.game import BackgammonGame
+from core.player import Player
+from core.slots import SLOT_BAR, SLOT_OFF, N_SLOTS
+
+CHECKERS = 15
+KEY_BYTES = 10
+MATCH_BYTES = 2
+_KEY_BITS = KEY_BYTES * 8
+
+# orden de los puntos desde el punto 1 de cada color
+_WHITE_ORDER = tuple(range(23, -1, -1))
+_BLACK_ORDER = tuple(range(24))
+_ONES = tuple("1" * n + "0" for n in range(CHECKERS + 1))
+
+
+# ---------- position key ----------
+def encode_cells(cells: Sequence[int]) -> bytes:
+    """Position key de una posición plana (core/slots.py)."""
+    try:
+        bits = "".join(
+            [_ONES[cells[i] if cells[i] > 0 else 0] for i in _WHITE_ORDER]
+            + [_ONES[cells[SLOT_BAR["blanco"]]]]
+            + [_ONES[-cells[i] if cells[i] < 0 else 0] for i in _BLACK_ORDER]
+            + [_ONES[cells[SLOT_BAR["negro"]]]]
+        )
+    except IndexError:
+        raise ValueError(f"Más de {CHECKERS} fichas en un punto.") from None
+    if len(bits) > _KEY_BITS:
+        raise ValueError(f"Más de {CHECKERS} fichas por color en el tablero.")
+    return int(bits[::-1], 2).to_bytes(KEY_BYTES, "little")
+
+
+def decode_cells(key: bytes) -> List[int]:
+    """Posición plana (N_SLOTS valores) a partir de una position key."""
+    if len(key) != KEY_BYTES:
+        raise ValueError(f"La position key tiene que tener {KEY_BYTES} bytes.")
+    runs = format(int.from_bytes(key, "little"), f"0{_KEY_BITS}b")[::-1].split("0")
+    if len(runs) < 51 or any(runs[50:]):
+        raise ValueError("Position key inválida.")
+    cells = [0] * N_SLOTS
+    for p, i in enumerate(_WHITE_ORDER):
+        cells[i] = len(runs[p])
+    for p, i in enumerate(_BLACK_ORDER):
+        n = len(runs[25 + p])
+        if n and cells[i]:
+            raise ValueError("Position key inválida: punto con fichas de los dos colores.")
+        if n:
+            cells[i] = -n
+    cells[SLOT_BAR["blanco"]] = len(runs[24])
+    cells[SLOT_BAR["negro"]] = len(runs[49])
+    on_white = sum(len(r) for r in runs[:25])
+    on_black = sum(len(r) for r in runs[25:50])
+    if on_white > CHECKERS or on_black > CHECKERS:
+        raise ValueError(f"Position key inválida: más de {CHECKERS} fichas por color.")
+    cells[SLOT_OFF["blanco"]] = CHECKERS - on_white
+    cells[SLOT_OFF["negro"]] = CHECKERS - on_black
+    return cells
+
+
+def position_key(board: Board) -> bytes:
+    """Position key (10 bytes) del tablero."""
+    cells = board.get_cells() if hasattr(board, "get_cells") else board.to_array()
+    return encode_cells(cells)
+
+
+def board_from_key(key: bytes, board_cls: Type[Board] = Board) -> Board:
+    """Reconstruye el tablero (Board o CompactBoard) de una position key."""
+    return board_cls.from_array(decode_cells(key))
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _unb64(text: str, size: int) -> bytes:
+    try:
+        raw = base64.b64decode(text + "=" * (-len(text) % 4), validate=True)
+    except ValueError:
+        raise ValueError(f"ID inválido: {text!r}") from None
+    if len(raw) != size:
+        raise ValueError(f"ID inválido: {text!r}")
+    return raw
+
+
+def position_id(board: Board) -> str:
+    """Position ID en texto (14 caracteres base64)."""
+    return _b64(position_key(board))
+
+
+def board_from_position_id(pid: str, board_cls: Type[Board] = Board) -> Board:
+    return board_from_key(_unb64(pid, KEY_BYTES), board_cls)
+
+
+# ---------- match key ----------
+# bit 0: color al turno (0 blanco, 1 negro) | bits 1-3: dados que quedan (0..4)
+# bits 4-6: primer valor | bits 7-9: segundo valor distinto (0 si no hay)
+def encode_match(to_move: str, dice: Sequence[int]) -> bytes:
+    """Match key (2 bytes) con el color al turno y los dados que le quedan."""
+    if to_move not in ("blanco", "negro"):
+        raise ValueError("Color inválido.")
+    values = list(dict.fromkeys(dice))
+    if len(dice) > 4 or len(values) > 2 or not all(1 <= d <= 6 for d in dice) \
+            or (len(values) == 2 and len(dice) != 2):
+        raise ValueError(f"Dados inválidos: {list(dice)}")
+    first = values[0] if values else 0
+    second = values[1] if len(values) == 2 else 0
+    n = (to_move == "negro") | len(dice) << 1 | first << 4 | second << 7
+    return n.to_bytes(MATCH_BYTES, "little")
+
+
+def decode_match(key: bytes) -> Tuple[str, List[int]]:
+    """(color al turno, dados que le quedan) de una match key."""
+    if len(key) != MATCH_BYTES:
+        raise ValueError(f"La match key tiene que tener {MATCH_BYTES} bytes.")
+    n = int.from_bytes(key, "little")
+    count, first, second = n >> 1 & 7, n >> 4 & 7, n >> 7 & 7
+    if n >> 10 or count > 4 or first > 6 or second > 6 or bool(count) != bool(first):
+        raise ValueError("Match key inválida.")
+    if second:
+        if count != 2:
+            raise ValueError("Match key inválida.")
+        dice = [first, second]
+    else:
+        dice = [first] * count
+    return ("negro" if n & 1 else "blanco"), dice
+
+
+def match_id(to_move: str, dice: Sequence[int]) -> str:
+    return _b64(encode_match(to_move, dice))
+
+
+def parse_match_id(mid: str) -> Tuple[str, List[int]]:
+    return decode_match(_unb64(mid, MATCH_BYTES))
+
+
+# ---------- estado completo ----------
+def state_key(game: BackgammonGame) -> bytes:
+    """Clave de 12 bytes: position key + match key."""
+    color = game.get_current_player().get_color()
+    return position_key(game.get_board()) + encode_match(color, game.get_rolled_values())
+
+
+def state_id(game: BackgammonGame) -> str:
+    """Texto "positionID:matchID" del estado de la partida."""
+    color = game.get_current_player().get_color()
+    return f"{position_id(game.get_board())}:{match_id(color, game.get_rolled_values())}"
+
+
+def game_from_state_id(sid: str, dice=None, board_cls: Type[Board] = Board) -> BackgammonGame:
+    """
+    Crea una partida en el estado de sid ("positionID:matchID").
+    'dice' son los dados para las próximas tiradas (por defecto core.dice.Dice).
+    """
+    pid, sep, mid = sid.partition(":")
+    if not sep:
+        raise ValueError(f"Se esperaba 'positionID:matchID', llegó {sid!r}")
+    board = board_from_position_id(pid, board_cls)
+    color, rolled = parse_match_id(mid)
+    if dice is None:
+        from core.dice import Dice
+        dice = Dice()
+    game = BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"), dice)
+    game.restore_turn(color, rolled)
+    return game
@@ -0,0 +1,173 @@
+"""
+Registro binario de partidas: append-only, registros de ancho fijo (12 bytes).
+
+Archivo = cabecera de 12 bytes ("BGRC", versión) + registros:
+    tipo (uint8) | color (uint8: 0 blanco, 1 negro) | datos (10 bytes)
+
+Tipos:
+- START    datos = position key de la posición inicial (core/position_id.py);
+           color = quién empieza
+- ROLL     datos[0:4] = dados de la tirada (los dobles ocupan los cuatro)
+- MOVE     datos = origen (int8), destino (int8), dado (uint8), flags (uint8)
+           flags: HIT (comió), BEAR_OFF (sacó ficha), FROM_BAR (entró de la barra)
+- END_TURN sin datos
+- END      color = ganador; datos[0] = puntos (1 simple, 2 gammon, 3 backgammon)
+
+GameWriter se engancha al juego con game.set_recorder() y graba lo que pasa
+por roll_dice(), move() y end_turn(). read_records() / read_games() leen el
+archivo por bloques, sin cargarlo entero en memoria.
+"""
+
+import io
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from core.position_id import position_key
+
+MAGIC = b"BGRC"
+VERSION = 1
+RECORD_SIZE = 12
+_HEADER = struct.Struct("<4sH6x")
+_RECORD = struct.Struct("<BB10s")
+_MOVE = struct.Struct("<bbBB6x")
+_CHUNK_RECORDS = 4096
+
+START, ROLL, MOVE, END_TURN, END = 1, 2, 3, 4, 5
+KINDS = {START: "start", ROLL: "roll", MOVE: "move", END_TURN: "end_turn", END: "end"}
+
+HIT, BEAR_OFF, FROM_BAR = 1, 2, 4
+
+_COLOR = {"blanco": 0, "negro": 1}
+_COLOR_NAME = ("blanco", "negro")
+
+
+class Record(NamedTuple):
+    kind: int
+    color: str
+    dice: Tuple[int, ...] = ()                  # ROLL
+    move: Optional[Tuple[int, int, int]] = None  # MOVE: (origen, destino, dado)
+    flags: int = 0                               # MOVE: HIT | BEAR_OFF | FROM_BAR; END: puntos
+    key: bytes = b""                             # START: position key
+
+
+# ---------- escritura ----------
+class GameWriter:
+    """
+    Escribe registros al final de un archivo (lo crea con cabecera si está vacío).
+    Acepta una ruta o un archivo binario ya abierto.
+    """
+
+    def __init__(self, target: Union[str, BinaryIO], buffer_size: int = 64 * 1024):
+        if isinstance(target, str):
+            self._f = open(target, "a+b", buffering=buffer_size)
+            self._owns = True
+        else:
+            self._f = target
+            self._owns = False
+        self._f.seek(0, io.SEEK_END)
+        if self._f.tell() == 0:
+            self._f.write(_HEADER.pack(MAGIC, VERSION))
+        else:
+            self._f.seek(0)
+            _check_header(self._f.read(RECORD_SIZE))
+            self._f.seek(0, io.SEEK_END)
+        self.records = 0
+
+    def __enter__(self) -> "GameWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _write(self, kind: int, color: str, data: bytes = b"") -> None:
+        self._f.write(_RECORD.pack(kind, _COLOR[color], data))
+        self.records += 1
+
+    # --- partida completa ---
+    def attach(self, game) -> None:
+        """Graba el estado inicial de 'game' y se engancha para grabar lo que siga."""
+        self.start_game(game)
+        game.set_recorder(self)
+
+    def start_game(self, game) -> None:
+        self._write(START, game.get_current_player().get_color(), position_key(game.get_board()))
+
+    def end_game(self, winner: str, points: int = 1) -> None:
+        self._write(END, winner, bytes([points]))
+
+    # --- hooks de BackgammonGame ---
+    def on_roll(self, color: str, dice: Sequence[int]) -> None:
+        self._write(ROLL, color, bytes(dice))
+
+    def on_move(self, color: str, start: int, end: int, die: int, hit: bool) -> None:
+        flags = HIT if hit else 0
+        if start == -1 and end != -1:
+            flags |= FROM_BAR
+        elif end in (-1, 24):
+            flags |= BEAR_OFF
+        self._write(MOVE, color, _MOVE.pack(start, end, die, flags))
+
+    def on_end_turn(self, color: str) -> None:
+        self._write(END_TURN, color)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        if self._owns:
+            self._f.close()
+        else:
+            self._f.flush()
+
+
+# ---------- lectura ----------
+def _check_header(raw: bytes) -> None:
+    if len(raw) != RECORD_SIZE or _HEADER.unpack(raw) != (MAGIC, VERSION):
+        raise ValueError("No es un registro de partidas (cabecera inválida).")
+
+
+def _decode(kind: int, color: int, data: bytes) -> Record:
+    if kind not in KINDS or color > 1:
+        raise ValueError(f"Registro inválido: tipo={kind} color={color}")
+    name = _COLOR_NAME[color]
+    if kind == ROLL:
+        return Record(kind, name, dice=tuple(d for d in data[:4] if d))
+    if kind == MOVE:
+        start, end, die, flags = _MOVE.unpack(data)
+        return Record(kind, name, move=(start, end, die), flags=flags)
+    if kind == START:
+        return Record(kind, name, key=data)
+    if kind == END:
+        return Record(kind, name, flags=data[0])
+    return Record(kind, name)
+
+
+def read_records(source: Union[str, BinaryIO]) -> Iterator[Record]:
+    """Genera los registros del archivo de a bloques (memoria constante)."""
+    f = open(source, "rb") if isinstance(source, str) else source
+    try:
+        _check_header(f.read(RECORD_SIZE))
+        while True:
+            chunk = f.read(RECORD_SIZE * _CHUNK_RECORDS)
+            if not chunk:
+                return
+            usable = len(chunk) - len(chunk) % RECORD_SIZE
+            for kind, color, data in _RECORD.iter_unpack(chunk[:usable]):
+                yield _decode(kind, color, data)
+            if usable != len(chunk):
+                raise ValueError("Registro truncado al final del archivo.")
+    finally:
+        if isinstance(source, str):
+            f.close()
+
+
+def read_games(source: Union[str, BinaryIO]) -> Iterator[List[Record]]:
+    """Agrupa los registros por partida (cada una empieza con START)."""
+    game: List[Record] = []
+    for rec in read_records(source):
+        if rec.kind == START and game:
+            yield game
+            game = []
+        game.append(rec)
+    if game:
+        yield game
@@ -0,0 +1,116 @@
+"""
+Replay de partidas grabadas (core/record.py) con saltos rápidos.
+
+Cada registro después de START es un paso: tirada, movimiento o pase de turno.
+El paso i es el estado después de aplicar los primeros i registros (0 = la
+posición inicial). Al construir el Replay se recorre la partida una vez y se
+guarda una foto compacta (28 slots + turno + dados) cada K pasos; game_at(i)
+parte de la foto más cercana y avanza como mucho K-1 pasos.
+
+Los movimientos se reaplican con apply() (el log ya pasó por las reglas).
+"""
+
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from core.compact_board import CompactBoard
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+from core.position_id import decode_cells
+from core.record import Record, START, ROLL, MOVE, END_TURN, END, read_games
+
+
+class Snapshot(NamedTuple):
+    cells: bytes
+    to_move: str
+    dice: Tuple[int, ...]
+
+
+class Replay:
+    """Partida grabada con fotos cada 'checkpoint_every' pasos."""
+
+    def __init__(self, records: Iterable[Record], checkpoint_every: int = 16):
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every debe ser positivo.")
+        records = list(records)
+        if not records or records[0].kind != START:
+            raise ValueError("La partida tiene que empezar con un registro START.")
+        self.K = checkpoint_every
+        self._start = records[0]
+        self._steps: List[Record] = [r for r in records[1:] if r.kind != END]
+        self.result: Optional[Record] = next((r for r in records if r.kind == END), None)
+        self._turns: List[int] = [i for i, r in enumerate(self._steps) if r.kind == ROLL]
+
+        game = self._initial_game()
+        self._checkpoints: List[Snapshot] = [self._snapshot(game)]
+        for i, rec in enumerate(self._steps, 1):
+            self._apply(game, rec)
+            if i % self.K == 0:
+                self._checkpoints.append(self._snapshot(game))
+
+    @classmethod
+    def from_file(cls, path: str, game_index: int = 0, checkpoint_every: int = 16) -> "Replay":
+        """Replay de la partida número game_index de un archivo de registros."""
+        for i, records in enumerate(read_games(path)):
+            if i == game_index:
+                return cls(records, checkpoint_every)
+        raise ValueError(f"El archivo no tiene la partida {game_index}.")
+
+    def __len__(self) -> int:
+        """Cantidad de pasos (los estados válidos van de 0 a len)."""
+        return len(self._steps)
+
+    def turn_count(self) -> int:
+        return len(self._turns)
+
+    def turn_step(self, turn: int) -> int:
+        """Paso en el que empieza el turno 'turn' (antes de su tirada)."""
+        if not 0 <= turn < len(self._turns):
+            raise ValueError(f"Turno fuera de rango: {turn}")
+        return self._turns[turn]
+
+    def step_record(self, step: int) -> Record:
+        """Registro que lleva del paso step-1 al paso step (1..len)."""
+        return self._steps[step - 1]
+
+    # ---------- salto ----------
+    def game_at(self, step: int) -> BackgammonGame:
+        """Partida nueva en el estado del paso 'step' (0..len)."""
+        if not 0 <= step <= len(self._steps):
+            raise ValueError(f"Paso fuera de rango: {step}")
+        base = step // self.K
+        game = self._restore(self._checkpoints[base])
+        for rec in self._steps[base * self.K:step]:
+            self._apply(game, rec)
+        return game
+
+    # ---------- internos ----------
+    def _new_game(self, board: CompactBoard) -> BackgammonGame:
+        return BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"),
+                              ScriptedDice([]))
+
+    def _initial_game(self) -> BackgammonGame:
+        game = self._new_game(CompactBoard.from_array(decode_cells(self._start.key)))
+        game.restore_turn(self._start.color, [])
+        return game
+
+    def _snapshot(self, game: BackgammonGame) -> Snapshot:
+        return Snapshot(game.get_board().to_array().tobytes(),
+                        game.get_current_player().get_color(),
+                        tuple(game.get_rolled_values()))
+
+    def _restore(self, snap: Snapshot) -> BackgammonGame:
+        game = self._new_game(CompactBoard.from_array(snap.cells))
+        game.restore_turn(snap.to_move, list(snap.dice))
+        return game
+
+    @staticmethod
+    def _apply(game: BackgammonGame, rec: Record) -> None:
+        if rec.kind == ROLL:
+            game.restore_turn(rec.color, list(rec.dice))
+        elif rec.kind == MOVE:
+            game.apply(rec.move)
+        elif rec.kind == END_TURN:
+            # apply() ya pasó el turno si se usaron todos los dados
+            if game.get_current_player().get_color() == rec.color:
+                game.apply_end_turn()
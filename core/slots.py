@@ -0,0 +1,9 @@
+"""
+Layout plano (slots) compartido por las implementaciones de tablero.
+
+0..23 puntos con conteo con signo (+ blanco / - negro), luego barra y salidas.
+"""
+
+SLOT_BAR = {"blanco": 24, "negro": 25}
+SLOT_OFF = {"blanco": 26, "negro": 27}
+N_SLOTS = 28
@@ -0,0 +1,57 @@
+"""
+Claves Zobrist de 64 bits para hashear posiciones.
+
+Cada slot del layout plano (ver core/slots.py) tiene una clave por conteo:
+puntos por conteo con signo (+blanco / -negro), barra y retiradas por conteo.
+El conteo 0 vale 0, así que un tablero vacío con blanco al turno hashea a 0.
+Las claves salen de un generador con semilla fija: el hash es estable entre
+procesos y corridas (sirve como clave de caché persistente).
+"""
+
+import random
+from typing import Sequence
+from core.slots import SLOT_BAR, SLOT_OFF
+
+_SPAN = 128  # rango de array('b'): -127..127
+
+_rng = random.Random(0x5A0B1157)
+
+
+def _keys(n: int) -> list[int]:
+    return [_rng.getrandbits(64) for _ in range(n)]
+
+
+# POINT_KEYS[idx][n + _SPAN] para n en -127..127
+POINT_KEYS: list[list[int]] = []
+for _ in range(24):
+    _row = _keys(2 * _SPAN)
+    _row[_SPAN] = 0
+    POINT_KEYS.append(_row)
+
+# BAR_KEYS[color][n] / OFF_KEYS[color][n] para n en 0..127
+BAR_KEYS: dict[str, list[int]] = {}
+OFF_KEYS: dict[str, list[int]] = {}
+for _color in ("blanco", "negro"):
+    BAR_KEYS[_color] = [0] + _keys(_SPAN - 1)
+    OFF_KEYS[_color] = [0] + _keys(_SPAN - 1)
+
+# Se aplica cuando mueve negro
+SIDE_KEY: int = _rng.getrandbits(64)
+
+
+def point_key(idx: int, signed: int) -> int:
+    """Clave del punto idx con 'signed' fichas (+blanco / -negro)."""
+    return POINT_KEYS[idx][signed + _SPAN]
+
+
+def hash_cells(cells: Sequence[int], side_to_move: str = "blanco") -> int:
+    """Calcula el hash completo de una posición plana (N_SLOTS) y el color al turno."""
+    h = 0
+    for idx in range(24):
+        h ^= POINT_KEYS[idx][cells[idx] + _SPAN]
+    for color in ("blanco", "negro"):
+        h ^= BAR_KEYS[color][cells[SLOT_BAR[color]]]
+        h ^= OFF_KEYS[color][cells[SLOT_OFF[color]]]
+    if side_to_move == "negro":
+        h ^= SIDE_KEY
+    return h
@@ -1,5 +1,6 @@
 # Ventana
 WIDTH, HEIGHT = 1000, 680
+MIN_WIDTH, MIN_HEIGHT = 640, 440   # la ventana se puede agrandar/achicar hasta acá
 MARGIN = 18
 
 # Tablero
@@ -34,12 +35,21 @@ BLACK_EDGE = (15, 15, 15)
 # Textos (uniforme)
 TEXT_UNI = (35, 35, 35)
 HILIGHT  = (80, 160, 255)
+HOVER    = (150, 190, 235)   # contorno fino del punto bajo el mouse
 ERROR    = (170, 40, 40)
 
 # Varias
-FPS = 60
+FPS = 60                # sólo en modo de frames fijos (event_driven=False)
+EVENT_WAIT_MS = 500     # el bucle por eventos se despierta al menos cada medio segundo
+BOT_TIME_BUDGET = 1.0   # segundos que piensa el bot (tecla B)
 FONT_SIZE = 20
 
+# Scrubber del modo replay (en el margen inferior)
+SCRUB_H      = 8
+SCRUB_BG     = (120, 105, 85)
+SCRUB_FILL   = (80, 160, 255)
+SCRUB_KNOB   = (245, 245, 245)
+
 # Índices especiales de la UI
 IDX_FROM_BAR  = -1   # entrar desde barra central
 IDX_BEAR_OFF  = 24   # destino especial UI para sacar (se mapea a end=24)
@@ -0,0 +1,154 @@
+"""
+Exportador de diagramas PNG sin ventana (driver SDL 'dummy').
+
+Uso:
+  python -m pygame_ui.export ENTRADA... --out DIR [--every turn|step] [--workers N]
+
+Cada ENTRADA puede ser:
+- un registro de partidas .bgr (core/record.py): una imagen por turno (o por paso)
+- un directorio: se exportan todos los .bgr que tenga
+- un archivo de texto con un position ID o "positionID:matchID" por línea
+
+Se dibuja con el BoardRenderer de siempre sobre un único Surface fuera de
+pantalla (sólo se repintan las regiones que cambian entre una posición y la
+siguiente) y la codificación PNG, que es lo caro, se reparte en un pool de
+procesos con un tope de imágenes en vuelo.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame  # type: ignore
+except ImportError:
+    pygame = None
+
+from core.game import BackgammonGame
+from core.position_id import game_from_state_id, match_id
+from core.record import MAGIC, read_games
+from core.replay import Replay
+
+from .constants import WIDTH, HEIGHT, FONT_SIZE
+from .renderer import BoardRenderer
+
+EVERY = ("turn", "step")
+
+
+# ---------- entradas ----------
+def _is_record(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def iter_record(path: str, every: str = "turn") -> Iterator[Tuple[str, BackgammonGame]]:
+    """(nombre, partida) para cada turno (o paso) de cada partida de un .bgr."""
+    if every not in EVERY:
+        raise ValueError(f"'every' tiene que ser uno de {EVERY}.")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for g, records in enumerate(read_games(path)):
+        replay = Replay(records)
+        if every == "step":
+            steps = range(len(replay) + 1)
+        else:
+            steps = [replay.turn_step(t) for t in range(replay.turn_count())] + [len(replay)]
+        for step in dict.fromkeys(steps):
+            yield f"{stem}-g{g:04d}-s{step:04d}", replay.game_at(step)
+
+
+def iter_ids(path: str) -> Iterator[Tuple[str, BackgammonGame]]:
+    """(nombre, partida) por cada position ID (o positionID:matchID) del archivo."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with open(path, encoding="utf-8") as f:
+        ids = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    for i, text in enumerate(ids):
+        sid = text if ":" in text else f"{text}:{match_id('blanco', [])}"
+        yield f"{stem}-{i:05d}", game_from_state_id(sid)
+
+
+def iter_inputs(paths: Iterable[str], every: str = "turn") -> Iterator[Tuple[str, BackgammonGame]]:
+    """Posiciones a exportar de una lista de archivos / directorios."""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".bgr"):
+                    yield from iter_record(os.path.join(path, name), every)
+        elif _is_record(path):
+            yield from iter_record(path, every)
+        else:
+            yield from iter_ids(path)
+
+
+# ---------- codificación ----------
+def _encode(raw: bytes, size: Tuple[int, int], path: str) -> str:
+    """Guarda un PNG a partir de los píxeles RGB crudos (corre en los workers)."""
+    pygame.image.save(pygame.image.frombytes(raw, size, "RGB"), path)
+    return path
+
+
+# ---------- exportación ----------
+def export(items: Iterable[Tuple[str, BackgammonGame]], out_dir: str,
+           size: Tuple[int, int] = (WIDTH, HEIGHT), workers: Optional[int] = None) -> List[str]:
+    """
+    Dibuja cada (nombre, partida) y la guarda como out_dir/nombre.png.
+    workers=0 codifica en este proceso; None usa un proceso por núcleo.
+    Devuelve las rutas escritas, en el orden de entrada.
+    """
+    if pygame is None:
+        raise ImportError("Pygame no está instalado. pip install pygame")
+    os.makedirs(out_dir, exist_ok=True)
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))   # sólo para convert(); se dibuja fuera de pantalla
+    surface = pygame.Surface(size)
+    renderer = BoardRenderer(surface, pygame.font.SysFont(None, FONT_SIZE))
+
+    def frames():
+        for name, game in items:
+            renderer.render(game)
+            yield pygame.image.tobytes(surface, "RGB"), os.path.join(out_dir, f"{name}.png")
+
+    if workers == 0:
+        return [_encode(raw, size, path) for raw, path in frames()]
+
+    paths, pending = [], []
+    limit = 4 * (workers or os.cpu_count() or 1)   # imágenes en vuelo (acota la memoria)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for raw, path in frames():
+            pending.append(pool.submit(_encode, raw, size, path))
+            if len(pending) >= limit:
+                paths.append(pending.pop(0).result())
+        paths.extend(fut.result() for fut in pending)
+    return paths
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    try:
+        w, h = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamaño inválido: {text!r} (ej.: 1000x680)") from None
+    return w, h
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta posiciones de Backgammon a PNG")
+    parser.add_argument("inputs", nargs="+", help="registros .bgr, directorios o archivos de IDs")
+    parser.add_argument("--out", required=True, help="directorio de salida")
+    parser.add_argument("--every", choices=EVERY, default="turn", help="en registros: una imagen por turno o por paso")
+    parser.add_argument("--size", type=_parse_size, default=(WIDTH, HEIGHT), help="ancho x alto (ej.: 1000x680)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="procesos que codifican (0 = ninguno)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    paths = export(iter_inputs(args.inputs, args.every), args.out, args.size, args.workers)
+    elapsed = time.perf_counter() - t0
+    print(f"imágenes={len(paths)} segundos={elapsed:.1f} imágenes/min={len(paths) / elapsed * 60:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,20 @@ from .constants import *
 from .renderer import BoardRenderer
 
 class BackgammonUI:
-    def __init__(self, game=None):
+    def __init__(self, game=None, replay=None, event_driven=True):
         pygame.init()
         pygame.display.set_caption("Backgammon (Pygame)")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         self.clock  = pygame.time.Clock()
         self.font   = pygame.font.SysFont(None, FONT_SIZE)
 
+        # modo replay (core.replay.Replay): se navega con el scrubber, no se juega
+        self.replay = replay
+        self.replay_step = 0
+        self.scrubbing = False
+        if replay is not None:
+            game = replay.game_at(0)
+
         # DI opcional
         if game is None:
             from core.board import Board
@@ -27,6 +34,7 @@ class BackgammonUI:
         self.game = game
 
         self.renderer = BoardRenderer(self.screen, self.font)
+        self.bot = None  # ExpectimaxBot, se crea al apretar B por primera vez
 
         # estado UI
         self.last_msg = None
@@ -34,12 +42,19 @@ class BackgammonUI:
         self.show_help = False
         self.show_moves = False
         self.legal_moves_cache = []
+        self.hover = None
         self.running = True
 
+        # bucle por eventos: sólo se redibuja cuando cambia _view_key()
+        self.event_driven = event_driven
+        self._drawn = None
+
     # ------------------- eventos
     def _on_key(self, e):
         if e.key in (pygame.K_ESCAPE, pygame.K_q, pygame.K_v):
             self.running = False
+        elif self.replay is not None:
+            self._on_replay_key(e)
         elif e.key == pygame.K_r:
             self._restart()
         elif e.key == pygame.K_t:
@@ -50,6 +65,8 @@ class BackgammonUI:
                 self.legal_moves_cache = list(self.game.legal_moves())
         elif e.key == pygame.K_h:
             self.show_help = not self.show_help
+        elif e.key == pygame.K_b:
+            self._bot_turn()
         elif e.key == pygame.K_e:  # pasar turno manual si no hay jugadas
             if not self.game.get_rolled_values():
                 self.last_msg = "Primero tirá los dados con T."
@@ -61,7 +78,41 @@ class BackgammonUI:
             else:
                 self.last_msg = "Aún tenés jugadas disponibles con estos dados."
 
+    def _on_replay_key(self, e):
+        """Flechas: paso a paso; arriba/abajo: turno a turno; Inicio/Fin: extremos."""
+        r, step = self.replay, self.replay_step
+        if e.key == pygame.K_RIGHT:
+            self._seek(step + 1)
+        elif e.key == pygame.K_LEFT:
+            self._seek(step - 1)
+        elif e.key == pygame.K_HOME:
+            self._seek(0)
+        elif e.key == pygame.K_END:
+            self._seek(len(r))
+        elif e.key in (pygame.K_UP, pygame.K_DOWN):
+            starts = [r.turn_step(t) for t in range(r.turn_count())] + [len(r)]
+            if e.key == pygame.K_UP:
+                nxt = [s for s in starts if s > step]
+                self._seek(nxt[0] if nxt else len(r))
+            else:
+                prev = [s for s in starts if s < step]
+                self._seek(prev[-1] if prev else 0)
+        elif e.key == pygame.K_h:
+            self.show_help = not self.show_help
+
+    def _seek(self, step):
+        """Salta al paso 'step' del replay (usa los checkpoints de core.replay)."""
+        step = min(max(step, 0), len(self.replay))
+        self.replay_step = step
+        self.game = self.replay.game_at(step)
+        self.last_msg = f"Replay: paso {step}/{len(self.replay)}"
+
     def _on_click(self, pos):
+        if self.replay is not None:
+            if self.renderer.scrubber_rect().inflate(0, 12).collidepoint(pos):
+                self.scrubbing = True
+                self._seek(self.renderer.scrubber_step(pos, len(self.replay)))
+            return
         idx = self.renderer.hit_test(pos)
         if idx is None:
             return
@@ -100,6 +151,29 @@ class BackgammonUI:
         except Exception as ex:
             self.last_msg = str(ex)
 
+    def _bot_turn(self):
+        """La computadora juega el turno actual (tira los dados si hace falta)."""
+        if self.game.get_winner():
+            return
+        if self.bot is None:
+            from ai.search import ExpectimaxBot
+            self.bot = ExpectimaxBot(depth=2, time_budget=BOT_TIME_BUDGET)
+        try:
+            if not self.game.get_rolled_values():
+                self.game.roll_dice()
+            color = self.game.get_current_player().get_color()
+            jugada = self.bot.choose(self.game)
+            if jugada:
+                self.game.apply_play(jugada)
+                pasos = ", ".join(f"{s}->{e}" for s, e, _ in jugada)
+                self.last_msg = f"Bot ({color}) jugó: {pasos}"
+            else:
+                self.game.end_turn()
+                self.last_msg = f"Bot ({color}) sin jugadas: turno pasado."
+            self.selected_from = None; self.show_moves = False; self.legal_moves_cache = []
+        except Exception as ex:
+            self.last_msg = str(ex)
+
     def _move(self, start, end):
         # mapear índices especiales de UI
         if start == IDX_FROM_BAR:
@@ -134,28 +208,81 @@ class BackgammonUI:
             self.last_msg = str(ex)
 
     def _borne_off_count(self, color: str) -> int:
-        board = self.game.get_board()
-        on_board = sum(len(board.get_point(i)) for i in range(24) if board.owner_at(i) == color)
-        on_bar   = len(board.get_bar()[color])
-        return max(0, CHECKERS_PER_COLOR - (on_board + on_bar))
+        return self.game.get_board().get_off(color)
 
     # ------------------- bucle/render
-    def run(self):
-        while self.running:
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT: self.running = False
-                elif e.type == pygame.KEYDOWN: self._on_key(e)
-                elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1: self._on_click(e.pos)
+    def _handle(self, e):
+        if e.type == pygame.QUIT: self.running = False
+        elif e.type == pygame.KEYDOWN: self._on_key(e)
+        elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1: self._on_click(e.pos)
+        elif e.type == pygame.MOUSEBUTTONUP and e.button == 1: self.scrubbing = False
+        elif e.type == pygame.MOUSEMOTION:
+            if self.scrubbing:
+                self._seek(self.renderer.scrubber_step(e.pos, len(self.replay)))
+            elif self.replay is None:
+                self.hover = self.renderer.hit_test(e.pos)
+        elif e.type == pygame.VIDEORESIZE:
+            # el layout (puntos, barra, bandeja, dados) se recalcula sólo acá
+            self.screen = pygame.display.get_surface()
+            self.renderer.resize(self.screen); self._drawn = None
+        elif e.type == pygame.WINDOWEXPOSED:
+            self.renderer.invalidate(); self._drawn = None
 
-            legal = self.legal_moves_cache if self.show_moves else []
+    def _view_key(self):
+        """Todo lo que se ve en pantalla: si no cambió desde el último dibujo, no se redibuja."""
+        return (self.game, self.game.get_version(), self.last_msg, self.selected_from,
+                self.show_help, self.show_moves, self.hover, self.replay_step)
+
+    def _draw(self):
+        legal = self.legal_moves_cache if self.show_moves else []
+        # sólo se repintan y se mandan a pantalla las regiones que cambiaron
+        rects = self.renderer.render(self.game, self.last_msg, self.selected_from, self.show_help,
+                                     legal, self.hover)
+        if self.replay is not None and rects:
+            rects.append(self.renderer.draw_scrubber(self.replay_step, len(self.replay)))
+        if rects:
+            pygame.display.update(rects)
+
+    def _next_events(self):
+        """
+        Por eventos: bloquea hasta que llegue uno (o pase EVENT_WAIT_MS) y trae los
+        que estén en cola. En modo de frames fijos espera al próximo tick de FPS.
+        """
+        if not self.event_driven:
+            self.clock.tick(FPS)
+            return pygame.event.get()
+        first = pygame.event.wait(EVENT_WAIT_MS)
+        rest = pygame.event.get()
+        return rest if first.type == pygame.NOEVENT else [first] + rest
 
-            # >>> NUEVO: mostrar ganador aunque ya haya terminado (cada frame)
+    def run(self):
+        while self.running:
+            # >>> NUEVO: mostrar ganador aunque ya haya terminado
             winner = self.game.get_winner()
             if winner and (not self.last_msg or "¡Ganó" not in str(self.last_msg)):
                 self.last_msg = f"¡Ganó {'Blanco' if winner=='blanco' else 'Negro'}!"
 
-            self.renderer.render(self.game, self.last_msg, self.selected_from, self.show_help, legal)
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            # se dibuja apenas cambia algo (después del evento que lo cambió)
+            key = self._view_key()
+            if key != self._drawn:
+                self._draw()
+                self._drawn = key
+
+            for e in self._next_events():
+                self._handle(e)
         pygame.quit()
         sys.exit()
+
+
+if __name__ == "__main__":
+    # python -m pygame_ui.game_ui --replay partidas.bgr [--game N]
+    import argparse
+    from core.replay import Replay
+
+    ap = argparse.ArgumentParser(description="Backgammon (Pygame)")
+    ap.add_argument("--replay", metavar="ARCHIVO", help="abre una partida grabada (core/record.py)")
+    ap.add_argument("--game", type=int, default=0, help="número de partida dentro del archivo")
+    ap.add_argument("--fps", action="store_true", help=f"bucle de frames fijos a {FPS} FPS (sin esperar eventos)")
+    args = ap.parse_args()
+    replay = Replay.from_file(args.replay, args.game) if args.replay else None
+    BackgammonUI(replay=replay, event_driven=not args.fps).run()
@@ -0,0 +1,102 @@
+"""
+Geometría del tablero para un tamaño de ventana: todos los rects (puntos,
+canal, bandeja, dados, HUD, scrubber) se calculan una sola vez y se vuelven
+a calcular sólo cuando cambia el tamaño de la ventana.
+
+hit_test(pos) no recorre rects: ubica la columna y la mitad del tablero con
+aritmética a partir de la x y la y del click.
+
+A 1000x680 da exactamente la misma geometría que constants.py.
+"""
+
+try:
+    import pygame  # type: ignore
+except ImportError:
+    pygame = None
+
+from .constants import (
+    WIDTH, HEIGHT, MIN_WIDTH, MIN_HEIGHT, MARGIN, FONT_SIZE, DICE_SIZE, SCRUB_H,
+    IDX_FROM_BAR, IDX_BEAR_OFF,
+)
+
+
+class Layout:
+    """Rects del tablero para una ventana de width x height."""
+
+    def __init__(self, width=WIDTH, height=HEIGHT, margin=MARGIN):
+        if pygame is None:
+            raise ImportError("Pygame no está instalado. pip install pygame")
+        Rect = pygame.Rect
+        self.width, self.height = max(width, MIN_WIDTH), max(height, MIN_HEIGHT)
+        m = self.margin = margin
+
+        # mismas fórmulas que constants.py
+        self.board_w, self.board_h = self.width - 2 * m, self.height - 2 * m
+        self.point_w = self.board_w // 14
+        self.bar_w = int(self.point_w * 1.20)
+        self.tray_w = int(self.point_w * 1.10)
+        self.stack_h = (self.board_h // 2) - 58
+        self.layer_h = max(14, self.stack_h // 5)
+
+        self.board = Rect(m, m, self.board_w, self.board_h)
+        self.canal = Rect(m + 6 * self.point_w, m, self.bar_w, self.board_h)
+        self.tray = Rect(m + self.board_w - self.tray_w, m, self.tray_w, self.board_h)
+
+        # columnas lógicas 0..11 (de izquierda a derecha); arriba 11..0, abajo 12..23
+        self.col_x = [self.x_col(k) for k in range(12)]
+        half = self.board_h // 2
+        self.points = {}
+        for k in range(12):
+            self.points[11 - k] = Rect(self.col_x[k], m, self.point_w, half)
+        for k in range(12):
+            self.points[12 + k] = Rect(self.col_x[k], m + half, self.point_w, half)
+
+        # zonas clickeables (la bandeja tapa unos píxeles de la última columna: va primero)
+        self.rects = {IDX_FROM_BAR: self.canal, IDX_BEAR_OFF: self.tray, **self.points}
+
+        # HUD
+        gap = 10
+        x0 = self.canal.centerx - (DICE_SIZE * 2 + gap) // 2
+        y0 = m + 44
+        self.dice = [Rect(x0, y0, DICE_SIZE, DICE_SIZE), Rect(x0 + DICE_SIZE + gap, y0, DICE_SIZE, DICE_SIZE)]
+        play_w = self.board_w - self.tray_w - self.bar_w
+        self.turn = Rect(0, 0, play_w // 2, FONT_SIZE + 20)
+        self.turn.center = (m + play_w // 4, m + self.board_h // 2)
+        self.help = Rect(m + 10, m + self.board_h - 130 - 10, 520, 130)
+        self.msg = Rect(m, m + self.board_h - 30, self.board_w, 28)
+        self.scrubber = Rect(m, m + self.board_h + (m - SCRUB_H) // 2, self.board_w, SCRUB_H)
+
+    def x_col(self, k: int) -> int:
+        """X de la columna lógica k (0..11); añade el hueco del canal central."""
+        base = self.margin + k * self.point_w
+        if k >= 6:
+            base += self.bar_w
+        return base
+
+    def column_of(self, idx: int) -> int:
+        """Columna lógica (0..11) del punto idx."""
+        return 11 - idx if idx < 12 else idx - 12
+
+    def hit_test(self, pos):
+        """Índice del punto / canal / bandeja bajo 'pos', o None."""
+        x, y = pos
+        m = self.margin
+        if not (m <= y < m + self.board_h):
+            return None
+        if self.tray.collidepoint(pos):
+            return IDX_BEAR_OFF
+        if self.canal.collidepoint(pos):
+            return IDX_FROM_BAR
+        dx = x - m
+        if dx < 0:
+            return None
+        if dx >= 6 * self.point_w:
+            dx -= 6 * self.point_w + self.bar_w
+            if dx < 0:
+                return None
+            k = 6 + dx // self.point_w
+        else:
+            k = dx // self.point_w
+        if k > 11:
+            return None
+        return 11 - k if y < m + self.board_h // 2 else 12 + k
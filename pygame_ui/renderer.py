@@ -4,20 +4,19 @@ except ImportError:
     pygame = None
 
 from .constants import (
-    MARGIN, BOARD_W, BOARD_H, POINT_W, BAR_W, TRAY_W,
-    STACK_H, LAYER_H, FONT_SIZE, DICE_SIZE,
+    FONT_SIZE,
     BOARD_BG, FRAME_COLOR, TRI_A, TRI_B,
     CHANNEL_BG, CHANNEL_EDGE,
-    WHITE, WHITE_EDGE, BLACK, BLACK_EDGE,
-    TEXT_UNI, HILIGHT, ERROR,
-    IDX_FROM_BAR, IDX_BEAR_OFF, CHECKERS_PER_COLOR,
-    x_col,
+    TEXT_UNI, HILIGHT, HOVER, ERROR,
+    SCRUB_H, SCRUB_BG, SCRUB_FILL, SCRUB_KNOB,
+    IDX_FROM_BAR, IDX_BEAR_OFF,
 )
+from .layout import Layout
+from .resources import RendererResources
 
 # ---------------- util ----------------
-def _txt(surf, text, pos, color=TEXT_UNI, center=False, font=None):
-    font = font or pygame.font.SysFont(None, FONT_SIZE)
-    img = font.render(text, True, color)
+def _txt(surf, img, pos, center=False):
+    """Blitea un texto ya renderizado (ver RendererResources.text)."""
     r = img.get_rect()
     if center:
         r.center = pos
@@ -34,118 +33,187 @@ def _tri(surf, rect, up, color):
     )
     pygame.draw.polygon(surf, color, pts)
 
-def _chip(surf, x, y, face, edge, r):
-    pygame.draw.circle(surf, edge, (x, y), r + 2)
-    pygame.draw.circle(surf, face, (x, y), r)
-
-def _pips(surf, rect, val):
-    cx, cy = rect.center
-    r = 4
-    dx = rect.w // 4
-    dy = rect.h // 4
-    table = {
-        1: [(cx, cy)],
-        2: [(cx - dx, cy - dy), (cx + dx, cy + dy)],
-        3: [(cx, cy), (cx - dx, cy - dy), (cx + dx, cy + dy)],
-        4: [(cx - dx, cy - dy), (cx + dx, cy - dy), (cx - dx, cy + dy), (cx + dx, cy + dy)],
-        5: [(cx, cy), (cx - dx, cy - dy), (cx + dx, cy - dy), (cx - dx, cy + dy), (cx + dx, cy + dy)],
-        6: [
-            (cx - dx, cy - dy), (cx, cy - dy), (cx + dx, cy - dy),
-            (cx - dx, cy + dy), (cx, cy + dy), (cx + dx, cy + dy),
-        ],
-    }
-    for p in table.get(val, []):
-        pygame.draw.circle(surf, (30, 30, 30), p, r)
-
 class BoardRenderer:
+    """
+    Dibuja el tablero en dos capas: la estática (marco, triángulos, canal,
+    bandeja y números de los puntos) se pinta una sola vez en un Surface de
+    fondo; en cada frame sólo se repintan las regiones cuyo estado cambió
+    (puntos, barra, bandeja y HUD) y render() devuelve esos rects para
+    pygame.display.update(rects). La geometría sale de un Layout que se
+    arma para el tamaño de la pantalla y se rehace en resize().
+    """
+
     def __init__(self, screen, font):
         if pygame is None:
             raise ImportError("Pygame no está instalado. pip install pygame")
-        self.sc, self.font = screen, font
-        self.hitmap = {}
-        self.tray = None
+        self.font = font
+        self.res = RendererResources(font)   # fuentes, textos y sprites cacheados
+        self._help_panel = None
+        self.resize(screen)
+
+    def resize(self, screen):
+        """Adopta la pantalla (nueva o redimensionada): rehace layout y fondo, y repinta todo."""
+        self.sc = screen
+        self.layout = Layout(*screen.get_size())
+        self.hitmap = self.layout.rects
+        self.tray = self.layout.tray
+        self.res.set_chip_size(self.layout.layer_h)
+        self._background = None   # capa estática (se arma en el primer render)
+        self._regions = None      # {región: (rect, estado)} del último frame dibujado
 
     # ---------- pública ----------
-    def render(self, game, last_msg=None, selected_from=None, show_help=False, legal_moves=None):
-        legal_moves = legal_moves or []
-        self.hitmap = {}
-        self._board_and_areas()
-        self._stacks_points(game)
-        self._bar(game)
-        self._tray(game)
-        self._hud(game, last_msg, show_help, legal_moves)
-        if selected_from is not None and selected_from in self.hitmap:
-            pygame.draw.rect(self.sc, HILIGHT, self.hitmap[selected_from], 2)
-        return self.hitmap
+    def render(self, game, last_msg=None, selected_from=None, show_help=False, legal_moves=None,
+               hover=None):
+        """
+        Repinta las regiones que cambiaron desde el último render y devuelve sus rects
+        (lista vacía si no cambió nada). El primer frame y después de invalidate()
+        devuelve la pantalla entera. 'hover' es el índice bajo el mouse (se marca fino).
+        """
+        if self._background is None:
+            self._build_background()
+        dests = {d for _, d, _ in (legal_moves or [])}
+        marks = (selected_from, hover)
+        regions = self._frame_regions(game, last_msg, marks, show_help, dests)
+        if self._regions is None:
+            dirty = [self.sc.get_rect()]
+        else:
+            dirty = [rc for name, (rc, key) in regions.items() if self._regions[name][1] != key]
+        self._regions = regions
+        for rc in dirty:
+            self.sc.set_clip(rc)
+            self.sc.blit(self._background, rc, rc)
+            self._draw_dynamic(game, rc, last_msg, marks, show_help, dests)
+        self.sc.set_clip(None)
+        return dirty
+
+    def invalidate(self):
+        """Fuerza a repintar todo en el próximo render (p. ej. si otro código dibujó encima)."""
+        self._regions = None
+
+    # ---------- scrubber (modo replay) ----------
+    def scrubber_rect(self):
+        """Barra del scrubber, en el margen inferior debajo del tablero."""
+        return self.layout.scrubber
+
+    def draw_scrubber(self, step, total):
+        """Dibuja la posición 'step' de 'total' pasos y devuelve el rect a actualizar."""
+        rc = self.scrubber_rect()
+        area = rc.inflate(2 * SCRUB_H + 2, 2 * SCRUB_H + 2)
+        if self._background is not None:
+            self.sc.blit(self._background, area, area)
+        pygame.draw.rect(self.sc, SCRUB_BG, rc, border_radius=4)
+        frac = step / total if total else 1.0
+        fill = pygame.Rect(rc.x, rc.y, int(rc.w * frac), rc.h)
+        pygame.draw.rect(self.sc, SCRUB_FILL, fill, border_radius=4)
+        pygame.draw.circle(self.sc, SCRUB_KNOB, (rc.x + int(rc.w * frac), rc.centery), SCRUB_H)
+        return area
+
+    def scrubber_step(self, pos, total):
+        """Paso (0..total) que corresponde a la x de 'pos' sobre el scrubber."""
+        rc = self.scrubber_rect()
+        frac = min(max((pos[0] - rc.x) / rc.w, 0.0), 1.0)
+        return round(frac * total)
 
     def hit_test(self, pos):
-        for i, r in self.hitmap.items():
-            if r.collidepoint(pos):
-                return i
-        return None
+        """Índice bajo 'pos' (punto 0..23, IDX_FROM_BAR, IDX_BEAR_OFF) o None."""
+        return self.layout.hit_test(pos)
+
+    # ---------- capa estática: tablero + hitmap + labels ----------
+    def _build_background(self):
+        """Pinta la capa estática en un Surface propio."""
+        self._background = pygame.Surface(self.sc.get_size()).convert()
+        self._background.fill((0, 0, 0))
+        screen, self.sc = self.sc, self._background
+        try:
+            self._board_and_areas()
+        finally:
+            self.sc = screen
 
-    # ---------- tablero + hitmap + labels ----------
     def _board_and_areas(self):
+        L = self.layout
         # marco + fondo interno
-        frame = pygame.Rect(MARGIN, MARGIN, BOARD_W, BOARD_H)
-        pygame.draw.rect(self.sc, FRAME_COLOR, frame, border_radius=14)
-        inner = frame.inflate(-16, -16)
+        pygame.draw.rect(self.sc, FRAME_COLOR, L.board, border_radius=14)
+        inner = L.board.inflate(-16, -16)
         pygame.draw.rect(self.sc, BOARD_BG, inner, border_radius=10)
 
-        # canal (barra central)
-        canal = pygame.Rect(MARGIN + 6 * POINT_W, MARGIN, BAR_W, BOARD_H)
-        pygame.draw.rect(self.sc, CHANNEL_BG, canal, border_radius=6)
-        pygame.draw.rect(self.sc, CHANNEL_EDGE, canal, 1, border_radius=6)  # borde fino
-        self.hitmap[IDX_FROM_BAR] = canal
-
-        # bandeja lateral (bear-off)
-        tray_x = MARGIN + BOARD_W - TRAY_W
-        self.tray = pygame.Rect(tray_x, MARGIN, TRAY_W, BOARD_H)
-        pygame.draw.rect(self.sc, CHANNEL_BG, self.tray, border_radius=6)
-        pygame.draw.rect(self.sc, CHANNEL_EDGE, self.tray, 1, border_radius=6)
-        self.hitmap[IDX_BEAR_OFF] = self.tray  # clickeable para bear-off
+        # canal (barra central) y bandeja lateral (bear-off), mismo estilo
+        for rc in (L.canal, L.tray):
+            pygame.draw.rect(self.sc, CHANNEL_BG, rc, border_radius=6)
+            pygame.draw.rect(self.sc, CHANNEL_EDGE, rc, 1, border_radius=6)  # borde fino
 
-        # triángulos + zonas clickeables + labels
+        # triángulos + labels
+        top, bottom = L.margin, L.margin + L.board_h
         # top 11..0
-        for k, idx in enumerate(range(11, -1, -1)):
-            x = x_col(k)
-            _tri(self.sc, (x, MARGIN + 28, POINT_W, STACK_H), True, TRI_A if k % 2 == 0 else TRI_B)
-            self.hitmap[idx] = pygame.Rect(x, MARGIN, POINT_W, BOARD_H // 2)
-            _txt(self.sc, str(12 - k), (x + POINT_W // 2, MARGIN + 6), TEXT_UNI, True)
+        for k, x in enumerate(L.col_x):
+            _tri(self.sc, (x, top + 28, L.point_w, L.stack_h), True, TRI_A if k % 2 == 0 else TRI_B)
+            _txt(self.sc, self.res.text(str(12 - k), TEXT_UNI), (x + L.point_w // 2, top + 6), True)
         # bottom 12..23
-        for k, idx in enumerate(range(12, 24)):
-            x = x_col(k)
-            y = MARGIN + BOARD_H - 28 - STACK_H
-            _tri(self.sc, (x, y, POINT_W, STACK_H), False, TRI_B if k % 2 == 0 else TRI_A)
-            self.hitmap[idx] = pygame.Rect(x, MARGIN + BOARD_H // 2, POINT_W, BOARD_H // 2)
-            _txt(self.sc, str(13 + k), (x + POINT_W // 2, MARGIN + BOARD_H - 22), TEXT_UNI, True)
+        for k, x in enumerate(L.col_x):
+            y = bottom - 28 - L.stack_h
+            _tri(self.sc, (x, y, L.point_w, L.stack_h), False, TRI_B if k % 2 == 0 else TRI_A)
+            _txt(self.sc, self.res.text(str(13 + k), TEXT_UNI), (x + L.point_w // 2, bottom - 22), True)
+
+    # ---------- regiones sucias ----------
+    def _frame_regions(self, game, last_msg, marks, show_help, dests):
+        """{región: (rect, estado)}; una región se repinta cuando cambia su estado."""
+        board = game.get_board()
+        sel, hover = marks
+        regions = {}
+        for idx in range(24):
+            regions[idx] = (self.hitmap[idx], (board.owner_at(idx), board.count_at(idx),
+                                               idx in dests, idx == sel, idx == hover))
+        regions["bar"] = (self.layout.canal.unionall(self.layout.dice), (
+            board.count_on_bar("negro"), board.count_on_bar("blanco"),
+            tuple(game.get_rolled_values()), IDX_FROM_BAR in dests,
+            sel == IDX_FROM_BAR, hover == IDX_FROM_BAR))
+        regions["tray"] = (self.tray, (board.get_off("blanco"), board.get_off("negro"),
+                                       IDX_BEAR_OFF in dests, sel == IDX_BEAR_OFF, hover == IDX_BEAR_OFF))
+        p = game.get_current_player()
+        regions["turn"] = (self.layout.turn, p.get_name() if hasattr(p, "get_name") else p.get_color())
+        regions["help"] = (self.layout.help, bool(show_help))
+        regions["msg"] = (self.layout.msg, str(last_msg) if last_msg else None)
+        return regions
+
+    def _draw_dynamic(self, game, clip, last_msg, marks, show_help, dests):
+        """Capa dinámica recortada a 'clip' (sólo las pilas de los puntos que tocan el clip)."""
+        selected_from, hover = marks
+        self._stacks_points(game, clip)
+        self._bar(game)
+        self._tray(game)
+        if hover is not None and hover in self.hitmap and hover != selected_from:
+            pygame.draw.rect(self.sc, HOVER, self.hitmap[hover], 1)
+        self._hud(game, last_msg, show_help, dests)
+        if selected_from is not None and selected_from in self.hitmap:
+            pygame.draw.rect(self.sc, HILIGHT, self.hitmap[selected_from], 2)
 
     # ---------- fichas en puntos ----------
-    def _stacks_points(self, game):
+    def _stacks_points(self, game, clip=None):
         board = game.get_board()
-        rad = LAYER_H // 2
+        L = self.layout
+        rad = L.layer_h // 2
 
         def draw_range(indices, top=True):
             for layer in range(5):
                 for k, idx in enumerate(indices):
+                    if clip is not None and not clip.colliderect(self.hitmap[idx]):
+                        continue
                     owner = board.owner_at(idx)
                     if not owner:
                         continue
                     cnt = len(board.get_point(idx))
                     if cnt <= layer:
                         continue
-                    cx = x_col(k) + POINT_W // 2
+                    cx = L.col_x[k] + L.point_w // 2
                     y = (
-                        MARGIN + 28 + layer * LAYER_H + rad
+                        L.margin + 28 + layer * L.layer_h + rad
                         if top
-                        else MARGIN + BOARD_H - 28 - layer * LAYER_H - rad
+                        else L.margin + L.board_h - 28 - layer * L.layer_h - rad
                     )
-                    face, edge = (WHITE, WHITE_EDGE) if owner == "blanco" else (BLACK, BLACK_EDGE)
-                    _chip(self.sc, cx, y, face, edge, rad)
+                    self.res.blit_chip(self.sc, owner, (cx, y))
                     # ---- contador en negras ----
                     if layer == 4 and cnt > 5:
                         num_color = TEXT_UNI if owner == "blanco" else (240, 240, 240)  # NUEVO
-                        _txt(self.sc, str(cnt - 4), (cx, y), num_color, True)
+                        _txt(self.sc, self.res.text(str(cnt - 4), num_color), (cx, y), True)
 
         draw_range(range(11, -1, -1), top=True)
         draw_range(range(12, 24), top=False)
@@ -154,64 +222,46 @@ class BoardRenderer:
     def _bar(self, game):
         bar = game.get_board().get_bar()
         cnt_b, cnt_w = len(bar["negro"]), len(bar["blanco"])
-        canal = pygame.Rect(MARGIN + 6 * POINT_W, MARGIN, BAR_W, BOARD_H)
-        rad = LAYER_H // 2
+        L = self.layout
+        cx, step = L.canal.centerx, L.layer_h - 2
+        top, bottom = L.margin + 30, L.margin + L.board_h - 30
 
         for i in range(min(cnt_b, 5)):
-            _chip(self.sc, canal.centerx, MARGIN + 30 + i * (LAYER_H - 2), BLACK, BLACK_EDGE, rad)
+            self.res.blit_chip(self.sc, "negro", (cx, top + i * step))
         if cnt_b > 5:
-            _txt(self.sc, str(cnt_b - 5), (canal.centerx, MARGIN + 30 + 5 * (LAYER_H - 2)), TEXT_UNI, True)
+            _txt(self.sc, self.res.text(str(cnt_b - 5), TEXT_UNI), (cx, top + 5 * step), True)
 
         for i in range(min(cnt_w, 5)):
-            _chip(self.sc, canal.centerx, MARGIN + BOARD_H - 30 - i * (LAYER_H - 2), WHITE, WHITE_EDGE, rad)
+            self.res.blit_chip(self.sc, "blanco", (cx, bottom - i * step))
         if cnt_w > 5:
-            _txt(self.sc, str(cnt_w - 5), (canal.centerx, MARGIN + BOARD_H - 30 - 5 * (LAYER_H - 2)), TEXT_UNI, True)
+            _txt(self.sc, self.res.text(str(cnt_w - 5), TEXT_UNI), (cx, bottom - 5 * step), True)
 
     # ---------- bandeja lateral (solo n° de bear-off) ----------
     def _tray(self, game):
         board = game.get_board()
-
-        def count_on_board(color):
-            return sum(len(board.get_point(i)) for i in range(24) if board.owner_at(i) == color)
-
-        cnt_w_bar, cnt_b_bar = len(board.get_bar()["blanco"]), len(board.get_bar()["negro"])
-        off_w = max(0, CHECKERS_PER_COLOR - (count_on_board("blanco") + cnt_w_bar))
-        off_b = max(0, CHECKERS_PER_COLOR - (count_on_board("negro") + cnt_b_bar))
+        off_w, off_b = board.get_off("blanco"), board.get_off("negro")
 
         # Solo números (sin recuadros)
-        bigf = pygame.font.SysFont(None, FONT_SIZE + 10)
         top_pos = (self.tray.centerx, self.tray.y + self.tray.h * 0.25)
         bot_pos = (self.tray.centerx, self.tray.y + self.tray.h * 0.75)
-        _txt(self.sc, str(off_b), top_pos, TEXT_UNI, True, bigf)
-        _txt(self.sc, str(off_w), bot_pos, TEXT_UNI, True, bigf)
+        _txt(self.sc, self.res.text(str(off_b), TEXT_UNI, FONT_SIZE + 10), top_pos, True)
+        _txt(self.sc, self.res.text(str(off_w), TEXT_UNI, FONT_SIZE + 10), bot_pos, True)
 
     # ---------- HUD (turno + dados + ayudas/errores) ----------
-    def _hud(self, game, last_msg, show_help, legal_moves):
+    def _hud(self, game, last_msg, show_help, dests):
         # “Turno de …” centrado en el cuadrante izquierdo
         p = game.get_current_player()
         nombre = p.get_name() if hasattr(p, "get_name") else p.get_color().capitalize()
-        titlef = pygame.font.SysFont(None, FONT_SIZE + 10)
-        left_center = (MARGIN + (BOARD_W - TRAY_W - BAR_W) // 4, MARGIN + BOARD_H // 2)
-        _txt(self.sc, f"Turno de {nombre}", left_center, TEXT_UNI, True, titlef)
+        _txt(self.sc, self.res.text(f"Turno de {nombre}", TEXT_UNI, FONT_SIZE + 10),
+             self.layout.turn.center, True)
 
         # Dados visibles si hay tirada
         vals = game.get_rolled_values()
         if vals:
-            canal = pygame.Rect(MARGIN + 6 * POINT_W, MARGIN, BAR_W, BOARD_H)
-            w = h = DICE_SIZE
-            gap = 10
-            y0 = MARGIN + 44
-            total = w * 2 + gap
-            x0 = canal.centerx - total // 2
-            boxes = [pygame.Rect(x0, y0, w, h), pygame.Rect(x0 + w + gap, y0, w, h)]
-            for i, rc in enumerate(boxes):
-                pygame.draw.rect(self.sc, (250, 250, 250), rc, border_radius=6)
-                pygame.draw.rect(self.sc, (60, 60, 60), rc, 2, border_radius=6)
-                if i < len(vals):
-                    _pips(self.sc, rc, vals[i])
+            for i, rc in enumerate(self.layout.dice):
+                self.res.blit_die(self.sc, vals[i] if i < len(vals) else 0, rc.topleft)
 
         # Destinos legales resaltados
-        dests = {d for _, d, _ in (legal_moves or [])}
         for idx, rc in self.hitmap.items():
             if idx in dests:
                 pygame.draw.rect(self.sc, HILIGHT, rc, 2)
@@ -220,24 +270,31 @@ class BoardRenderer:
 
         # Ayuda (opcional)
         if show_help:
-            panel = pygame.Surface((520, 110), pygame.SRCALPHA)
+            self.sc.blit(self._get_help_panel(), self.layout.help)
+
+        # Errores
+        if last_msg:
+            band = pygame.Surface(self.layout.msg.size, pygame.SRCALPHA)
+            band.fill((*ERROR, 180))
+            band.blit(self.res.text(str(last_msg), (255, 255, 255)), (10, 5))
+            self.sc.blit(band, self.layout.msg)
+
+    def _get_help_panel(self):
+        """Panel de ayuda (el texto es fijo: se arma una sola vez)."""
+        if self._help_panel is None:
+            panel = pygame.Surface((520, 130), pygame.SRCALPHA)
             panel.fill((0, 0, 0, 140))
             lines = [
                 "Controles:",
-                "T: tirar   R: reiniciar   H: ayuda   J: jugadas",
+                "T: tirar   R: reiniciar   H: ayuda   J: jugadas   B: juega el bot",
                 "Click: origen → destino. Barra=desde comida. Bandeja= sacar (bear-off).",
                 "ESC/Q/V: volver al menú",
+                "Replay: Izq/Der paso, Arriba/Abajo turno, Inicio/Fin, arrastrar la barra",
             ]
             y = 10
             for i, t in enumerate(lines):
-                f = pygame.font.SysFont(None, FONT_SIZE + (6 if i == 0 else 0))
-                panel.blit(f.render(t, True, (240, 240, 240)), (12, y))
-                y += f.get_height() + 2
-            self.sc.blit(panel, (MARGIN + 10, MARGIN + BOARD_H - 110 - 10))
-
-        # Errores
-        if last_msg:
-            band = pygame.Surface((BOARD_W, 28), pygame.SRCALPHA)
-            band.fill((*ERROR, 180))
-            band.blit(self.font.render(str(last_msg), True, (255, 255, 255)), (10, 5))
-            self.sc.blit(band, (MARGIN, MARGIN + BOARD_H - 30)) 
\ No newline at end of file
+                size = FONT_SIZE + (6 if i == 0 else 0)
+                panel.blit(self.res.text(t, (240, 240, 240), size), (12, y))
+                y += self.res.font(size).get_height() + 2
+            self._help_panel = panel
+        return self._help_panel 
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Recursos del renderer que se crean una sola vez y se reusan entre frames:
+
+- fuentes: una por tamaño (pygame.font.SysFont es lo más caro de un frame)
+- textos ya renderizados, memoizados por (texto, color, tamaño) con desalojo LRU
+- atlas: un único Surface con las fichas (cara + borde) de los dos colores y
+  las seis caras del dado (más el dado vacío), que se blitean por área
+"""
+
+from collections import OrderedDict
+
+try:
+    import pygame  # type: ignore
+except ImportError:
+    pygame = None
+
+from .constants import (
+    FONT_SIZE, DICE_SIZE, LAYER_H,
+    WHITE, WHITE_EDGE, BLACK, BLACK_EDGE,
+)
+
+TEXT_CACHE_SIZE = 512
+
+DIE_FACE = (250, 250, 250)
+DIE_EDGE = (60, 60, 60)
+PIP_COLOR = (30, 30, 30)
+PIP_R = 4
+
+
+def _pip_centers(rect, val):
+    cx, cy = rect.center
+    dx = rect.w // 4
+    dy = rect.h // 4
+    table = {
+        1: [(cx, cy)],
+        2: [(cx - dx, cy - dy), (cx + dx, cy + dy)],
+        3: [(cx, cy), (cx - dx, cy - dy), (cx + dx, cy + dy)],
+        4: [(cx - dx, cy - dy), (cx + dx, cy - dy), (cx - dx, cy + dy), (cx + dx, cy + dy)],
+        5: [(cx, cy), (cx - dx, cy - dy), (cx + dx, cy - dy), (cx - dx, cy + dy), (cx + dx, cy + dy)],
+        6: [
+            (cx - dx, cy - dy), (cx, cy - dy), (cx + dx, cy - dy),
+            (cx - dx, cy + dy), (cx, cy + dy), (cx + dx, cy + dy),
+        ],
+    }
+    return table.get(val, [])
+
+
+class RendererResources:
+    """Caché de fuentes, textos y sprites de un BoardRenderer."""
+
+    def __init__(self, font=None, text_cache_size=TEXT_CACHE_SIZE):
+        if pygame is None:
+            raise ImportError("Pygame no está instalado. pip install pygame")
+        self._fonts = {}
+        if font is not None:
+            self._fonts[FONT_SIZE] = font
+        self._texts = OrderedDict()
+        self._text_cache_size = text_cache_size
+        self.hits = 0
+        self.misses = 0
+        self._atlas = None
+        self._sprites = {}
+        self._layer_h = LAYER_H   # alto de una ficha apilada (el radio sale de acá)
+
+    # ---------- fuentes y textos ----------
+    def font(self, size=FONT_SIZE):
+        f = self._fonts.get(size)
+        if f is None:
+            f = self._fonts[size] = pygame.font.SysFont(None, size)
+        return f
+
+    def text(self, text, color, size=FONT_SIZE):
+        """Surface con 'text' renderizado (memoizado; se descarta el menos usado)."""
+        key = (text, color, size)
+        img = self._texts.get(key)
+        if img is not None:
+            self._texts.move_to_end(key)
+            self.hits += 1
+            return img
+        self.misses += 1
+        img = self.font(size).render(text, True, color)
+        self._texts[key] = img
+        if len(self._texts) > self._text_cache_size:
+            self._texts.popitem(last=False)
+        return img
+
+    # ---------- atlas de sprites ----------
+    def set_chip_size(self, layer_h):
+        """Cambia el tamaño de las fichas (al redimensionar la ventana); rehace el atlas."""
+        if layer_h != self._layer_h:
+            self._layer_h = layer_h
+            self._atlas = None
+
+    def _build_atlas(self):
+        rad = self._layer_h // 2
+        chip = 2 * (rad + 2) + 1
+        faces = list(range(7))   # 0 = dado vacío
+        width = 2 * chip + len(faces) * DICE_SIZE
+        self._atlas = pygame.Surface((width, max(chip, DICE_SIZE)), pygame.SRCALPHA)
+        self._atlas.fill((0, 0, 0, 0))
+
+        x = 0
+        for color, (face, edge) in (("blanco", (WHITE, WHITE_EDGE)), ("negro", (BLACK, BLACK_EDGE))):
+            c = (x + rad + 2, rad + 2)
+            pygame.draw.circle(self._atlas, edge, c, rad + 2)
+            pygame.draw.circle(self._atlas, face, c, rad)
+            self._sprites[("chip", color)] = pygame.Rect(x, 0, chip, chip)
+            x += chip
+        for val in faces:
+            rc = pygame.Rect(x, 0, DICE_SIZE, DICE_SIZE)
+            pygame.draw.rect(self._atlas, DIE_FACE, rc, border_radius=6)
+            pygame.draw.rect(self._atlas, DIE_EDGE, rc, 2, border_radius=6)
+            for p in _pip_centers(rc, val):
+                pygame.draw.circle(self._atlas, PIP_COLOR, p, PIP_R)
+            self._sprites[("die", val)] = rc
+            x += DICE_SIZE
+
+    def blit_chip(self, surf, color, center):
+        """Ficha de 'color' centrada en 'center'."""
+        if self._atlas is None:
+            self._build_atlas()
+        area = self._sprites[("chip", color)]
+        off = self._layer_h // 2 + 2
+        surf.blit(self._atlas, (center[0] - off, center[1] - off), area)
+
+    def blit_die(self, surf, val, topleft):
+        """Cara 'val' del dado (0 = sin valor) con la esquina superior izquierda en 'topleft'."""
+        if self._atlas is None:
+            self._build_atlas()
+        surf.blit(self._atlas, topleft, self._sprites[("die", val)])
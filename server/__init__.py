@@ -0,0 +1,8 @@
+"""
+Servidor TCP (asyncio) que hostea muchas partidas a la vez, más un generador
+de carga local para medirlo.
+"""
+
+from .server import GameServer, Session, COMMANDS
+
+__all__ = ["GameServer", "Session", "COMMANDS"]
@@ -0,0 +1,137 @@
+"""
+Generador de carga local para server/server.py.
+
+Uso:
+  python -m server.loadgen [--host H] [--port P] [--clients N] [--commands M]
+
+Abre N conexiones a la vez y cada una juega partidas de verdad (tirar, pedir
+las jugadas, mover la primera, ...) hasta mandar M comandos. Mide la latencia
+de cada comando (desde que se manda hasta que llega el "ok"/"error") y reporta
+percentiles y comandos por segundo.
+"""
+
+import argparse
+import asyncio
+import math
+import re
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+_FIRST_MOVE = re.compile(r"^\s*1\)\s+(\S+)\s+->\s+(\S+)")
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Percentil p (0..100) por rango más cercano de una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    k = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[k - 1]
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[bool, List[str]]:
+    """Lee líneas hasta el "ok"/"error" que cierra una respuesta."""
+    lines = []
+    while True:
+        raw = await reader.readline()
+        if not raw:
+            raise ConnectionError("El servidor cerró la conexión.")
+        line = raw.decode("utf-8").rstrip("\n")
+        if line in ("ok", "error"):
+            return line == "ok", lines
+        lines.append(line)
+
+
+def _point(text: str) -> str:
+    """'barra' -> -1, 'salida(24)' -> 24 (como los muestra 'jugadas')."""
+    if text == "barra":
+        return "-1"
+    if text.startswith("salida"):
+        return "24"
+    return text
+
+
+def _next_command(last: str, lines: List[str]) -> str:
+    """Siguiente comando de un jugador que siempre mueve la primera jugada legal."""
+    text = "\n".join(lines)
+    if "ganó la partida" in text:
+        return "reiniciar"
+    if last == "jugadas":
+        for line in lines:
+            m = _FIRST_MOVE.match(line)
+            if m:
+                return f"mover {_point(m.group(1))} {_point(m.group(2))}"
+        return "tirar"
+    return "tirar" if "(sin tirar)" in text else "jugadas"
+
+
+async def _client(host: str, port: int, commands: int, latencies: List[float], errors: List[int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        ok, lines = await read_response(reader)   # saludo
+        if not ok:
+            raise ConnectionError(" ".join(lines) or "Conexión rechazada.")
+        clock = time.perf_counter
+        cmd = "tirar"
+        for _ in range(commands):
+            t0 = clock()
+            writer.write((cmd + "\n").encode("utf-8"))
+            await writer.drain()
+            ok, lines = await read_response(reader)
+            latencies.append(clock() - t0)
+            if not ok:
+                errors[0] += 1
+            cmd = _next_command(cmd, lines)
+        writer.write(b"salir\n")
+        await writer.drain()
+        await read_response(reader)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def run_load(host: str, port: int, clients: int = 100, commands: int = 100) -> Dict[str, float]:
+    """Corre la carga y devuelve el reporte (latencias en milisegundos)."""
+    latencies: List[float] = []
+    errors = [0]
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(_client(host, port, commands, latencies, errors) for _ in range(clients)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - t0
+    failed = sum(isinstance(r, Exception) for r in results)
+    latencies.sort()
+    ms = [v * 1e3 for v in latencies]
+    return {
+        "clients": clients,
+        "failed_clients": failed,
+        "commands": len(latencies),
+        "errors": errors[0],
+        "seconds": elapsed,
+        "commands_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(ms, 50),
+        "p90_ms": percentile(ms, 90),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": ms[-1] if ms else 0.0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generador de carga para el servidor de Backgammon")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--clients", type=int, default=100, help="conexiones simultáneas")
+    parser.add_argument("--commands", type=int, default=100, help="comandos por conexión")
+    args = parser.parse_args(argv)
+
+    r = asyncio.run(run_load(args.host, args.port, args.clients, args.commands))
+    print(f"clientes={r['clients']} (fallidos={r['failed_clients']}) comandos={r['commands']} "
+          f"errores={r['errors']} segundos={r['seconds']:.2f} comandos/s={r['commands_per_s']:.0f}")
+    print(f"latencia ms: p50={r['p50_ms']:.2f} p90={r['p90_ms']:.2f} p99={r['p99_ms']:.2f} max={r['max_ms']:.2f}")
+    return 1 if r["failed_clients"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Servidor TCP de Backgammon: muchas partidas concurrentes en un solo proceso.
+
+Uso:
+  python -m server.server [--host H] [--port P] [--max-sessions N] [--idle-timeout S]
+
+Cada conexión es una sesión con su propia BackgammonGame. El protocolo es de
+líneas (UTF-8) y copia los comandos de la CLI:
+
+  cliente:  tirar | mover <a> <b> | jugadas | tablero | turno | reiniciar | ayuda | salir
+  servidor: la salida del comando (cero o más líneas) y después una línea
+            "ok" o "error" que cierra la respuesta
+
+Al conectarse el servidor manda "sesion <id>" + "ok". Si ya hay max_sessions
+abiertas manda "error: servidor lleno" + "error" y corta.
+
+- Backpressure: cada conexión procesa un comando por vez y no lee el siguiente
+  hasta que la respuesta anterior bajó del límite de escritura (drain). Un
+  cliente que no lee deja de ser leído (y el TCP frena al que manda).
+- Inactividad: una sola tarea recorre las sesiones cada tanto y cierra las que
+  no mandaron nada en idle_timeout segundos (también las trabadas en drain).
+"""
+
+import argparse
+import asyncio
+import io
+import itertools
+import sys
+from typing import Callable, Dict, Optional, Tuple
+
+from cli.cli import CLI
+from core.dice import Dice
+
+# comandos de partida que acepta el servidor ('bot' bloquearía el event loop)
+COMMANDS = frozenset({"ayuda", "tablero", "turno", "tirar", "jugadas", "legales", "mover", "move", "reiniciar"})
+
+OK = "ok\n"
+ERROR = "error\n"
+
+
+class Session:
+    """Una partida hosteada: la CLI de siempre escribiendo en un buffer propio."""
+
+    def __init__(self, sid: int, dice=None):
+        self.id = sid
+        self._out = io.StringIO()
+        self.cli = CLI(out=self._out)
+        self.cli.mostrar_tablero = False   # el tablero sólo con 'tablero'
+        self.cli.nueva_partida(dice)
+        self.commands = 0
+        self.last_active = 0.0
+
+    def execute(self, line: str) -> Tuple[bool, str]:
+        """Corre un comando; devuelve (anduvo, salida)."""
+        self.commands += 1
+        parts = line.split()
+        if parts and parts[0].lower() not in COMMANDS:
+            return False, f"Comando no disponible: {parts[0]}. Opciones: {', '.join(sorted(COMMANDS))}, salir\n"
+        ok = self.cli.ejecutar(line)
+        text = self._out.getvalue()
+        self._out.seek(0)
+        self._out.truncate()
+        return ok, text
+
+
+class GameServer:
+    """Acepta conexiones y le da a cada una su Session."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 7000, max_sessions: int = 5000,
+                 idle_timeout: float = 300.0, max_line: int = 1024, write_limit: int = 64 * 1024,
+                 dice_factory: Callable[[], object] = Dice):
+        if max_sessions < 1:
+            raise ValueError("max_sessions tiene que ser al menos 1.")
+        if idle_timeout <= 0:
+            raise ValueError("idle_timeout tiene que ser positivo.")
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_line = max_line
+        self.write_limit = write_limit
+        self.dice_factory = dice_factory
+        self.sessions: Dict[int, Session] = {}
+        self._writers: Dict[int, asyncio.StreamWriter] = {}
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self.accepted = 0
+        self.rejected = 0
+        self.evicted = 0
+        self.commands = 0
+
+    # ---------- ciclo de vida ----------
+    async def start(self) -> None:
+        """Empieza a escuchar (con port=0 el sistema elige el puerto; queda en self.port)."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port,
+                                                  limit=self.max_line, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._reaper = asyncio.create_task(self._reap())
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._writers.values()):
+            writer.transport.abort()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def snapshot(self) -> dict:
+        return {"sessions": len(self.sessions), "accepted": self.accepted, "rejected": self.rejected,
+                "evicted": self.evicted, "commands": self.commands}
+
+    # ---------- conexiones ----------
+    async def _send(self, writer: asyncio.StreamWriter, text: str, ok: bool) -> None:
+        if text and not text.endswith("\n"):
+            text += "\n"
+        writer.write((text + (OK if ok else ERROR)).encode("utf-8"))
+        await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if len(self.sessions) >= self.max_sessions:
+            self.rejected += 1
+            try:
+                writer.write(("error: servidor lleno\n" + ERROR).encode("utf-8"))
+                await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except ConnectionError:
+                    pass
+            return
+
+        loop = asyncio.get_running_loop()
+        writer.transport.set_write_buffer_limits(high=self.write_limit)
+        session = Session(next(self._ids), self.dice_factory())
+        session.last_active = loop.time()
+        self.sessions[session.id] = session
+        self._writers[session.id] = writer
+        self.accepted += 1
+        try:
+            await self._send(writer, f"sesion {session.id}", True)
+            while True:
+                try:
+                    raw = await reader.readline()
+                except ValueError:   # línea más larga que max_line
+                    await self._send(writer, "Línea demasiado larga.", False)
+                    break
+                if not raw:
+                    break
+                session.last_active = loop.time()
+                line = raw.decode("utf-8", "replace").strip()
+                if line.lower() == "salir":
+                    await self._send(writer, "¡Hasta luego!", True)
+                    break
+                ok, text = session.execute(line)
+                self.commands += 1
+                await self._send(writer, text, ok)
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session.id]
+            del self._writers[session.id]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _reap(self) -> None:
+        """Cierra las sesiones inactivas (o que no leen sus respuestas)."""
+        loop = asyncio.get_running_loop()
+        interval = min(self.idle_timeout / 4, 5.0)
+        while True:
+            await asyncio.sleep(interval)
+            limit = loop.time() - self.idle_timeout
+            for sid, session in list(self.sessions.items()):
+                if session.last_active > limit:
+                    continue
+                writer = self._writers[sid]
+                session.last_active = float("inf")   # no volver a desalojarla
+                self.evicted += 1
+                if writer.transport.get_write_buffer_size():
+                    writer.transport.abort()          # trabada en drain: se descarta lo pendiente
+                else:
+                    writer.write(b"Sesion cerrada por inactividad.\nerror\n")
+                    writer.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Servidor TCP de partidas de Backgammon")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--max-sessions", type=int, default=5000, help="sesiones abiertas a la vez")
+    parser.add_argument("--idle-timeout", type=float, default=300.0, help="segundos sin comandos antes de cerrar")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.host, args.port, args.max_sessions, args.idle_timeout)
+
+    async def run():
+        await server.start()
+        print(f"Escuchando en {server.host}:{server.port} (máx. {server.max_sessions} sesiones)")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(server.snapshot())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from ai import bearoff
+from ai.bearoff import BearoffDB, home_of, position_index, n_positions
+from ai.search import ExpectimaxBot
+from core.board import Board
+from core.checker import Checker
+from core.game import BackgammonGame
+from core.player import Player
+from core.plays import apply_step, legal_plays
+
+
+class FixedDice:
+    def __init__(self, values):
+        self.values = values
+
+    def roll(self):
+        return list(self.values)
+
+
+class TestBearoff(unittest.TestCase):
+    """
+    Pruebas de la base de bear-off (ai/bearoff.py).
+    Se genera una base chica (hasta 4 fichas) en un directorio temporal.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.tmp, "bo4.bin")
+        bearoff.write(cls.path, 4)
+        cls.db = BearoffDB(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        shutil.rmtree(cls.tmp)
+
+    def _cells(self, white=(), black=()):
+        """Posición plana con blancas/negras a distancia p del borde."""
+        b = Board()
+        for p in white:
+            b.add_checker(24 - p, Checker("blanco"))
+        for p in black:
+            b.add_checker(p - 1, Checker("negro"))
+        return list(b.to_array())
+
+    def test_indice_combinatorio_es_biyectivo(self):
+        """Todas las distribuciones de hasta 4 fichas ocupan 0..N-1 sin huecos."""
+        idx = sorted(position_index(h) for h in bearoff._all_homes(4))
+        self.assertEqual(idx, list(range(n_positions(4))))
+        self.assertEqual(len(self.db), n_positions(4))
+
+    def test_valores_conocidos(self):
+        """Una ficha en el punto 1 sale en una tirada; distribuciones suman 1."""
+        self.assertAlmostEqual(self.db.expected_rolls((1, 0, 0, 0, 0, 0)), 1.0)
+        self.assertAlmostEqual(self.db.expected_rolls((0, 0, 0, 0, 0, 0)), 0.0)
+        for home in ((0, 0, 0, 0, 0, 4), (1, 1, 1, 1, 0, 0)):
+            self.assertAlmostEqual(sum(self.db.distribution(home)), 1.0, places=3)
+        self.assertGreater(self.db.expected_rolls((0, 0, 0, 0, 0, 4)),
+                           self.db.expected_rolls((4, 0, 0, 0, 0, 0)))
+
+    def test_probabilidad_de_ganar(self):
+        """Con una ficha en el 6 contra una en el 1, al turno se gana sumando 6+ pips (27/36)."""
+        self.assertAlmostEqual(self.db.win_probability((0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)),
+                               27 / 36, places=3)
+        cells = self._cells(white=[6], black=[1])
+        self.assertAlmostEqual(self.db.race_win_probability(cells, "blanco"), 27 / 36, places=3)
+        self.assertAlmostEqual(self.db.race_win_probability(cells, "negro"), 1.0, places=3)
+
+    def test_fuera_de_la_base(self):
+        """Con contacto, fichas fuera del home o más fichas que la base, no hay valor."""
+        self.assertIsNone(home_of(self._cells(white=[7]), "blanco"))
+        self.assertIsNone(self.db.race_win_probability(self._cells(white=[7], black=[1]), "blanco"))
+        self.assertFalse(self.db.covers((5, 0, 0, 0, 0, 0)))
+        with self.assertRaises(ValueError):
+            self.db.expected_rolls((5, 0, 0, 0, 0, 0))
+
+    def test_movimientos_igual_que_el_motor(self):
+        """Las posiciones finales de cada tirada coinciden con core.plays.legal_plays."""
+        rng = random.Random(4)
+        for _ in range(40):
+            color = rng.choice(("blanco", "negro"))
+            dists = [rng.randint(1, 6) for _ in range(rng.randint(1, 4))]
+            cells = self._cells(white=dists) if color == "blanco" else self._cells(black=dists)
+            home = home_of(cells, color)
+            a, b = rng.randint(1, 6), rng.randint(1, 6)
+            dice = [a] * 4 if a == b else [a, b]
+            engine = set()
+            for play in legal_plays(cells, color, dice):
+                pos = cells
+                for step in play:
+                    pos = apply_step(pos, color, step)
+                engine.add(home_of(pos, color))
+            self.assertEqual(engine, bearoff._results(home, tuple(dice)), (home, dice))
+
+    def test_archivo_invalido(self):
+        """Un archivo que no es una base de bear-off levanta ValueError."""
+        bad = os.path.join(self.tmp, "malo.bin")
+        with open(bad, "wb") as f:
+            f.write(b"no es una base de bear-off")
+        with self.assertRaises(ValueError):
+            BearoffDB(bad)
+
+    def test_bot_usa_la_base_en_carrera(self):
+        """En carrera el bot no busca a 2-ply y elige la jugada con mayor P(ganar)."""
+        b = Board()
+        for p in (6, 6, 1):
+            b.add_checker(24 - p, Checker("blanco"))
+        for p in (2, 2):
+            b.add_checker(p - 1, Checker("negro"))
+        game = BackgammonGame(b, Player("B", "blanco"), Player("N", "negro"), FixedDice([5, 1]))
+        game.roll_dice()
+        res = ExpectimaxBot(depth=2, bearoff=self.db).analyze(game)
+        self.assertEqual(res.depth, 1)
+
+        def p_win(play):
+            pos = list(b.to_array())
+            for step in play:
+                pos = apply_step(pos, "blanco", step)
+            return 1.0 - self.db.race_win_probability(pos, "negro")
+
+        self.assertAlmostEqual(p_win(res.play), max(p_win(p) for p in game.legal_plays()))
+
+
+if __name__ == "__main__":
+    unittest.main()
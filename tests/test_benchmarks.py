@@ -0,0 +1,81 @@
+import unittest
+
+from benchmarks.memory import MEMORY_BENCHMARKS, measure_memory
+from benchmarks.run import BENCHMARKS, compare, load_corpus, measure
+from core.position_id import game_from_state_id
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Pruebas del runner de benchmarks (benchmarks/run.py): estadísticas,
+    comparación contra baseline y corpus.
+    """
+
+    def _result(self, us):
+        return {"results": {"legal_moves": {"us_per_op": us}}}
+
+    def test_measure_devuelve_estadisticas(self):
+        """measure corre warmup + repeat veces y calcula us/op y ops/s."""
+        calls = []
+        stats = measure(lambda: calls.append(1), ops=10, warmup=2, repeat=5)
+        self.assertEqual(len(calls), 7)
+        self.assertEqual(stats["repeat"], 5)
+        self.assertLessEqual(stats["min"], stats["median"])
+        self.assertAlmostEqual(stats["us_per_op"], stats["median"] / 10 * 1e6)
+
+    def test_compare_detecta_regresion(self):
+        """Más lento que baseline * (1 + umbral) es regresión."""
+        rows = compare(self._result(120.0), self._result(100.0), threshold=0.15)
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0]["regression"])
+        self.assertAlmostEqual(rows[0]["ratio"], 1.2)
+
+    def test_compare_dentro_del_umbral(self):
+        """Una variación chica (o una mejora) no es regresión."""
+        self.assertFalse(compare(self._result(110.0), self._result(100.0), 0.15)[0]["regression"])
+        self.assertFalse(compare(self._result(50.0), self._result(100.0), 0.15)[0]["regression"])
+
+    def test_compare_ignora_benchmarks_faltantes(self):
+        """Los benchmarks que no corrieron no se comparan."""
+        self.assertEqual(compare({"results": {}}, self._result(100.0)), [])
+
+    def test_corpus_carga_estados_validos(self):
+        """El corpus tiene estados positionID:matchID que se pueden cargar."""
+        corpus = load_corpus()
+        self.assertEqual(len(corpus), 200)
+        for sid in corpus[:10]:
+            game_from_state_id(sid)
+
+    def test_benchmark_de_motor_corre(self):
+        """Las fábricas preparan una función que corre sin errores."""
+        fn, ops = BENCHMARKS["legal_moves"](load_corpus()[:5])
+        self.assertEqual(ops, 5)
+        fn()
+        fn, ops = BENCHMARKS["new_game"](load_corpus()[:5])
+        self.assertEqual(ops, 1000)
+        fn()
+
+
+class TestMemoryBenchmarks(unittest.TestCase):
+    """Pruebas del benchmark de memoria (benchmarks/memory.py)."""
+
+    def test_measure_memory_cuenta_bytes_por_instancia(self):
+        """Con instancias de tamaño conocido da ese tamaño (sin contar la lista que las guarda)."""
+        r = measure_memory(lambda i: bytearray(1000), 200)
+        self.assertEqual(r["count"], 200)
+        self.assertGreaterEqual(r["bytes_per_instance"], 1000)
+        self.assertLess(r["bytes_per_instance"], 1200)
+        with self.assertRaises(ValueError):
+            measure_memory(lambda i: None, 0)
+
+    def test_benchmarks_de_memoria_corren(self):
+        """Cada fábrica crea instancias; la posición compacta ocupa menos que la de Board."""
+        corpus = load_corpus()[:5]
+        r = {name: measure_memory(factory(corpus), 50)["bytes_per_instance"]
+             for name, factory in MEMORY_BENCHMARKS.items()}
+        self.assertLess(r["compact_position"], r["position"])
+        self.assertLess(r["position"], r["game"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from core.board import Board
 from core.checker import Checker
@@ -149,6 +150,114 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(len(self.board.get_point(11)), 5)   # 5 blancas
         self.assertEqual(len(self.board.get_point(5)), 5)    # 5 negras
 
+    def test_setup_y_from_array_usan_fichas_compartidas(self):
+        """Ni setup_standard() ni from_array() crean un objeto por ficha."""
+        self.board.setup_standard()
+        fichas = [ch for p in self.board.get_points() for ch in p]
+        self.assertEqual({id(ch) for ch in fichas}, {id(Checker.of("blanco")), id(Checker.of("negro"))})
+        cells = self.board.to_array()
+        cells[24] = 1
+        cells[0] = 1
+        copia = Board.from_array(cells)
+        self.assertIs(copia.get_bar()["blanco"][0], Checker.of("blanco"))
+        self.assertTrue(all(ch is Checker.of("negro") for ch in copia.get_point(23)))
+
+    # ---------- bear-off / copia / array plano ----------
+
+    def test_bear_off_suma_retiradas(self):
+        """bear_off(idx) quita la ficha del punto y la cuenta en get_off(color)."""
+        self.board.add_checker(22, Checker("blanco"))
+        self.board.bear_off(22)
+        self.assertEqual(self.board.count_at(22), 0)
+        self.assertEqual(self.board.get_off("blanco"), 1)
+        self.assertEqual(self.board.get_off("negro"), 0)
+
+    def test_copy_independiente(self):
+        """copy() devuelve un tablero con la misma posición que no comparte estado."""
+        self.board.setup_standard()
+        otro = self.board.copy()
+        self.assertEqual(otro.to_array(), self.board.to_array())
+        otro.remove_checker(0)
+        self.assertEqual(self.board.count_at(0), 2)
+
+    def test_to_array_con_signo(self):
+        """to_array() usa +n para blanco, -n para negro y slots de barra/retiradas."""
+        self.board.setup_standard()
+        self.board.send_to_bar(Checker("negro"))
+        cells = self.board.to_array()
+        self.assertEqual(len(cells), 28)
+        self.assertEqual(cells[0], 2)
+        self.assertEqual(cells[5], -5)
+        self.assertEqual(cells[25], 1)
+
+    def test_from_array_inversa_de_to_array(self):
+        """from_array(to_array()) reconstruye la posición con barra y retiradas."""
+        self.board.setup_standard()
+        self.board.send_to_bar(self.board.remove_checker(0))
+        self.board.bear_off(18)
+        otro = type(self.board).from_array(self.board.to_array())
+        self.assertEqual(otro.to_array(), self.board.to_array())
+        self.assertEqual(otro.get_hash(), self.board.get_hash())
+        self.assertEqual(otro.pip_count("blanco"), self.board.pip_count("blanco"))
+        with self.assertRaises(ValueError):
+            type(self.board).from_array([0] * 5)
+
+    # ---------- agregados por color ----------
+
+    def test_agregados_posicion_estandar(self):
+        """En la apertura: 167 pips por color, 10 fichas fuera del home y ninguna en barra."""
+        self.board.setup_standard()
+        for color in ("blanco", "negro"):
+            self.assertEqual(self.board.pip_count(color), 167)
+            self.assertEqual(self.board.count_on_board(color), 15)
+            self.assertEqual(self.board.count_outside_home(color), 10)
+            self.assertEqual(self.board.count_on_bar(color), 0)
+        self.assertEqual(self.board.furthest_back("blanco"), 0)
+        self.assertEqual(self.board.furthest_back("negro"), 23)
+
+    def test_agregados_siguen_a_las_mutaciones(self):
+        """Mover, comer, barra y bear-off mantienen pips y ficha más atrasada."""
+        self.board.setup_standard()
+        self.board.move_checker(0, 4, self.board.get_point(0)[-1])
+        self.board.move_checker(0, 4, self.board.get_point(0)[-1])
+        self.assertEqual(self.board.pip_count("blanco"), 167 - 8)
+        self.assertEqual(self.board.furthest_back("blanco"), 4)
+        self.board.send_to_bar(self.board.remove_checker(4))
+        self.assertEqual(self.board.count_on_bar("blanco"), 1)
+        self.assertEqual(self.board.pip_count("blanco"), 167 - 8 - 20 + 25)
+        self.board.bear_off(18)
+        self.assertEqual(self.board.count_on_board("blanco"), 13)
+        self.assertEqual(self.board.get_off("blanco"), 1)
+
+    def test_agregados_coinciden_con_recorrido_completo(self):
+        """Tras muchas mutaciones al azar, los agregados igualan un recorrido de los 24 puntos."""
+        rng = random.Random(3)
+        self.board.setup_standard()
+        for _ in range(300):
+            idx = rng.randrange(24)
+            owner = self.board.owner_at(idx)
+            if owner is None:
+                continue
+            dest = rng.randrange(24)
+            if self.board.owner_at(dest) not in (None, owner):
+                self.board.send_to_bar(self.board.remove_checker(idx))
+            else:
+                self.board.move_checker(idx, dest, self.board.get_point(idx)[-1])
+            for color in ("blanco", "negro"):
+                pts = [i for i in range(24) if self.board.owner_at(i) == color]
+                pips = sum(self.board.count_at(i) * (24 - i if color == "blanco" else i + 1) for i in pts)
+                pips += 25 * len(self.board.get_bar()[color])
+                self.assertEqual(self.board.pip_count(color), pips)
+                back = (min(pts) if color == "blanco" else max(pts)) if pts else None
+                self.assertEqual(self.board.furthest_back(color), back)
+
+    def test_agregados_tablero_vacio(self):
+        """Sin fichas: 0 pips y ninguna ficha atrasada; color inválido levanta ValueError."""
+        self.assertEqual(self.board.pip_count("negro"), 0)
+        self.assertIsNone(self.board.furthest_back("negro"))
+        with self.assertRaises(ValueError):
+            self.board.pip_count("verde")
+
     # ---------- cuadrantes / ASCII ----------
 
     def test_get_quadrant_bordes(self):
@@ -40,6 +40,24 @@ class TestChecker(unittest.TestCase):
         ficha = Checker("blanco")
         with self.assertRaises(ValueError):
             ficha.set_color("rojo") 
+    def test_of_devuelve_la_ficha_compartida(self):
+        """
+        Checker.of(color) devuelve siempre el mismo objeto por color.
+        """
+        self.assertIs(Checker.of("blanco"), Checker.of("blanco"))
+        self.assertIsNot(Checker.of("blanco"), Checker.of("negro"))
+        self.assertEqual(Checker.of("negro").get_color(), "negro")
+        with self.assertRaises(ValueError):
+            Checker.of("rojo")
+
+    def test_ficha_compartida_inmutable(self):
+        """
+        La ficha compartida no puede cambiar de color (la usan todos los tableros).
+        """
+        with self.assertRaises(ValueError):
+            Checker.of("blanco").set_color("negro")
+        self.assertEqual(Checker.of("blanco").get_color(), "blanco")
+
 
 if __name__ == '__main__':
     unittest.main()          
\ No newline at end of file
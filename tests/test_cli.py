@@ -7,7 +7,7 @@ from cli.cli import CLI
 from core.game import BackgammonGame
 from core.board import Board
 from core.player import Player
-from core.dice import Dice
+from core.dice import Dice, ScriptedDice
 from core.checker import Checker
 
 
@@ -113,6 +113,34 @@ class TestCLI(unittest.TestCase):
                 cli.cmdloop()
                 self.assertGreaterEqual(mv.call_count, 1)
 
+    # ---------- bot ----------
+
+    def test_bot_juega_el_turno(self):
+        """'bot' tira si hace falta, juega todos los dados y pasa el turno al rival."""
+        with patch("builtins.input", side_effect=["1", "bot", "volver", "4"]), \
+             patch.object(Dice, "roll", return_value=[6, 1]), \
+             redirect_stdout(StringIO()):
+            self.cli.cmdloop()
+        self.assertEqual(self.cli.game.get_current_player().get_color(), "negro")
+        self.assertEqual(self.cli.board.pip_count("blanco"), 167 - 7)
+        self.assertIsNotNone(self.cli.bot)
+
+    def test_bot_se_crea_recien_al_usarlo(self):
+        """La CLI no arma el ExpectimaxBot hasta el primer comando 'bot'."""
+        self.assertIsNone(CLI().bot)
+
+    def test_bot_sin_jugadas_pasa_turno(self):
+        """Si no hay jugadas con los dados tirados, el bot pasa el turno."""
+        self.cli._nuevo_juego()
+        self.cli.board.send_to_bar(self.cli.board.remove_checker(0))
+        for i in (21, 22):  # entradas de blanco con 3 y 2 bloqueadas
+            for _ in range(2):
+                self.cli.board.add_checker(i, Checker("negro"))
+        with patch.object(Dice, "roll", return_value=[3, 2]), redirect_stdout(StringIO()):
+            self.cli.game.roll_dice()
+            self.cli._jugar_bot()
+        self.assertEqual(self.cli.game.get_current_player().get_color(), "negro")
+
     # ---------- caminos de 'cmd.isdigit()' ----------
 
     def test_cmd_solo_numero(self):
@@ -138,6 +166,30 @@ class TestCLI(unittest.TestCase):
             self.cli.board.remove_checker(0)
             self.cli.cmdloop()
 
+    # ---------- stats ----------
+
+    def test_stats_activa_y_muestra_contadores(self):
+        """'stats' activa la medición, sobrevive a 'reiniciar' y muestra llamadas y rechazos."""
+        out = StringIO()
+        with patch("builtins.input", side_effect=["1", "stats", "reiniciar", "tirar", "mover 0 2",
+                                                  "stats", "volver", "4"]), \
+             patch.object(Dice, "roll", return_value=[6, 5]), \
+             redirect_stdout(out):
+            self.cli.cmdloop()
+        text = out.getvalue()
+        self.assertIn("Instrumentación activada", text)
+        self.assertEqual(self.cli.stats.calls["roll_dice"], 1)
+        self.assertEqual(self.cli.stats.calls["move"], 1)
+        self.assertIn("no coincide con la tirada", text.split("Movimientos rechazados:")[1])
+
+    def test_stats_off_desinstrumenta(self):
+        """'stats off' devuelve la partida a BackgammonGame."""
+        with patch("builtins.input", side_effect=["1", "stats", "stats off", "volver", "4"]), \
+             redirect_stdout(StringIO()):
+            self.cli.cmdloop()
+        self.assertIsNone(self.cli.stats)
+        self.assertIs(type(self.cli.game), BackgammonGame)
+
     # ---------- reiniciar ----------
 
     def test_reiniciar_crea_nuevas_instancias(self):
@@ -152,6 +204,116 @@ class TestCLI(unittest.TestCase):
             self.assertIsInstance(self.cli.dice, Dice)
 
 
+
+class TestScriptMode(unittest.TestCase):
+    """
+    Modo guion: comandos desde un archivo / stdin, sin menú ni input(),
+    con dados guionados. El código de salida dice si todo anduvo.
+    """
+
+    def _run(self, lineas, **kw):
+        out = StringIO()
+        cli = CLI(out=out)
+        code = cli.run_script(lineas, **kw)
+        return cli, code, out.getvalue()
+
+    def test_guion_correcto_devuelve_cero(self):
+        """Todos los comandos válidos: código 0 y las movidas quedan aplicadas."""
+        cli, code, text = self._run(["tirar", "mover 11 16", "# comentario", "", "mover 0 1"],
+                                    tiradas=[(5, 1)])
+        self.assertEqual(code, 0)
+        self.assertIn("> mover 11 16", text)
+        self.assertIn("comandos con error: 0", text)
+        self.assertEqual(cli.game.get_current_player().get_color(), "negro")
+
+    def test_comando_fallido_devuelve_uno(self):
+        """Un movimiento inválido cuenta como error, pero el guion sigue."""
+        cli, code, text = self._run(["tirar", "mover 0 4", "mover 11 16", "cualquiera"], tiradas=[(5, 1)])
+        self.assertEqual(code, 1)
+        self.assertIn("[línea 2] falló: mover 0 4", text)
+        self.assertIn("[línea 4] falló: cualquiera", text)
+        self.assertIn("comandos con error: 2", text)
+
+    def test_parar_en_error(self):
+        """Con parar_en_error se corta en el primer comando que falla."""
+        cli, code, text = self._run(["mover 11 16", "tirar"], tiradas=[(5, 1)], parar_en_error=True)
+        self.assertEqual(code, 1)
+        self.assertNotIn("> tirar", text)
+
+    def test_tablero_sin_eco_por_defecto(self):
+        """Sin mostrar_tablero sólo el comando 'tablero' imprime el tablero."""
+        ascii_inicial = CLI()
+        ascii_inicial._nuevo_juego()
+        dump = ascii_inicial.board.to_ascii()
+        _, _, text = self._run(["tirar"], tiradas=[(5, 1)])
+        self.assertNotIn(dump, text)
+        _, _, text = self._run(["tablero"])
+        self.assertIn(dump, text)
+        _, _, text = self._run(["tirar"], tiradas=[(5, 1)], mostrar_tablero=True)
+        self.assertIn("Dados tirados", text)
+        self.assertIn("\n".join(dump.splitlines()[:2]), text)
+
+    def test_tirar_con_valores(self):
+        """'tirar d1 d2' fuerza la tirada; las del guion siguen después."""
+        cli, code, text = self._run(["tirar 6 6"], tiradas=[(2, 1)])
+        self.assertEqual(code, 0)
+        self.assertEqual(cli.game.get_rolled_values(), [6, 6, 6, 6])
+        self.assertEqual(cli.dice.remaining(), 1)
+
+    def test_reiniciar_sigue_las_tiradas_del_guion(self):
+        """Después de 'reiniciar' las tiradas siguen saliendo del guion, no de dados al azar."""
+        cli, code, text = self._run(["tirar", "reiniciar", "tirar"], tiradas=[(3, 1), (6, 6)])
+        self.assertEqual(code, 0)
+        self.assertIsInstance(cli.dice, ScriptedDice)
+        self.assertEqual(cli.game.get_rolled_values(), [6, 6, 6, 6])
+        self.assertIn("Dados tirados: [6, 6, 6, 6]", text)
+
+    def test_nueva_partida_con_dados(self):
+        """nueva_partida(dice) arma la partida con esos dados, sin menú."""
+        cli = CLI(out=StringIO())
+        dice = ScriptedDice([(2, 1)])
+        cli.nueva_partida(dice)
+        self.assertIs(cli.dice, dice)
+        self.assertEqual(cli.game.roll_dice(), [2, 1])
+
+    def test_guion_sin_tiradas(self):
+        """Si se acaban las tiradas, 'tirar' falla con un error y no rompe el guion."""
+        _, code, text = self._run(["tirar", "turno"])
+        self.assertEqual(code, 1)
+        self.assertIn("Se terminaron las tiradas", text)
+        self.assertIn("Turno de: blanco", text)
+
+    def test_volver_corta_el_guion(self):
+        """'volver' / 'salir' terminan el guion sin contar como error."""
+        _, code, text = self._run(["turno", "salir", "cualquiera"])
+        self.assertEqual(code, 0)
+        self.assertNotIn("cualquiera", text)
+
+    def test_main_lee_stdin(self):
+        """main(['--script', '-']) lee los comandos de stdin y devuelve el código."""
+        from cli import cli as modulo
+        with patch("sys.stdin", StringIO("tirar\nmover 11 16\nmover 0 1\n")), \
+             patch.object(modulo, "open", create=True, side_effect=lambda *a, **k: _Sink()):
+            self.assertEqual(modulo.main(["--script", "-", "--tiradas", "5-1"]), 0)
+        with patch("sys.stdin", StringIO("mover 11 16\n")), \
+             patch.object(modulo, "open", create=True, side_effect=lambda *a, **k: _Sink()):
+            self.assertEqual(modulo.main(["--script", "-"]), 1)
+
+    def test_parse_tiradas(self):
+        """Las tiradas se escriben '31', '3-1' o '3,1'."""
+        from cli.cli import _parse_tiradas
+        self.assertEqual(_parse_tiradas("31 6-6 5,2"), [(3, 1), (6, 6), (5, 2)])
+        with self.assertRaises(ValueError):
+            _parse_tiradas("3")
+
+
+class _Sink(StringIO):
+    """Reemplaza al stdout con buffer de main() en los tests."""
+
+    def close(self):
+        pass
+
+
 if __name__ == "__main__":
     unittest.main() 
   
\ No newline at end of file
@@ -0,0 +1,93 @@
+import unittest
+from array import array
+
+from core.board import Board, N_SLOTS, SLOT_BAR, SLOT_OFF
+from core.compact_board import CompactBoard
+from core.checker import Checker
+from core.player import Player
+from core.dice import Dice
+from core.game import BackgammonGame
+from tests import test_board, test_game
+
+
+class TestCompactBoardContrato(test_board.TestBoard):
+    """
+    Corre TODO el contrato de tests/test_board.py contra CompactBoard.
+    Si pasa, BackgammonGame y el renderer pueden usarlo sin cambios.
+    """
+
+    def setUp(self):
+        self.board = CompactBoard()
+
+
+class TestGameConCompactBoard(test_game.TestGame):
+    """Las reglas de BackgammonGame deben comportarse igual sobre CompactBoard."""
+
+    def setUp(self):
+        self.board = CompactBoard()
+        self.white = Player("Blanco", "blanco")
+        self.black = Player("Negro", "negro")
+        self.dice = Dice()
+        self.game = BackgammonGame(self.board, self.white, self.black, self.dice)
+
+
+class TestCompactBoard(unittest.TestCase):
+    """Pruebas propias del layout plano de CompactBoard."""
+
+    def setUp(self):
+        self.board = CompactBoard()
+
+    def test_layout_con_signo(self):
+        """Blanco suma, negro resta; barra y retiradas en sus slots."""
+        self.board.add_checker(3, Checker("blanco"))
+        self.board.add_checker(3, Checker("blanco"))
+        self.board.add_checker(9, Checker("negro"))
+        self.board.send_to_bar(Checker("negro"))
+        cells = self.board.get_cells()
+        self.assertEqual(len(cells), N_SLOTS)
+        self.assertEqual(cells[3], 2)
+        self.assertEqual(cells[9], -1)
+        self.assertEqual(cells[SLOT_BAR["negro"]], 1)
+
+    def test_no_mezcla_colores_en_un_punto(self):
+        """Agregar una ficha sobre un punto rival levanta ValueError."""
+        self.board.add_checker(4, Checker("negro"))
+        with self.assertRaises(ValueError):
+            self.board.add_checker(4, Checker("blanco"))
+
+    def test_bear_off_cuenta_retiradas(self):
+        """bear_off() quita la ficha del punto y suma en el slot de retiradas."""
+        self.board.add_checker(20, Checker("blanco"))
+        self.board.bear_off(20)
+        self.assertEqual(self.board.count_at(20), 0)
+        self.assertEqual(self.board.get_off("blanco"), 1)
+        self.assertEqual(self.board.get_cells()[SLOT_OFF["blanco"]], 1)
+
+    def test_setup_standard_igual_a_board(self):
+        """La posición inicial coincide slot a slot con la de Board."""
+        ref = Board()
+        ref.setup_standard()
+        self.board.setup_standard()
+        self.assertEqual(self.board.to_array(), ref.to_array())
+
+    def test_copy_es_independiente(self):
+        """copy() duplica el buffer: mover en la copia no afecta al original."""
+        self.board.setup_standard()
+        otro = self.board.copy()
+        otro.move_checker(0, 1, Checker("blanco"))
+        self.assertEqual(self.board.count_at(0), 2)
+        self.assertEqual(otro.count_at(0), 1)
+
+    def test_from_array_roundtrip(self):
+        """from_array() acepta array, bytes o lista y reconstruye la posición."""
+        self.board.setup_standard()
+        datos = self.board.to_array()
+        for fuente in (datos, datos.tobytes(), list(datos)):
+            nuevo = CompactBoard.from_array(fuente)
+            self.assertEqual(nuevo.to_array(), datos)
+        with self.assertRaises(ValueError):
+            CompactBoard.from_array(array("b", [0, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from core.dice import Dice
+from core.dice import Dice, BufferedDice, ScriptedDice, np
 
 class TestDice(unittest.TestCase):
 
@@ -51,6 +51,101 @@ class TestDice(unittest.TestCase):
         """
         with self.assertRaises(ValueError):
             self.dice.set_values([0, 7])
+
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class TestBufferedDice(unittest.TestCase):
+    """
+    Pruebas de BufferedDice: tiradas por bloques, semillas y flujos independientes.
+    """
+
+    def _rolls(self, dice, n=50):
+        return [tuple(dice.roll()) for _ in range(n)]
+
+    def test_tiradas_validas_y_dobles(self):
+        """Valores 1..6, 2 o 4 valores por tirada, también al recargar bloques chicos."""
+        dice = BufferedDice(seed=1, block=3)
+        for values in self._rolls(dice, 100):
+            self.assertTrue(all(1 <= v <= 6 for v in values))
+            self.assertIn(len(values), (2, 4))
+            if len(values) == 4:
+                self.assertEqual(len(set(values)), 1)
+        self.assertEqual(dice.get_values(), list(values))
+
+    def test_misma_semilla_misma_secuencia(self):
+        """La secuencia depende de la semilla y no del tamaño de bloque."""
+        self.assertEqual(self._rolls(BufferedDice(7, block=4)), self._rolls(BufferedDice(7, block=1000)))
+        self.assertNotEqual(self._rolls(BufferedDice(7)), self._rolls(BufferedDice(8)))
+
+    def test_flujo_por_partida(self):
+        """for_game() es reproducible por (seed, game_id) y distinto entre partidas."""
+        a = self._rolls(BufferedDice.for_game(3, 10))
+        self.assertEqual(a, self._rolls(BufferedDice.for_game(3, 10)))
+        self.assertNotEqual(a, self._rolls(BufferedDice.for_game(3, 11)))
+
+    def test_spawn_flujos_independientes(self):
+        """Los hijos de spawn() difieren entre sí y se repiten con la misma semilla."""
+        hijos = BufferedDice(5).spawn(3)
+        seqs = [self._rolls(d) for d in hijos]
+        self.assertEqual(len(set(map(tuple, seqs))), 3)
+        self.assertEqual(seqs[0], self._rolls(BufferedDice(5).spawn(3)[0]))
+
+    def test_frecuencia_de_dobles(self):
+        """Sobre muchas tiradas, los dobles salen cerca de 1/6 de las veces."""
+        dice = BufferedDice(11)
+        dobles = sum(len(dice.roll()) == 4 for _ in range(12000))
+        self.assertAlmostEqual(dobles / 12000, 1 / 6, delta=0.02)
+
+    def test_bloque_invalido(self):
+        """Un bloque vacío levanta ValueError."""
+        with self.assertRaises(ValueError):
+            BufferedDice(1, block=0)
+
+
+class TestScriptedDice(unittest.TestCase):
+    """
+    Pruebas de ScriptedDice: repite un guion fijo de tiradas.
+    """
+
+    def test_repite_el_guion(self):
+        """Devuelve las tiradas en orden y expande los dobles."""
+        dice = ScriptedDice([(3, 1), (4, 4), [6, 6, 6, 6]])
+        self.assertEqual(dice.roll(), [3, 1])
+        self.assertEqual(dice.roll(), [4, 4, 4, 4])
+        self.assertEqual(dice.remaining(), 1)
+        self.assertEqual(dice.roll(), [6, 6, 6, 6])
+        self.assertEqual(dice.get_values(), [6, 6, 6, 6])
+
+    def test_guion_agotado(self):
+        """Cuando no quedan tiradas, roll() levanta ValueError."""
+        dice = ScriptedDice([(2, 5)])
+        dice.roll()
+        with self.assertRaises(ValueError):
+            dice.roll()
+
+    def test_force_intercala_la_proxima_tirada(self):
+        """force() agrega una tirada antes de las que quedan, sin perder ninguna."""
+        dice = ScriptedDice([(3, 1), (2, 5)])
+        dice.roll()
+        dice.force((6, 6))
+        self.assertEqual(dice.remaining(), 2)
+        self.assertEqual(dice.roll(), [6, 6, 6, 6])
+        self.assertEqual(dice.roll(), [2, 5])
+        with self.assertRaises(ValueError):
+            dice.force((7, 1))
+        with self.assertRaises(ValueError):
+            dice.force((1, 2, 3, 4))
+
+    def test_tirada_invalida(self):
+        """Valores fuera de 1..6 o tiradas de largo raro se rechazan al construir."""
+        with self.assertRaises(ValueError):
+            ScriptedDice([(0, 3)])
+        with self.assertRaises(ValueError):
+            ScriptedDice([(1, 2, 3)])
+        with self.assertRaises(ValueError):
+            ScriptedDice([(1, 2, 3, 4)])
+
+
 if __name__ == '__main__':
     unittest.main()  
 
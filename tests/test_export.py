@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from ai.simulate import simulate
+from benchmarks.run import CORPUS_PATH
+
+
+@unittest.skipIf(pygame is None, "pygame no está instalado")
+class TestExport(unittest.TestCase):
+    """
+    Pruebas del exportador de PNG sin ventana (pygame_ui/export.py).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.out = os.path.join(self.tmp, "png")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _ids_file(self, n):
+        path = os.path.join(self.tmp, "ids.txt")
+        with open(CORPUS_PATH, encoding="utf-8") as src, open(path, "w", encoding="utf-8") as dst:
+            ids = [line for line in src if not line.startswith("#")][:n]
+            dst.write("# comentario\n4HPwATDgc/ABMA\n" + "".join(ids))
+        return path
+
+    def test_ids_a_png(self):
+        """Cada ID (con o sin match ID) da un PNG del tamaño pedido."""
+        from pygame_ui.export import export, iter_inputs
+        paths = export(iter_inputs([self._ids_file(3)]), self.out, size=(800, 560), workers=0)
+        self.assertEqual([os.path.basename(p) for p in paths],
+                         [f"ids-{i:05d}.png" for i in range(4)])
+        img = pygame.image.load(paths[0])
+        self.assertEqual(img.get_size(), (800, 560))
+
+    def test_pool_da_las_mismas_imagenes(self):
+        """Codificar en workers da los mismos píxeles que hacerlo en este proceso."""
+        from pygame_ui.export import export, iter_inputs
+        ids = self._ids_file(4)
+        local = export(iter_inputs([ids]), self.out, workers=0)
+        pooled = export(iter_inputs([ids]), os.path.join(self.tmp, "pool"), workers=1)
+        self.assertEqual(len(local), len(pooled))
+        for a, b in zip(local, pooled):
+            self.assertEqual(pygame.image.tobytes(pygame.image.load(a), "RGB"),
+                             pygame.image.tobytes(pygame.image.load(b), "RGB"))
+
+    def test_directorio_de_partidas(self):
+        """Un directorio de .bgr da una imagen por turno, más la posición final."""
+        from pygame_ui.export import iter_inputs, iter_record
+        rec = os.path.join(self.tmp, "rec")
+        list(simulate(2, workers=1, seed=3, record_dir=rec))
+        by_turn = list(iter_inputs([rec]))
+        by_step = list(iter_inputs([rec], every="step"))
+        self.assertGreater(len(by_step), len(by_turn))
+        self.assertTrue(by_turn[0][0].startswith("games-00000000-g0000-s0000"))
+        last = [g for name, g in by_turn if "-g0000-" in name][-1]
+        self.assertIsNotNone(last.get_winner())
+        with self.assertRaises(ValueError):
+            next(iter_record(os.path.join(rec, os.listdir(rec)[0]), every="ply"))
+
+
+if __name__ == "__main__":
+    unittest.main()
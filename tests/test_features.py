@@ -0,0 +1,91 @@
+import unittest
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.checker import Checker
+from ai import features
+from ai.policies import evaluate
+
+np = features.np
+
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class TestFeatures(unittest.TestCase):
+    """
+    Pruebas del evaluador vectorizado (ai/features.py).
+    Se comparan las features en lote contra lo que dicen los métodos de Board.
+    """
+
+    def _board(self, cls=Board, **puntos):
+        b = cls()
+        for clave, n in puntos.items():
+            color, idx = clave.split("_")
+            for _ in range(abs(n)):
+                b.add_checker(int(idx), Checker(color))
+        return b
+
+    def test_encode_boards_ambas_implementaciones(self):
+        """Board y CompactBoard se codifican igual en (N, 26) int8."""
+        a, c = Board(), CompactBoard()
+        a.setup_standard()
+        c.setup_standard()
+        enc = features.encode_boards([a, c])
+        self.assertEqual(enc.shape, (2, 26))
+        self.assertEqual(enc.dtype, np.int8)
+        self.assertEqual(enc[0].tolist(), enc[1].tolist())
+        self.assertEqual(enc[0, 5], -5)
+
+    def test_features_posicion_inicial(self):
+        """En la apertura: 167 pips, 4 puntos hechos, sin blots y con contacto."""
+        b = Board()
+        b.setup_standard()
+        f = features.batch_features(features.encode_boards([b]))
+        self.assertEqual(f["pips"][0].tolist(), [b.pip_count("blanco"), b.pip_count("negro")])
+        self.assertEqual(f["made"][0].tolist(), [4, 4])
+        self.assertEqual(f["blots"][0].tolist(), [0, 0])
+        self.assertEqual(f["back"][0].tolist(), [2, 2])
+        self.assertTrue(f["contact"][0])
+
+    def test_prime_y_blots(self):
+        """Seis puntos hechos seguidos dan prime 6; fichas sueltas cuentan como blots."""
+        pos = {f"blanco_{i}": 2 for i in range(8, 14)}
+        pos["blanco_20"] = 1
+        pos["negro_2"] = 1
+        pos["negro_4"] = 2
+        f = features.batch_features(features.encode_boards([self._board(**pos)]))
+        self.assertEqual(f["prime"][0].tolist(), [6, 1])
+        self.assertEqual(f["blots"][0].tolist(), [1, 1])
+
+    def test_carrera_sin_contacto(self):
+        """Si todas las blancas pasaron a todas las negras es carrera; la barra rompe la carrera."""
+        b = self._board(blanco_20=3, negro_3=2)
+        f = features.batch_features(features.encode_boards([b]))
+        self.assertTrue(f["race"][0])
+        b.send_to_bar(Checker("negro"))
+        f = features.batch_features(features.encode_boards([b]))
+        self.assertFalse(f["race"][0])
+        self.assertEqual(f["back"][0].tolist(), [0, 1])
+
+    def test_encode_cells_y_evaluate_batch(self):
+        """encode_cells() acepta posiciones de 28 slots y evaluate_batch() ordena por ventaja."""
+        mejor = self._board(blanco_22=2, negro_3=2).to_array()
+        peor = self._board(blanco_10=2, negro_3=2).to_array()
+        enc = features.encode_cells([mejor, peor])
+        self.assertEqual(enc.shape, (2, 28))
+        score = features.evaluate_batch(enc, "blanco")
+        self.assertGreater(score[0], score[1])
+        self.assertLess(features.evaluate_batch(enc, "negro")[0], features.evaluate_batch(enc, "negro")[1])
+
+    def test_evaluate_batch_igual_a_evaluate(self):
+        """Con 28 columnas, evaluate_batch() coincide con ai.policies.evaluate()."""
+        b = Board()
+        b.setup_standard()
+        b.send_to_bar(b.remove_checker(0))
+        b.bear_off(18)
+        enc = features.encode_cells([b.to_array()])
+        for color in ("blanco", "negro"):
+            self.assertAlmostEqual(features.evaluate_batch(enc, color)[0], evaluate(b, color))
+
+
+if __name__ == "__main__":
+    unittest.main()
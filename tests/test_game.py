@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import patch
 
@@ -34,6 +35,17 @@ class TestGame(unittest.TestCase):
         """Al inicio, el turno corresponde al jugador blanco."""
         self.assertEqual(self.game.get_current_player().get_color(), "blanco")
 
+    def test_restore_turn(self):
+        """restore_turn() fija color al turno y dados restantes; valida ambos."""
+        self.game.restore_turn("negro", [4, 4, 4])
+        self.assertEqual(self.game.get_current_player().get_color(), "negro")
+        self.assertEqual(self.game.get_rolled_values(), [4, 4, 4])
+        self.assertEqual(self.board.get_side_to_move(), "negro")
+        with self.assertRaises(ValueError):
+            self.game.restore_turn("rojo", [])
+        with self.assertRaises(ValueError):
+            self.game.restore_turn("blanco", [7])
+
     def test_cambio_de_turno(self):
         """end_turn() alterna entre blanco y negro."""
         self.game.end_turn()
@@ -229,6 +241,31 @@ class TestGame(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.game.move(2, -1, "negro")
 
+    # ---------- versión de estado ----------
+
+    def test_version_cambia_con_cada_cambio_de_estado(self):
+        """get_version() sube con tirada, movimiento, pase, apply/undo; no con consultas."""
+        self.board.setup_standard()
+        versiones = [self.game.get_version()]
+        with patch.object(Dice, "roll", return_value=[3, 1]):
+            self.game.roll_dice()
+        versiones.append(self.game.get_version())
+        self.game.legal_moves()
+        self.game.can_play()
+        self.game.get_winner()
+        self.assertEqual(self.game.get_version(), versiones[-1])
+        self.game.move(0, 3, "blanco")
+        versiones.append(self.game.get_version())
+        token = self.game.apply((0, 1, 1))          # usa el último dado: pasa el turno
+        versiones.append(self.game.get_version())
+        self.game.undo(token)
+        versiones.append(self.game.get_version())
+        self.game.end_turn()
+        versiones.append(self.game.get_version())
+        self.game.restore_turn("blanco", [2])
+        versiones.append(self.game.get_version())
+        self.assertEqual(len(set(versiones)), len(versiones))
+
     # ---------- legal_moves / can_play ----------
 
     def test_legal_moves_y_can_play_con_dado_simple(self):
@@ -248,6 +285,13 @@ class TestGame(unittest.TestCase):
         moves = self.game.legal_moves()
         self.assertTrue(any(mv[0] == -1 and mv[2] == 3 for mv in moves))
 
+    def test_clases_del_core_sin_dict(self):
+        """Partida, tablero, jugadores y fichas usan __slots__ (sin __dict__ por instancia)."""
+        for obj in (self.game, self.board, self.game.get_current_player(), Checker("blanco")):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+            with self.assertRaises(AttributeError):
+                obj.atributo_nuevo = 1
+
     # ---------- ganador ----------
 
     def test_has_won_y_get_winner(self):
@@ -264,6 +308,82 @@ class TestGame(unittest.TestCase):
         self.assertFalse(self.game.has_won("negro"))
         self.assertIsNone(self.game.get_winner())
 
+    # ---------- make / unmake ----------
+
+    def _estado(self):
+        b = self.board
+        return (
+            b.to_array().tobytes(), b.get_hash(),
+            self.game.get_current_player().get_color(), self.game.get_rolled_values(),
+            b.pip_count("blanco"), b.pip_count("negro"),
+            b.furthest_back("blanco"), b.furthest_back("negro"),
+        )
+
+    def test_apply_undo_comer(self):
+        """apply() de un paso que come y undo() restauran todo el estado."""
+        self.board.add_checker(0, Checker("blanco"))
+        self.board.add_checker(5, Checker("negro"))
+        with patch.object(Dice, "roll", return_value=[5, 2]):
+            self.game.roll_dice()
+        antes = self._estado()
+        tok = self.game.apply((0, 5, 5))
+        self.assertTrue(tok.hit)
+        self.assertEqual(self.board.count_on_bar("negro"), 1)
+        self.assertEqual(self.game.get_rolled_values(), [2])
+        self.game.undo(tok)
+        self.assertEqual(self._estado(), antes)
+
+    def test_apply_undo_entrada_desde_barra_y_cambio_de_turno(self):
+        """Entrar desde la barra con el último dado pasa el turno; undo lo devuelve."""
+        self.board.send_to_bar(Checker("blanco"))
+        with patch.object(Dice, "roll", return_value=[3]):
+            self.game.roll_dice()
+        antes = self._estado()
+        tok = self.game.apply((-1, 21, 3))
+        self.assertEqual(self.game.get_current_player().get_color(), "negro")
+        self.game.undo(tok)
+        self.assertEqual(self._estado(), antes)
+
+    def test_apply_undo_bear_off(self):
+        """Un bear-off con dado mayor se deshace devolviendo la ficha al punto."""
+        self.game.end_turn()
+        self.board.add_checker(2, Checker("negro"))
+        self.board.add_checker(4, Checker("negro"))
+        with patch.object(Dice, "roll", return_value=[6, 1]):
+            self.game.roll_dice()
+        antes = self._estado()
+        tok = self.game.apply((2, -1, 6))
+        self.assertEqual(self.board.get_off("negro"), 1)
+        self.game.undo(tok)
+        self.assertEqual(self._estado(), antes)
+        self.assertEqual(self.board.get_off("negro"), 0)
+
+    def test_apply_play_y_undo_play_no_crean_fichas(self):
+        """
+        Partidas al azar con apply_play()/undo_play(): el estado vuelve exacto
+        y las fichas del tablero son las mismas instancias (no se crean nuevas).
+        """
+        rng = random.Random(11)
+        self.board.setup_standard()
+        ids = {id(ch) for p in self.board.get_points() for ch in p}
+        for _ in range(60):
+            if self.game.get_winner():
+                break
+            roll = [rng.randint(1, 6), rng.randint(1, 6)]
+            with patch.object(Dice, "roll", return_value=roll * 2 if roll[0] == roll[1] else roll):
+                self.game.roll_dice()
+            antes = self._estado()
+            plays = self.game.legal_plays()
+            for play in plays:
+                tokens = self.game.apply_play(play)
+                self.game.undo_play(tokens)
+                self.assertEqual(self._estado(), antes)
+            self.game.apply_play(rng.choice(plays) if plays else ())
+        actuales = {id(ch) for p in self.board.get_points() for ch in p}
+        actuales |= {id(ch) for c in ("blanco", "negro") for ch in self.board.get_bar()[c]}
+        if type(self.board) is Board:  # CompactBoard no guarda una instancia por ficha
+            self.assertTrue(actuales <= ids)
+
 
 if __name__ == "__main__":
     unittest.main() 
@@ -0,0 +1,73 @@
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from core.board import Board
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+
+
+@unittest.skipIf(pygame is None, "pygame no está instalado")
+class TestBackgammonUI(unittest.TestCase):
+    """
+    Pruebas del bucle por eventos de la UI (driver SDL 'dummy'):
+    sólo se redibuja cuando cambia lo que se ve.
+    """
+
+    def setUp(self):
+        from pygame_ui.game_ui import BackgammonUI
+        board = Board()
+        board.setup_standard()
+        game = BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"),
+                              ScriptedDice([(3, 1)]))
+        self.ui = BackgammonUI(game)
+
+    def _run(self, batches):
+        """Corre el bucle con lotes de eventos guionados y devuelve cuántas veces dibujó."""
+        batches = list(batches) + [[pygame.event.Event(pygame.QUIT)]]
+        draws = []
+        real_draw = self.ui._draw
+        with patch.object(self.ui, "_next_events", side_effect=batches), \
+             patch.object(self.ui, "_draw", side_effect=lambda: draws.append(real_draw())):
+            with self.assertRaises(SystemExit):
+                self.ui.run()
+        return len(draws)
+
+    def _key(self, key):
+        return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+    def test_sin_cambios_no_redibuja(self):
+        """Timeouts y movimientos del mouse sobre el mismo lugar no redibujan."""
+        margin = pygame.event.Event(pygame.MOUSEMOTION, pos=(2, 2))
+        self.assertEqual(self._run([[], [margin], [], [margin]]), 1)
+
+    def test_redibuja_despues_de_cada_cambio(self):
+        """Tirar, la ayuda y el hover sobre otro punto disparan un redibujo cada uno."""
+        from pygame_ui.constants import MARGIN, POINT_W, x_col
+        punto = (x_col(11) + POINT_W // 2, MARGIN + 50)     # punto 0 (arriba a la derecha)
+        batches = [
+            [self._key(pygame.K_t)],
+            [],
+            [self._key(pygame.K_h)],
+            [pygame.event.Event(pygame.MOUSEMOTION, pos=punto)],
+            [pygame.event.Event(pygame.MOUSEMOTION, pos=punto)],
+        ]
+        self.assertEqual(self._run(batches), 4)
+        self.assertEqual(self.ui.hover, 0)
+
+    def test_next_events_espera_con_timeout(self):
+        """En modo por eventos, sin eventos vuelve vacío después del timeout."""
+        pygame.event.clear()
+        with patch("pygame_ui.game_ui.EVENT_WAIT_MS", 5):
+            self.assertEqual(self.ui._next_events(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.instrument import (GameStats, OPS, instrument, uninstrument, is_instrumented,
+                             rejection_reason)
+from core.player import Player
+
+
+class TestInstrument(unittest.TestCase):
+    """
+    Pruebas de la instrumentación opcional del motor (core/instrument.py).
+    """
+
+    def _game(self, rolls=((3, 1),), board_cls=Board):
+        board = board_cls()
+        board.setup_standard()
+        return BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), ScriptedDice(rolls))
+
+    def test_sin_instrumentar_no_cambia_la_clase(self):
+        """Una partida común no tiene nada envuelto."""
+        game = self._game()
+        self.assertIs(type(game), BackgammonGame)
+        self.assertFalse(is_instrumented(game))
+
+    def test_cuenta_llamadas_y_tiempo(self):
+        """Cada operación medida suma una llamada y tiempo no negativo."""
+        game = self._game()
+        stats = instrument(game)
+        self.assertIsInstance(game, BackgammonGame)
+        game.roll_dice()
+        game.legal_moves()
+        game.can_play()
+        game.get_winner()
+        game.move(0, 3, "blanco")
+        snap = stats.snapshot()
+        self.assertEqual(snap["ops"]["roll_dice"]["calls"], 1)
+        self.assertEqual(snap["ops"]["move"]["calls"], 1)
+        self.assertEqual(snap["ops"]["get_winner"]["calls"], 1)
+        # can_play() llama a legal_moves(): se cuenta también
+        self.assertEqual(snap["ops"]["legal_moves"]["calls"], 2)
+        self.assertTrue(all(row["seconds"] >= 0 for row in snap["ops"].values()))
+
+    def test_rechazos_por_motivo(self):
+        """Los ValueError de move se agrupan sin números y se siguen propagando."""
+        game = self._game()
+        stats = instrument(game)
+        game.roll_dice()
+        for start, end in ((0, 5), (0, 6), (0, 2)):
+            with self.assertRaises(ValueError):
+                game.move(start, end, "blanco")
+        with self.assertRaises(ValueError):
+            game.move(23, 20, "negro")
+        rejected = stats.snapshot()["rejected"]
+        self.assertEqual(rejected["El movimiento (N) no coincide con la tirada: [...]"], 3)
+        self.assertEqual(sum(rejected.values()), 4)
+        self.assertEqual(stats.calls["move"], 4)
+
+    def test_uninstrument_vuelve_a_la_clase_original(self):
+        """Al desinstrumentar la partida sigue igual y deja de contar."""
+        game = self._game()
+        stats = instrument(game)
+        game.roll_dice()
+        uninstrument(game)
+        self.assertIs(type(game), BackgammonGame)
+        game.legal_moves()
+        self.assertEqual(stats.calls["legal_moves"], 0)
+        self.assertEqual(game.get_rolled_values(), [3, 1])
+
+    def test_contadores_compartidos_y_reset(self):
+        """Varias partidas pueden sumar al mismo GameStats; reset pone todo en cero."""
+        stats = GameStats()
+        games = [self._game(), self._game(board_cls=CompactBoard)]
+        for game in games:
+            instrument(game, stats)
+            game.get_winner()
+        self.assertEqual(stats.calls["get_winner"], 2)
+        stats.reset()
+        self.assertEqual(stats.snapshot()["ops"]["get_winner"], {"calls": 0, "seconds": 0.0, "mean_us": 0.0})
+        self.assertEqual(set(stats.snapshot()["ops"]), set(OPS))
+
+    def test_rejection_reason(self):
+        self.assertEqual(rejection_reason("Punto bloqueado por negro: 5 tiene 2 fichas."),
+                         "Punto bloqueado por negro: N tiene N fichas.")
+
+    def test_format_muestra_tabla(self):
+        stats = GameStats()
+        text = stats.format()
+        for op in OPS:
+            self.assertIn(op, text)
+
+
+if __name__ == "__main__":
+    unittest.main()
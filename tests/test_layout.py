@@ -0,0 +1,82 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+@unittest.skipIf(pygame is None, "pygame no está instalado")
+class TestLayout(unittest.TestCase):
+    """
+    Pruebas de la geometría precalculada del tablero (pygame_ui/layout.py).
+    """
+
+    def setUp(self):
+        from pygame_ui.layout import Layout
+        self.Layout = Layout
+
+    def _hit_by_rects(self, layout, pos):
+        """Hit test de referencia: primer rect (en orden) que contiene pos."""
+        for idx, rc in layout.rects.items():
+            if rc.collidepoint(pos):
+                return idx
+        return None
+
+    def test_misma_geometria_que_constants(self):
+        """Al tamaño por defecto coincide con constants.py."""
+        from pygame_ui import constants as C
+        L = self.Layout()
+        self.assertEqual((L.point_w, L.bar_w, L.tray_w, L.layer_h), (C.POINT_W, C.BAR_W, C.TRAY_W, C.LAYER_H))
+        self.assertEqual(L.col_x, [C.x_col(k) for k in range(12)])
+        self.assertEqual(L.points[0], pygame.Rect(C.x_col(11), C.MARGIN, C.POINT_W, C.BOARD_H // 2))
+        self.assertEqual(L.points[12], pygame.Rect(C.x_col(0), C.MARGIN + C.BOARD_H // 2, C.POINT_W, C.BOARD_H // 2))
+
+    def test_hit_test_aritmetico_igual_a_recorrer_rects(self):
+        """hit_test da lo mismo que buscar en los rects, para varios tamaños de ventana."""
+        for size in ((1000, 680), (1280, 800), (640, 440), (777, 555)):
+            L = self.Layout(*size)
+            for x in range(0, L.width, 3):
+                for y in range(0, L.height, 7):
+                    self.assertEqual(L.hit_test((x, y)), self._hit_by_rects(L, (x, y)), (size, x, y))
+
+    def test_puntos_por_columna_y_mitad(self):
+        L = self.Layout()
+        self.assertEqual(L.hit_test(L.points[5].center), 5)
+        self.assertEqual(L.hit_test(L.points[18].center), 18)
+        self.assertEqual(L.hit_test(L.canal.center), -1)
+        self.assertEqual(L.hit_test(L.tray.center), 24)
+        self.assertIsNone(L.hit_test((2, 2)))
+
+    def test_tamano_minimo(self):
+        """Una ventana más chica que el mínimo usa la geometría del mínimo."""
+        from pygame_ui.constants import MIN_WIDTH, MIN_HEIGHT
+        L = self.Layout(100, 100)
+        self.assertEqual((L.width, L.height), (MIN_WIDTH, MIN_HEIGHT))
+        self.assertGreater(L.stack_h, 0)
+
+    def test_renderer_resize(self):
+        """Al redimensionar, el renderer rehace el layout y repinta la pantalla entera."""
+        from core.board import Board
+        from core.dice import ScriptedDice
+        from core.game import BackgammonGame
+        from core.player import Player
+        from pygame_ui.renderer import BoardRenderer
+        pygame.init()
+        screen = pygame.display.set_mode((1000, 680))
+        r = BoardRenderer(screen, pygame.font.SysFont(None, 20))
+        board = Board()
+        board.setup_standard()
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), ScriptedDice([]))
+        r.render(game)
+        screen = pygame.display.set_mode((1280, 800))
+        r.resize(screen)
+        self.assertEqual(r.render(game), [screen.get_rect()])
+        self.assertEqual(r.layout.width, 1280)
+        self.assertEqual(r.hit_test(r.layout.points[7].center), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
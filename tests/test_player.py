@@ -32,6 +32,15 @@ class TestPlayer(unittest.TestCase):
         # Verificamos que TODAS las fichas se actualicen
         self.assertTrue(all(c.get_color() == "negro" for c in jugador.get_checkers()))
 
+    def test_fichas_compartidas_con_el_tablero(self):
+        """Las fichas del jugador son la ficha compartida de su color (no se crean 15 objetos)."""
+        from core.checker import Checker
+        jugador = Player("Fausti", "blanco")
+        self.assertTrue(all(c is Checker.of("blanco") for c in jugador.get_checkers()))
+        jugador.set_color("negro")
+        self.assertTrue(all(c is Checker.of("negro") for c in jugador.get_checkers()))
+        self.assertEqual(Checker.of("blanco").get_color(), "blanco")
+
     def test_has_won(self):
         jugador = Player("Fausti", "blanco")
         # Simulamos que ya no tiene fichas
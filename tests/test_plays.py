@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch
+
+from core.board import Board
+from core.player import Player
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.checker import Checker
+from core.plays import legal_plays, step_moves, apply_step
+
+
+class TestPlays(unittest.TestCase):
+    """
+    Pruebas del generador de jugadas completas (core/plays.py).
+    Se arman posiciones chicas a mano para controlar las reglas de obligatoriedad.
+    """
+
+    def setUp(self):
+        self.board = Board()
+
+    def _poner(self, idx, color, n=1):
+        for _ in range(n):
+            self.board.add_checker(idx, Checker(color))
+
+    def _plays(self, color, dice):
+        return legal_plays(self.board.to_array(), color, dice)
+
+    def test_dos_ordenes_misma_posicion_se_deduplican(self):
+        """0->1->3 y 0->2->3 terminan igual: debe quedar una sola jugada."""
+        self._poner(0, "blanco")
+        plays = self._plays("blanco", [1, 2])
+        self.assertEqual(len(plays), 1)
+        self.assertEqual(len(plays[0]), 2)
+
+    def test_dedup_conserva_la_jugada_mas_larga(self):
+        """
+        Negro entra con 2 (-1->1) y no puede seguir; entrando con 4 y bajando 2
+        (-1->3->1) llega a la misma posición usando los dos dados: esa jugada no
+        se puede perder al deduplicar.
+        """
+        cells = [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 3, 4, 0, 0, -5, 0, 0, 1, 4, 9]
+        plays = legal_plays(cells, "negro", [4, 2])
+        self.assertIn(((-1, 3, 4), (3, 1, 2)), plays)
+        self.assertTrue(all(len(p) == 2 for p in plays))
+
+    def test_dobles_cuatro_pasos_sin_repetidos(self):
+        """Con 1-1 y dos fichas juntas hay 3 resultados distintos (0+4, 1+3, 2+2)."""
+        self._poner(0, "blanco", 2)
+        plays = self._plays("blanco", [1, 1, 1, 1])
+        self.assertEqual(len(plays), 3)
+        self.assertTrue(all(len(p) == 4 for p in plays))
+
+    def test_regla_maxima_cantidad_de_dados(self):
+        """Si un orden permite usar ambos dados, no valen jugadas de un solo dado."""
+        self._poner(0, "blanco")
+        self._poner(6, "negro", 2)  # bloquea 0->6
+        plays = self._plays("blanco", [1, 6])
+        self.assertEqual(plays, [((0, 1, 1), (1, 7, 6))])
+
+    def test_regla_dado_mayor(self):
+        """Si sólo entra un dado, hay que jugar el mayor."""
+        self._poner(0, "blanco")
+        self._poner(11, "negro", 2)  # bloquea 0->5->11 y 0->6->11
+        plays = self._plays("blanco", [5, 6])
+        self.assertEqual(plays, [((0, 6, 6),)])
+
+    def test_sin_jugadas_devuelve_lista_vacia(self):
+        """Con la entrada desde barra bloqueada no hay jugadas."""
+        self.board.send_to_bar(Checker("blanco"))
+        self._poner(21, "negro", 2)
+        self.assertEqual(self._plays("blanco", [3, 3, 3, 3]), [])
+
+    def test_pasos_coinciden_con_legal_moves(self):
+        """step_moves() devuelve lo mismo que BackgammonGame.legal_moves()."""
+        self.board.setup_standard()
+        game = BackgammonGame(self.board, Player("B", "blanco"), Player("N", "negro"), Dice())
+        with patch.object(Dice, "roll", return_value=[6, 4]):
+            game.roll_dice()
+        self.assertEqual(
+            sorted(step_moves(self.board.to_array(), "blanco", [6, 4])),
+            sorted(game.legal_moves()),
+        )
+
+    def test_apply_step_come_y_manda_a_barra(self):
+        """apply_step() sobre un blot rival lo manda a la barra."""
+        self._poner(0, "blanco")
+        self._poner(3, "negro")
+        pos = apply_step(self.board.to_array(), "blanco", (0, 3, 3))
+        self.assertEqual(pos[3], 1)
+        self.assertEqual(pos[25], 1)
+
+    def test_legal_plays_desde_game(self):
+        """BackgammonGame.legal_plays() usa los dados activos y el color del turno."""
+        self.board.setup_standard()
+        game = BackgammonGame(self.board, Player("B", "blanco"), Player("N", "negro"), Dice())
+        self.assertEqual(game.legal_plays(), [])
+        with patch.object(Dice, "roll", return_value=[3, 1]):
+            game.roll_dice()
+        plays = game.legal_plays()
+        self.assertGreater(len(plays), 0)
+        finales = set()
+        for play in plays:
+            pos = self.board.to_array()
+            for step in play:
+                pos = apply_step(pos, "blanco", step)
+            finales.add(tuple(pos))
+        self.assertEqual(len(finales), len(plays))
+
+
+if __name__ == "__main__":
+    unittest.main()
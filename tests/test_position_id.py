@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from core import position_id as pid
+from core.board import Board
+from core.checker import Checker
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.player import Player
+
+
+class TestPositionId(unittest.TestCase):
+    """
+    Pruebas del position ID / match ID compactos (core/position_id.py).
+    Se compara contra el ID conocido de gnubg y se hacen idas y vueltas en partidas al azar.
+    """
+
+    def _inicial(self, cls=Board):
+        b = cls()
+        b.setup_standard()
+        return b
+
+    def _partidas(self, n=30, seed=3):
+        """Genera estados de partidas random (con barra y retiradas)."""
+        rng = random.Random(seed)
+        board = self._inicial(CompactBoard)
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), Dice())
+        for _ in range(n):
+            if game.get_winner():
+                break
+            game.restore_turn(game.get_current_player().get_color(),
+                              [rng.randint(1, 6), rng.randint(1, 6)])
+            yield game
+            plays = game.legal_plays()
+            if plays:
+                game.apply_play(rng.choice(plays))
+            else:
+                game.end_turn()
+
+    def test_posicion_inicial_igual_que_gnubg(self):
+        """La posición inicial da el ID de gnubg y ocupa 10 bytes."""
+        self.assertEqual(pid.position_id(self._inicial()), "4HPwATDgc/ABMA")
+        self.assertEqual(pid.position_id(self._inicial(CompactBoard)), "4HPwATDgc/ABMA")
+        self.assertEqual(len(pid.position_key(self._inicial())), pid.KEY_BYTES)
+
+    def test_ida_y_vuelta(self):
+        """Decodificar la clave devuelve la misma posición (barra y retiradas incluidas)."""
+        for game in self._partidas():
+            cells = game.get_board().to_array()
+            key = pid.position_key(game.get_board())
+            for cls in (Board, CompactBoard):
+                b = pid.board_from_key(key, cls)
+                self.assertEqual(b.to_array(), cells)
+                self.assertEqual(b.pip_count("negro"), game.get_board().pip_count("negro"))
+            texto = pid.position_id(game.get_board())
+            self.assertEqual(pid.board_from_position_id(texto).to_array(), cells)
+
+    def test_claves_distintas_para_posiciones_distintas(self):
+        """Mover una ficha cambia la clave."""
+        a = self._inicial()
+        b = self._inicial()
+        b.move_checker(0, 1, b.get_point(0)[-1])
+        self.assertNotEqual(pid.position_key(a), pid.position_key(b))
+
+    def test_demasiadas_fichas(self):
+        """Con más de 15 fichas de un color no hay clave."""
+        b = self._inicial()
+        b.add_checker(20, Checker("blanco"))
+        with self.assertRaises(ValueError):
+            pid.position_key(b)
+
+    def test_textos_invalidos(self):
+        """IDs con largo o caracteres incorrectos levantan ValueError."""
+        for malo in ("", "abc", "4HPwATDgc/ABM!", "4HPwATDgc/ABMAAA"):
+            with self.assertRaises(ValueError):
+                pid.board_from_position_id(malo)
+        with self.assertRaises(ValueError):
+            pid.decode_cells(b"\xff" * pid.KEY_BYTES)
+
+    def test_match_id(self):
+        """Color al turno y dados restantes van y vuelven, respetando el orden."""
+        for color in ("blanco", "negro"):
+            for dice in ([], [3], [5, 2], [2, 5], [4, 4, 4], [6, 6, 6, 6], [1, 1]):
+                self.assertEqual(pid.parse_match_id(pid.match_id(color, dice)), (color, dice))
+        with self.assertRaises(ValueError):
+            pid.encode_match("blanco", [1, 2, 3])
+        with self.assertRaises(ValueError):
+            pid.encode_match("rojo", [])
+
+    def test_estado_completo(self):
+        """state_key tiene 12 bytes y game_from_state_id recupera tablero, turno y dados."""
+        for game in self._partidas(n=12, seed=8):
+            self.assertEqual(len(pid.state_key(game)), 12)
+            copia = pid.game_from_state_id(pid.state_id(game))
+            self.assertEqual(copia.get_board().to_array(), game.get_board().to_array())
+            self.assertEqual(copia.get_current_player().get_color(),
+                             game.get_current_player().get_color())
+            self.assertEqual(copia.get_rolled_values(), game.get_rolled_values())
+            self.assertEqual(copia.get_board().get_hash(), game.get_board().get_hash())
+
+
+if __name__ == "__main__":
+    unittest.main()
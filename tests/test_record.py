@@ -0,0 +1,133 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from ai.simulate import simulate
+from core import record
+from core.board import Board
+from core.checker import Checker
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+from core.position_id import position_key
+from core.record import GameWriter, read_records, read_games, START, ROLL, MOVE, END_TURN, END
+
+
+class TestRecord(unittest.TestCase):
+    """
+    Pruebas del registro binario de partidas (core/record.py).
+    Se graba en memoria (BytesIO) o en un directorio temporal.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _game(self, rolls, board=None):
+        if board is None:
+            board = Board()
+            board.setup_standard()
+        return BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), ScriptedDice(rolls))
+
+    def _grabar(self, game, acciones):
+        buf = io.BytesIO()
+        writer = GameWriter(buf)
+        writer.attach(game)
+        for accion in acciones:
+            accion()
+        writer.close()
+        buf.seek(0)
+        return list(read_records(buf))
+
+    def test_graba_tiradas_movimientos_y_pases(self):
+        """roll_dice(), move() y el pase de turno automático quedan en el registro."""
+        game = self._game([(3, 1)])
+        inicial = position_key(game.get_board())
+        recs = self._grabar(game, [
+            game.roll_dice,
+            lambda: game.move(0, 3, "blanco"),
+            lambda: game.move(16, 17, "blanco"),
+        ])
+        self.assertEqual([r.kind for r in recs], [START, ROLL, MOVE, MOVE, END_TURN])
+        self.assertEqual(recs[0].key, inicial)
+        self.assertEqual(recs[1].dice, (3, 1))
+        self.assertEqual(recs[2].move, (0, 3, 3))
+        self.assertEqual(recs[3].move, (16, 17, 1))
+        self.assertEqual(recs[4].color, "blanco")
+
+    def test_flags_comer_barra_y_bear_off(self):
+        """Se marcan las comidas, las entradas desde la barra y las retiradas."""
+        b = Board()
+        b.send_to_bar(Checker("blanco"))
+        b.add_checker(21, Checker("negro"))
+        b.add_checker(20, Checker("blanco"))
+        game = self._game([(3, 4)], board=b)
+        recs = self._grabar(game, [
+            game.roll_dice,
+            lambda: game.move(-1, 21, "blanco"),
+            lambda: game.move(20, 24, "blanco"),
+        ])
+        entrada, salida = recs[2], recs[3]
+        self.assertEqual(entrada.flags, record.HIT | record.FROM_BAR)
+        self.assertEqual(salida.move, (20, 24, 4))
+        self.assertEqual(salida.flags, record.BEAR_OFF)
+
+    def test_apply_no_se_graba(self):
+        """apply()/undo() de la búsqueda no dejan registros."""
+        game = self._game([(3, 1)])
+        recs = self._grabar(game, [
+            game.roll_dice,
+            lambda: game.undo_play(game.apply_play(game.legal_plays()[0])),
+        ])
+        self.assertEqual([r.kind for r in recs], [START, ROLL])
+
+    def test_append_only_y_cabecera(self):
+        """Reabrir el archivo agrega al final; una cabecera ajena levanta ValueError."""
+        path = os.path.join(self.tmp, "p.bgr")
+        for _ in range(2):
+            with GameWriter(path) as w:
+                w.start_game(self._game([]))
+                w.end_game("blanco", 2)
+        games = list(read_games(path))
+        self.assertEqual(len(games), 2)
+        self.assertEqual(games[1][-1], record.Record(END, "blanco", flags=2))
+        self.assertEqual(os.path.getsize(path), record.RECORD_SIZE * 5)
+
+        malo = os.path.join(self.tmp, "malo.bgr")
+        with open(malo, "wb") as f:
+            f.write(b"x" * 24)
+        with self.assertRaises(ValueError):
+            list(read_records(malo))
+        with self.assertRaises(ValueError):
+            GameWriter(malo)
+
+    def test_archivo_truncado(self):
+        """Un registro cortado al final del archivo levanta ValueError."""
+        path = os.path.join(self.tmp, "t.bgr")
+        with GameWriter(path) as w:
+            w.start_game(self._game([]))
+        with open(path, "ab") as f:
+            f.write(b"\x02\x00\x03")
+        with self.assertRaises(ValueError):
+            list(read_records(path))
+
+    def test_simulador_graba_partidas_completas(self):
+        """simulate(record_dir=...) deja una partida por juego, de START a END."""
+        results = list(simulate(3, "random", "greedy", workers=1, seed=4, chunk_size=2,
+                                record_dir=self.tmp))
+        games = []
+        for name in sorted(os.listdir(self.tmp)):
+            games.extend(read_games(os.path.join(self.tmp, name)))
+        self.assertEqual(len(games), 3)
+        for g, r in zip(games, sorted(results)):
+            self.assertEqual(g[0].kind, START)
+            self.assertEqual((g[-1].kind, g[-1].color), (END, r.winner))
+            self.assertEqual(sum(rec.kind == ROLL for rec in g), r.plies)
+
+
+if __name__ == "__main__":
+    unittest.main()
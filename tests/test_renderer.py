@@ -0,0 +1,118 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from core.board import Board
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+
+
+@unittest.skipIf(pygame is None, "pygame no está instalado")
+class TestBoardRenderer(unittest.TestCase):
+    """
+    Pruebas del renderer con el driver SDL 'dummy': fondo estático cacheado
+    y repintado sólo de las regiones que cambiaron.
+    """
+
+    def setUp(self):
+        from pygame_ui.constants import WIDTH, HEIGHT, FONT_SIZE
+        from pygame_ui.renderer import BoardRenderer
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.font = pygame.font.SysFont(None, FONT_SIZE)
+        self.make = lambda: BoardRenderer(self.screen, self.font)
+        board = Board()
+        board.setup_standard()
+        self.game = BackgammonGame(board, Player("Blanco", "blanco"), Player("Negro", "negro"),
+                                   ScriptedDice([(3, 1)]))
+
+    def _pixels(self):
+        return pygame.image.tobytes(self.screen, "RGB")
+
+    def test_primer_frame_completo_y_despues_nada(self):
+        """El primer render actualiza la pantalla entera; sin cambios no hay regiones sucias."""
+        r = self.make()
+        self.assertEqual(r.render(self.game), [self.screen.get_rect()])
+        self.assertEqual(r.render(self.game), [])
+        r.invalidate()
+        self.assertEqual(r.render(self.game), [self.screen.get_rect()])
+
+    def test_solo_regiones_cambiadas(self):
+        """Un movimiento repinta los puntos tocados y la barra (dados), no todo."""
+        r = self.make()
+        r.render(self.game)
+        self.game.roll_dice()
+        dirty = r.render(self.game)
+        self.assertEqual(len(dirty), 1)
+        self.assertTrue(dirty[0].contains(r.hitmap[-1]))
+        self.game.move(0, 3, "blanco")
+        dirty = r.render(self.game)
+        self.assertIn(r.hitmap[0], dirty)
+        self.assertIn(r.hitmap[3], dirty)
+        self.assertNotIn(r.hitmap[12], dirty)
+
+    def test_incremental_igual_a_completo(self):
+        """Lo dibujado por regiones queda igual, píxel a píxel, que un render completo."""
+        r = self.make()
+        r.render(self.game)
+        self.game.roll_dice()
+        r.render(self.game, show_help=True)
+        self.game.move(0, 3, "blanco")
+        legal = self.game.legal_moves()
+        r.render(self.game, "Error de prueba", selected_from=11, legal_moves=legal)
+        incremental = self._pixels()
+        self.make().render(self.game, "Error de prueba", selected_from=11, legal_moves=legal)
+        self.assertEqual(incremental, self._pixels())
+
+
+@unittest.skipIf(pygame is None, "pygame no está instalado")
+class TestRendererResources(unittest.TestCase):
+    """
+    Pruebas de la caché de fuentes, textos y sprites (pygame_ui/resources.py).
+    """
+
+    def setUp(self):
+        from pygame_ui.resources import RendererResources
+        pygame.init()
+        self.res = RendererResources(text_cache_size=2)
+
+    def test_fuente_una_por_tamano(self):
+        self.assertIs(self.res.font(20), self.res.font(20))
+        self.assertIsNot(self.res.font(20), self.res.font(30))
+
+    def test_texto_memoizado(self):
+        """El mismo (texto, color, tamaño) devuelve el mismo Surface."""
+        a = self.res.text("12", (0, 0, 0))
+        self.assertIs(self.res.text("12", (0, 0, 0)), a)
+        self.assertIsNot(self.res.text("12", (255, 0, 0)), a)
+        self.assertEqual((self.res.hits, self.res.misses), (1, 2))
+
+    def test_desalojo_lru(self):
+        """Al pasar el tamaño se descarta el texto usado hace más tiempo."""
+        a = self.res.text("a", (0, 0, 0))
+        b = self.res.text("b", (0, 0, 0))
+        self.res.text("a", (0, 0, 0))          # 'a' pasa a ser el más reciente
+        self.res.text("c", (0, 0, 0))          # desaloja 'b'
+        self.assertIs(self.res.text("a", (0, 0, 0)), a)
+        self.assertIsNot(self.res.text("b", (0, 0, 0)), b)
+
+    def test_atlas_fichas_y_dados(self):
+        """Las fichas y las caras del dado salen del atlas con sus colores."""
+        from pygame_ui.constants import WHITE, BLACK
+        surf = pygame.Surface((100, 100))
+        self.res.blit_chip(surf, "blanco", (20, 20))
+        self.res.blit_chip(surf, "negro", (70, 20))
+        self.assertEqual(surf.get_at((20, 20))[:3], WHITE)
+        self.assertEqual(surf.get_at((70, 20))[:3], BLACK)
+        self.res.blit_die(surf, 1, (0, 50))
+        self.assertEqual(surf.get_at((23, 73))[:3], (30, 30, 30))     # pip central
+
+
+if __name__ == "__main__":
+    unittest.main()
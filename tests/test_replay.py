@@ -0,0 +1,109 @@
+import io
+import random
+import unittest
+
+from core.board import Board
+from core.dice import ScriptedDice
+from core.game import BackgammonGame
+from core.player import Player
+from core.record import GameWriter, read_games, ROLL, END_TURN
+from core.replay import Replay
+
+
+class _CapturingWriter(GameWriter):
+    """Graba y además guarda el tablero/turno/dados justo después de cada registro."""
+
+    def __init__(self, buf, game):
+        super().__init__(buf)
+        self.game = game
+        self.states = []
+
+    def _write(self, kind, color, data=b""):
+        super()._write(kind, color, data)
+        g = self.game
+        self.states.append((g.get_board().to_array(), g.get_current_player().get_color(),
+                            g.get_rolled_values()))
+
+
+class TestReplay(unittest.TestCase):
+    """
+    Pruebas del replay con checkpoints (core/replay.py).
+    Se juega una partida random con move() grabando, y se compara cada paso
+    reconstruido con el estado que tenía la partida en vivo.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(12)
+        rolls = [(rng.randint(1, 6), rng.randint(1, 6)) for _ in range(400)]
+        board = Board()
+        board.setup_standard()
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), ScriptedDice(rolls))
+        buf = io.BytesIO()
+        writer = _CapturingWriter(buf, game)
+        writer.attach(game)
+        writer.states = [(board.to_array(), "blanco", [])]  # paso 0 (START)
+        while not game.get_winner():
+            game.roll_dice()
+            while game.get_rolled_values() and game.can_play():
+                game.move(*rng.choice(game.legal_moves())[:2], game.get_current_player().get_color())
+            if game.get_rolled_values():
+                game.end_turn()
+        writer.end_game(game.get_winner())
+        writer.close()
+        buf.seek(0)
+        cls.records = next(read_games(buf))
+        cls.states = writer.states[:-1]  # sin el END
+        cls.winner = game.get_winner()
+
+    def test_todos_los_pasos_coinciden(self):
+        """Con distintos K, cada paso tiene el mismo tablero que la partida en vivo."""
+        for k in (1, 5, 16, 10_000):
+            replay = Replay(self.records, checkpoint_every=k)
+            self.assertEqual(len(replay) + 1, len(self.states))
+            for step, (cells, color, dice) in enumerate(self.states):
+                game = replay.game_at(step)
+                self.assertEqual(game.get_board().to_array(), cells, (k, step))
+                rec = replay.step_record(step) if step else None
+                if rec is None or rec.kind == ROLL:
+                    self.assertEqual(game.get_current_player().get_color(), color)
+                    self.assertEqual(game.get_rolled_values(), dice)
+                elif rec.kind == END_TURN:  # el hook graba antes de pasar el turno
+                    self.assertNotEqual(game.get_current_player().get_color(), rec.color)
+                    self.assertEqual(game.get_rolled_values(), [])
+
+    def test_final_y_resultado(self):
+        """El último paso tiene ganador y el registro END queda en result."""
+        replay = Replay(self.records)
+        self.assertEqual(replay.game_at(len(replay)).get_winner(), self.winner)
+        self.assertEqual(replay.result.color, self.winner)
+
+    def test_turnos(self):
+        """turn_step() apunta al paso anterior a cada tirada."""
+        replay = Replay(self.records)
+        self.assertGreater(replay.turn_count(), 2)
+        for t in range(replay.turn_count()):
+            self.assertEqual(replay.step_record(replay.turn_step(t) + 1).kind, ROLL)
+        with self.assertRaises(ValueError):
+            replay.turn_step(replay.turn_count())
+
+    def test_juegos_independientes(self):
+        """game_at() devuelve partidas nuevas: modificar una no cambia el replay."""
+        replay = Replay(self.records, checkpoint_every=4)
+        g = replay.game_at(0)
+        g.get_board().remove_checker(0)
+        self.assertEqual(replay.game_at(0).get_board().to_array(), self.states[0][0])
+
+    def test_errores(self):
+        """Pasos fuera de rango, K inválido o registros sin START levantan ValueError."""
+        replay = Replay(self.records)
+        with self.assertRaises(ValueError):
+            replay.game_at(len(replay) + 1)
+        with self.assertRaises(ValueError):
+            Replay(self.records, checkpoint_every=0)
+        with self.assertRaises(ValueError):
+            Replay(self.records[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from ai import bearoff
+from ai.bearoff import BearoffDB
+from ai.rollout import rollout, _FirstRollDice, _Stratified, STRATA
+from core.board import Board
+from core.dice import ScriptedDice
+from core.checker import Checker
+
+
+class TestRollout(unittest.TestCase):
+    """
+    Pruebas del motor de rollouts (ai/rollout.py).
+    Se usan pocas pruebas (múltiplos de 36) y posiciones cortas para que sea rápido.
+    """
+
+    def _board(self, **puntos):
+        b = Board()
+        for clave, n in puntos.items():
+            color, idx = clave.split("_")
+            for _ in range(n):
+                b.add_checker(int(idx), Checker(color))
+        return b
+
+    def test_redondea_a_multiplos_de_36_y_es_reproducible(self):
+        """trials se lleva al múltiplo de 36 siguiente y la misma semilla da lo mismo."""
+        b = self._board(blanco_20=2, negro_10=2)
+        a = rollout(b, "blanco", "random", trials=40, seed=3, truncate=False)
+        c = rollout(b, "blanco", "random", trials=40, seed=3, truncate=False)
+        self.assertEqual(a.trials, 72)
+        self.assertEqual(a, c)
+        self.assertTrue(0.0 <= a.win <= 1.0)
+
+    def test_partida_ya_ganada_con_gammon(self):
+        """Si al turno ya no tiene fichas y el rival no sacó ninguna, vale un gammon seguro."""
+        r = rollout(self._board(negro_10=1), "blanco", "random", trials=72, truncate=False)
+        self.assertEqual((r.equity, r.win, r.gammon, r.backgammon), (2.0, 1.0, 1.0, 0.0))
+        self.assertEqual(r.equity_ci, 0.0)
+
+    def test_corte_temprano(self):
+        """Con un objetivo de intervalo amplio se frena tras la segunda vuelta."""
+        b = self._board(blanco_20=2, negro_10=2)
+        r = rollout(b, "blanco", "random", trials=360, target_ci=10.0, truncate=False)
+        self.assertTrue(r.stopped_early)
+        self.assertEqual(r.trials, 2 * STRATA)
+
+    def test_truncado_con_base_de_bear_off(self):
+        """En carrera pura todas las pruebas se resuelven con la base y dan su probabilidad."""
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "bo3.bin")
+            bearoff.write(path, 3)
+            db = BearoffDB(path)
+            b = self._board(blanco_18=1, negro_0=1)  # blanco a 6 pips, negro a 1
+            r = rollout(b, "blanco", "greedy", trials=36, bearoff=db)
+            db.close()
+        finally:
+            shutil.rmtree(tmp)
+        self.assertEqual(r.truncated, 36)
+        self.assertAlmostEqual(r.win, 27 / 36, places=3)
+        self.assertAlmostEqual(r.equity, 2 * 27 / 36 - 1, places=3)
+
+    def test_primera_tirada_fija(self):
+        """La primera tirada es la del estrato; los dobles se juegan cuatro veces."""
+        dice = _FirstRollDice((3, 3), ScriptedDice([(2, 5)]))
+        self.assertEqual(dice.roll(), [3, 3, 3, 3])
+        self.assertEqual(dice.roll(), [2, 5])
+
+    def test_intervalo_estratificado(self):
+        """Sin varianza dentro de los estratos el intervalo es 0 aunque las medias difieran."""
+        m = _Stratified()
+        for h in range(STRATA):
+            for _ in range(2):
+                m.add(h, float(h % 2))
+        self.assertAlmostEqual(m.mean(), 0.5)
+        self.assertEqual(m.halfwidth(1.96), 0.0)
+
+    def test_color_invalido(self):
+        """to_move tiene que ser un color válido."""
+        with self.assertRaises(ValueError):
+            rollout(Board(), "rojo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from ai.search import ExpectimaxBot, ROLLS, score_positions, WIN_SCORE
+from ai.policies import make_policy
+from core.board import Board
+from core.checker import Checker
+from core.game import BackgammonGame
+from core.player import Player
+from core.plays import apply_step
+
+
+class FixedDice:
+    def __init__(self, values):
+        self.values = values
+
+    def roll(self):
+        return list(self.values)
+
+
+class TestSearch(unittest.TestCase):
+    """
+    Pruebas del bot expectimax (ai/search.py).
+    Se usan tiradas fijas para que la búsqueda sea determinística.
+    """
+
+    def _game(self, dice=(6, 1), board=None):
+        if board is None:
+            board = Board()
+            board.setup_standard()
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), FixedDice(dice))
+        game.roll_dice()
+        return game
+
+    def _after(self, game, play):
+        pos = list(game.get_board().to_array())
+        for step in play:
+            pos = apply_step(pos, "blanco", step)
+        return pos
+
+    def test_rolls_son_21_y_suman_uno(self):
+        """Hay 21 tiradas distintas; los dobles valen 1/36 y el resto 2/36."""
+        self.assertEqual(len(ROLLS), 21)
+        self.assertAlmostEqual(sum(w for _, w in ROLLS), 1.0)
+        dobles = [d for d, _ in ROLLS if len(d) == 4]
+        self.assertEqual(len(dobles), 6)
+
+    def test_depth1_elige_el_maximo(self):
+        """A 1-ply se elige la jugada con mayor puntaje entre todas las legales."""
+        game = self._game()
+        res = ExpectimaxBot(depth=1).analyze(game)
+        scores = score_positions([self._after(game, p) for p in game.legal_plays()], "blanco")
+        self.assertEqual(res.depth, 1)
+        self.assertAlmostEqual(res.score, max(scores))
+        self.assertIn(res.play, game.legal_plays())
+
+    def test_depth2_devuelve_jugada_legal_sin_tocar_el_juego(self):
+        """La búsqueda a 2-ply no modifica el tablero ni los dados."""
+        game = self._game()
+        antes = game.get_board().to_array().tobytes()
+        res = ExpectimaxBot(depth=2).analyze(game)
+        self.assertEqual(res.depth, 2)
+        self.assertIn(res.play, game.legal_plays())
+        self.assertGreaterEqual(res.searched, 1)
+        self.assertEqual(game.get_board().to_array().tobytes(), antes)
+        self.assertEqual(game.get_rolled_values(), [6, 1])
+
+    def test_anytime_con_presupuesto_minimo(self):
+        """Sin tiempo para el 2-ply, devuelve igual la mejor jugada a 1-ply."""
+        game = self._game()
+        res = ExpectimaxBot(depth=2, time_budget=0.0).analyze(game)
+        self.assertTrue(res.timed_out)
+        self.assertEqual(res.depth, 1)
+        self.assertEqual(res.play, ExpectimaxBot(depth=1).choose(game))
+
+    def test_sin_jugadas_devuelve_vacio(self):
+        """Si no hay jugadas legales, choose() devuelve ()."""
+        b = Board()
+        b.send_to_bar(Checker("blanco"))
+        for i in (18, 19):
+            for _ in range(2):
+                b.add_checker(i, Checker("negro"))
+        game = self._game(dice=(6, 5), board=b)
+        self.assertEqual(ExpectimaxBot().choose(game), ())
+
+    def test_victoria_vale_win_score(self):
+        """Una posición donde 'color' ya no tiene fichas puntúa WIN_SCORE."""
+        b = Board()
+        b.add_checker(3, Checker("negro"))
+        self.assertEqual(score_positions([list(b.to_array())], "blanco"), [WIN_SCORE])
+        self.assertEqual(score_positions([list(b.to_array())], "negro"), [-WIN_SCORE])
+
+    def test_profundidad_invalida(self):
+        """Sólo se aceptan profundidades 1 y 2."""
+        with self.assertRaises(ValueError):
+            ExpectimaxBot(depth=3)
+
+    def test_registrado_como_politica(self):
+        """make_policy('expectimax1') construye el bot y juega como cualquier política."""
+        bot = make_policy("expectimax1", random.Random(0))
+        self.assertIsInstance(bot, ExpectimaxBot)
+        game = self._game()
+        self.assertIn(bot.choose(game), game.legal_plays())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import asyncio
+import unittest
+
+from core.dice import ScriptedDice
+from server import GameServer, Session
+from server.loadgen import percentile, read_response, run_load, _next_command
+
+
+class TestSession(unittest.TestCase):
+    """
+    Pruebas de Session: la CLI corriendo comandos contra un buffer propio.
+    """
+
+    def test_ejecuta_comandos_de_la_cli(self):
+        """'tirar' y 'mover' responden lo mismo que en la CLI, sin volcar el tablero."""
+        s = Session(1, ScriptedDice([(5, 1)]))
+        ok, text = s.execute("tirar")
+        self.assertTrue(ok)
+        self.assertIn("Dados tirados: [5, 1]", text)
+        self.assertNotIn("Barra:", text)
+        ok, text = s.execute("mover 11 16")
+        self.assertTrue(ok)
+        self.assertIn("Movida blanco: 11 -> 16", text)
+        ok, text = s.execute("tablero")
+        self.assertIn("Barra:", text)
+
+    def test_reiniciar_conserva_los_dados(self):
+        """'reiniciar' sigue usando los dados de la sesión; el bot no se crea."""
+        s = Session(1, ScriptedDice([(3, 1), (6, 6)]))
+        s.execute("tirar")
+        s.execute("reiniciar")
+        self.assertIsInstance(s.cli.dice, ScriptedDice)
+        ok, text = s.execute("tirar")
+        self.assertTrue(ok)
+        self.assertIn("Dados tirados: [6, 6, 6, 6]", text)
+        self.assertIsNone(s.cli.bot)
+
+    def test_rechaza_comandos_fuera_del_protocolo(self):
+        """'bot' y 'stats' no se aceptan en el servidor; un movimiento inválido es error."""
+        s = Session(1, ScriptedDice([(5, 1)]))
+        self.assertFalse(s.execute("bot")[0])
+        self.assertFalse(s.execute("stats")[0])
+        s.execute("tirar")
+        ok, text = s.execute("mover 0 4")
+        self.assertFalse(ok)
+        self.assertIn("no coincide con la tirada", text)
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Pruebas del servidor TCP: protocolo, límite de sesiones e inactividad.
+    """
+
+    async def _server(self, **kw):
+        kw.setdefault("dice_factory", lambda: ScriptedDice([(5, 1), (6, 6)]))
+        server = GameServer(port=0, **kw)
+        await server.start()
+        self.addAsyncCleanup(server.close)
+        return server
+
+    async def _connect(self, server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        self.addCleanup(writer.close)
+        return reader, writer
+
+    async def _cmd(self, reader, writer, line):
+        writer.write((line + "\n").encode())
+        await writer.drain()
+        return await read_response(reader)
+
+    async def test_protocolo(self):
+        """Saludo, comandos con 'ok'/'error' al final y 'salir' cierra la conexión."""
+        server = await self._server()
+        reader, writer = await self._connect(server)
+        self.assertEqual(await read_response(reader), (True, ["sesion 1"]))
+        ok, lines = await self._cmd(reader, writer, "tirar")
+        self.assertTrue(ok)
+        self.assertIn("Dados tirados: [5, 1]", lines)
+        ok, lines = await self._cmd(reader, writer, "jugadas")
+        self.assertIn("Movimientos legales:", lines)
+        ok, _ = await self._cmd(reader, writer, "mover 0 4")
+        self.assertFalse(ok)
+        self.assertEqual(server.snapshot()["sessions"], 1)
+        ok, lines = await self._cmd(reader, writer, "salir")
+        self.assertTrue(ok)
+        self.assertEqual(await reader.read(), b"")
+        await asyncio.sleep(0)
+        self.assertEqual(server.snapshot()["sessions"], 0)
+        self.assertEqual(server.commands, 3)
+
+    async def test_sesiones_independientes(self):
+        """Cada conexión tiene su propia partida."""
+        server = await self._server()
+        r1, w1 = await self._connect(server)
+        r2, w2 = await self._connect(server)
+        await read_response(r1)
+        await read_response(r2)
+        await self._cmd(r1, w1, "tirar")
+        await self._cmd(r1, w1, "mover 11 16")
+        _, lines = await self._cmd(r2, w2, "turno")
+        self.assertEqual(lines, ["Turno de: blanco"])
+        _, lines = await self._cmd(r2, w2, "tirar")
+        self.assertIn("Dados disponibles: [5, 1]", lines)
+
+    async def test_limite_de_sesiones(self):
+        """Con el servidor lleno, la conexión nueva recibe un error y se corta."""
+        server = await self._server(max_sessions=1)
+        r1, _ = await self._connect(server)
+        await read_response(r1)
+        r2, _ = await self._connect(server)
+        self.assertEqual(await read_response(r2), (False, ["error: servidor lleno"]))
+        self.assertEqual(await r2.read(), b"")
+        self.assertEqual(server.rejected, 1)
+
+    async def test_desaloja_sesiones_inactivas(self):
+        """Una sesión que no manda nada en idle_timeout se cierra."""
+        server = await self._server(idle_timeout=0.05)
+        reader, _ = await self._connect(server)
+        await read_response(reader)
+        rest = await asyncio.wait_for(reader.read(), 2)
+        self.assertIn(b"inactividad", rest)
+        await asyncio.sleep(0.01)
+        self.assertEqual(server.evicted, 1)
+        self.assertEqual(server.snapshot()["sessions"], 0)
+
+    async def test_linea_demasiado_larga(self):
+        """Una línea más larga que max_line es error y corta la sesión."""
+        server = await self._server(max_line=64)
+        reader, writer = await self._connect(server)
+        await read_response(reader)
+        writer.write(b"x" * 200 + b"\n")
+        ok, lines = await read_response(reader)
+        self.assertFalse(ok)
+        self.assertIn("Línea demasiado larga.", lines)
+
+    async def test_generador_de_carga(self):
+        """run_load juega partidas reales y reporta percentiles."""
+        server = await self._server(dice_factory=lambda: ScriptedDice([(3, 1), (6, 5)] * 40))
+        r = await run_load("127.0.0.1", server.port, clients=5, commands=30)
+        self.assertEqual(r["failed_clients"], 0)
+        self.assertEqual(r["commands"], 150)
+        self.assertEqual(r["errors"], 0)
+        self.assertLessEqual(r["p50_ms"], r["p99_ms"])
+        self.assertLessEqual(r["p99_ms"], r["max_ms"])
+        self.assertEqual(server.accepted, 5)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            GameServer(max_sessions=0)
+        with self.assertRaises(ValueError):
+            GameServer(idle_timeout=0)
+
+
+class TestLoadgen(unittest.TestCase):
+    """Pruebas de las funciones auxiliares del generador de carga."""
+
+    def test_percentil(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_siguiente_comando(self):
+        """Tira sin dados, pide jugadas con dados y mueve la primera."""
+        self.assertEqual(_next_command("tirar", ["Dados disponibles: [3, 1]"]), "jugadas")
+        self.assertEqual(_next_command("mover", ["Dados disponibles: (sin tirar)"]), "tirar")
+        self.assertEqual(_next_command("jugadas", ["Movimientos legales:", "   1) barra -> 20  usando dado 4"]),
+                         "mover -1 20")
+        self.assertEqual(_next_command("jugadas", ["   1) 21 -> salida(24)  usando dado 3"]), "mover 21 24")
+        self.assertEqual(_next_command("mover", ["¡Blanco ganó la partida! 🎉"]), "reiniciar")
+
+
+if __name__ == '__main__':
+    unittest.main()
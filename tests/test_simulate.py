@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from ai.policies import RandomPolicy, GreedyPolicy, make_policy, evaluate
+from ai.simulate import play_game, simulate, _RngDice
+from core.board import Board
+from core.game import BackgammonGame
+from core.player import Player
+
+
+class TestSimulate(unittest.TestCase):
+    """
+    Pruebas del simulador headless y de las políticas básicas.
+    Se usan pocas partidas y semillas fijas para que sea rápido y reproducible.
+    """
+
+    def test_play_game_termina_con_ganador(self):
+        """Una partida random vs random termina con ganador y al menos un turno por color."""
+        rng = random.Random(5)
+        r = play_game(RandomPolicy(rng), RandomPolicy(rng), _RngDice(rng), game_id=3)
+        self.assertIn(r.winner, ("blanco", "negro"))
+        self.assertGreater(r.plies, 2)
+        self.assertEqual(r.game_id, 3)
+        if r.backgammon:
+            self.assertTrue(r.gammon)
+
+    def test_misma_semilla_mismos_resultados(self):
+        """Con la misma semilla cada game_id se repite igual (sin contar el tiempo)."""
+        a = sorted(simulate(6, "random", "greedy", workers=1, seed=9, chunk_size=4))
+        b = sorted(simulate(6, "random", "greedy", workers=1, seed=9, chunk_size=2))
+        self.assertEqual([r[:5] for r in a], [r[:5] for r in b])
+        self.assertEqual([r.game_id for r in a], list(range(6)))
+
+    def test_simulate_con_procesos(self):
+        """Con un pool de procesos llegan todos los resultados y coinciden con workers=1."""
+        local = {r.game_id: r[:5] for r in simulate(4, workers=1, seed=2, chunk_size=2)}
+        remoto = {r.game_id: r[:5] for r in simulate(4, workers=2, seed=2, chunk_size=2)}
+        self.assertEqual(local, remoto)
+
+    def test_make_policy_nombre_invalido(self):
+        """Un nombre de política desconocido levanta ValueError."""
+        with self.assertRaises(ValueError):
+            make_policy("nadie")
+        with self.assertRaises(ValueError):
+            next(simulate(1, white="nadie", workers=1))
+
+    def test_greedy_elige_la_mejor_evaluacion(self):
+        """GreedyPolicy devuelve una jugada con la evaluación máxima entre las legales."""
+        board = Board()
+        board.setup_standard()
+        rng = random.Random(1)
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), _RngDice(rng))
+        game.roll_dice()
+        elegida = GreedyPolicy(rng).choose(game)
+
+        def score(play):
+            tokens = game.apply_play(play)
+            s = evaluate(board, "blanco")
+            game.undo_play(tokens)
+            return s
+
+        self.assertEqual(score(elegida), max(score(p) for p in game.legal_plays()))
+
+
+if __name__ == "__main__":
+    unittest.main()
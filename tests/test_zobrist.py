@@ -0,0 +1,106 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.checker import Checker
+from core.player import Player
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.zobrist import hash_cells
+
+
+class TestZobrist(unittest.TestCase):
+    """
+    Pruebas del hash Zobrist incremental de Board / CompactBoard.
+    La referencia siempre es hash_cells() recalculado desde to_array().
+    """
+
+    def _full(self, board):
+        return hash_cells(board.to_array(), board.get_side_to_move())
+
+    def test_tablero_vacio_hashea_cero(self):
+        """Tablero vacío con blanco al turno: hash 0."""
+        self.assertEqual(Board().get_hash(), 0)
+        self.assertEqual(CompactBoard().get_hash(), 0)
+
+    def test_setup_standard_coincide_con_recalculo(self):
+        """setup_standard() deja el hash igual al cálculo completo, en ambas implementaciones."""
+        for cls in (Board, CompactBoard):
+            b = cls()
+            b.setup_standard()
+            self.assertNotEqual(b.get_hash(), 0)
+            self.assertEqual(b.get_hash(), self._full(b))
+        a, c = Board(), CompactBoard()
+        a.setup_standard()
+        c.setup_standard()
+        self.assertEqual(a.get_hash(), c.get_hash())
+
+    def test_mutaciones_actualizan_hash(self):
+        """add/remove/barra/bear_off/move_checker mantienen el hash incremental correcto."""
+        for cls in (Board, CompactBoard):
+            b = cls()
+            ficha = Checker("blanco")
+            b.add_checker(3, ficha)
+            b.add_checker(3, Checker("blanco"))
+            b.move_checker(3, 7, ficha)
+            b.send_to_bar(Checker("negro"))
+            b.add_checker(20, Checker("blanco"))
+            b.bear_off(20)
+            self.assertEqual(b.get_hash(), self._full(b))
+            b.pop_from_bar("negro")
+            b.remove_checker(7)
+            b.remove_checker(3)
+            self.assertEqual(b.get_hash(), self._full(b))
+
+    def test_transposicion_mismo_hash(self):
+        """Dos órdenes distintos que llegan a la misma posición dan el mismo hash."""
+        a, b = Board(), Board()
+        for board in (a, b):
+            board.add_checker(0, Checker("blanco"))
+            board.add_checker(0, Checker("blanco"))
+        a.move_checker(0, 3, a.get_point(0)[-1])
+        a.move_checker(0, 5, a.get_point(0)[-1])
+        b.move_checker(0, 5, b.get_point(0)[-1])
+        b.move_checker(0, 3, b.get_point(0)[-1])
+        self.assertEqual(a.get_hash(), b.get_hash())
+
+    def test_end_turn_cambia_color_al_turno(self):
+        """end_turn() alterna el color al turno dentro del hash."""
+        board = Board()
+        board.setup_standard()
+        game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), Dice())
+        inicial = board.get_hash()
+        game.end_turn()
+        self.assertEqual(board.get_side_to_move(), "negro")
+        self.assertNotEqual(board.get_hash(), inicial)
+        game.end_turn()
+        self.assertEqual(board.get_hash(), inicial)
+
+    def test_partidas_aleatorias_hash_consistente(self):
+        """Jugando partidas completas con move(), el hash incremental nunca diverge."""
+        rng = random.Random(7)
+        for cls in (Board, CompactBoard):
+            board = cls()
+            board.setup_standard()
+            game = BackgammonGame(board, Player("B", "blanco"), Player("N", "negro"), Dice())
+            for _ in range(200):
+                if game.get_winner():
+                    break
+                roll = [rng.randint(1, 6), rng.randint(1, 6)]
+                if roll[0] == roll[1]:
+                    roll = roll * 2
+                with patch.object(Dice, "roll", return_value=roll):
+                    game.roll_dice()
+                color = game.get_current_player().get_color()
+                while game.get_current_player().get_color() == color and game.can_play():
+                    start, end, _ = rng.choice(game.legal_moves())
+                    game.move(start, end, color)
+                    self.assertEqual(board.get_hash(), self._full(board))
+                if game.get_current_player().get_color() == color:
+                    game.end_turn()
+
+
+if __name__ == "__main__":
+    unittest.main()